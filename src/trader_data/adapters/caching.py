@@ -0,0 +1,142 @@
+"""Caching, request-coalescing decorator for provider adapters.
+
+`CachingProviderAdapter` wraps any `ProviderAdapter` and serves repeated
+`fetch_market_context` calls from a TTL + LRU cache. Concurrent calls for
+the same key while an upstream fetch is in flight wait for that fetch
+instead of issuing their own (single-flight), so a burst on one hot symbol
+costs one upstream call.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable
+
+from trader_data.adapters.provider_interface import ProviderAdapter, ProviderContext
+
+CACHE_SCOPES = ("shared", "tenant", "user")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: dict | None = None
+        self.error: BaseException | None = None
+
+
+class CachingProviderAdapter:
+    """TTL + LRU cache with single-flight coalescing around a provider adapter.
+
+    `scope` selects which part of `ProviderContext` is part of the cache key:
+    `"shared"` caches per symbol across tenants, `"tenant"` per symbol and
+    tenant, `"user"` per symbol, tenant and user. Failed fetches are not
+    cached; their error is raised to every coalesced caller. Callers receive
+    a shallow copy of the cached dict.
+    """
+
+    def __init__(
+        self,
+        upstream: ProviderAdapter,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        scope: str = "tenant",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1.")
+        if scope not in CACHE_SCOPES:
+            raise ValueError(f"scope must be one of: {', '.join(CACHE_SCOPES)}.")
+        self._upstream = upstream
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._scope = scope
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, ...], tuple[float, dict]] = OrderedDict()
+        self._flights: dict[tuple[str, ...], _Flight] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._coalesced, self._evictions)
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """Drop cached entries for `symbol`, or everything when omitted."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == symbol]:
+                del self._entries[key]
+
+    def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        key = self._key(symbol, context)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return dict(entry[1])
+                del self._entries[key]
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self._misses += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return dict(flight.result)  # type: ignore[arg-type]
+
+        try:
+            result = self._upstream.fetch_market_context(symbol=symbol, context=context)
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+            raise
+
+        flight.result = result
+        with self._lock:
+            del self._flights[key]
+            self._entries[key] = (self._clock() + self._ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        flight.done.set()
+        return dict(result)
+
+    def _key(self, symbol: str, context: ProviderContext) -> tuple[str, ...]:
+        if self._scope == "shared":
+            return (symbol,)
+        if self._scope == "tenant":
+            return (symbol, context.tenant_id)
+        return (symbol, context.tenant_id, context.user_id)
@@ -0,0 +1,110 @@
+"""Bounded concurrent fan-out over provider adapters.
+
+`fetch_many` refreshes market context for many symbols concurrently under a
+semaphore, applies a per-call timeout and returns whatever succeeded
+together with a typed error per failed symbol. `ThreadedAsyncAdapter`
+bridges existing synchronous adapters onto a thread pool so they can take
+part in the same fan-out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+import functools
+from typing import Iterable
+
+from trader_data.adapters.provider_interface import AsyncProviderAdapter, ProviderAdapter, ProviderContext
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT_SECONDS = 5.0
+
+
+class ProviderFetchError(Exception):
+    """A per-symbol provider failure reported by `fetch_many`."""
+
+    def __init__(self, symbol: str, message: str) -> None:
+        super().__init__(f"{symbol}: {message}")
+        self.symbol = symbol
+
+
+class ProviderTimeoutError(ProviderFetchError):
+    """The provider call did not finish within the per-call timeout."""
+
+
+class ProviderCallError(ProviderFetchError):
+    """The provider call raised; the original exception is `__cause__`."""
+
+
+@dataclass(frozen=True)
+class FetchManyResult:
+    results: dict[str, dict] = field(default_factory=dict)
+    errors: dict[str, ProviderFetchError] = field(default_factory=dict)
+
+
+class ThreadedAsyncAdapter:
+    """Runs a synchronous `ProviderAdapter` on a thread pool.
+
+    A timed-out call is abandoned by the awaiting coroutine, but the worker
+    thread runs the synchronous call to completion.
+    """
+
+    def __init__(self, adapter: ProviderAdapter, executor: Executor | None = None) -> None:
+        self._adapter = adapter
+        self._executor = executor
+
+    async def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._adapter.fetch_market_context, symbol=symbol, context=context)
+        return await loop.run_in_executor(self._executor, call)
+
+
+async def fetch_many(
+    adapter: AsyncProviderAdapter,
+    symbols: Iterable[str],
+    context: ProviderContext,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+) -> FetchManyResult:
+    """Fetch market context for `symbols` with at most `concurrency` calls in flight.
+
+    Results and errors are keyed by symbol in input order (duplicates are
+    fetched once). The timeout starts once a call holds a concurrency slot.
+    Cancelling `fetch_many` cancels every outstanding call before returning.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1.")
+    if timeout_seconds <= 0:
+        raise ValueError("timeout_seconds must be > 0.")
+
+    unique_symbols = list(dict.fromkeys(symbols))
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes: dict[str, dict | ProviderFetchError] = {}
+
+    async def fetch_one(symbol: str) -> None:
+        async with semaphore:
+            try:
+                outcomes[symbol] = await asyncio.wait_for(
+                    adapter.fetch_market_context(symbol=symbol, context=context), timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                outcomes[symbol] = ProviderTimeoutError(symbol, f"timed out after {timeout_seconds}s.")
+            except Exception as exc:
+                error = ProviderCallError(symbol, f"{type(exc).__name__}: {exc}")
+                error.__cause__ = exc
+                outcomes[symbol] = error
+
+    async with asyncio.TaskGroup() as group:
+        for symbol in unique_symbols:
+            group.create_task(fetch_one(symbol))
+
+    result = FetchManyResult()
+    for symbol in unique_symbols:
+        outcome = outcomes[symbol]
+        if isinstance(outcome, ProviderFetchError):
+            result.errors[symbol] = outcome
+        else:
+            result.results[symbol] = outcome
+    return result
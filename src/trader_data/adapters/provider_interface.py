@@ -21,3 +21,7 @@ class ProviderAdapter(Protocol):
     def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
         """Retrieve normalized market context for internal platform use."""
 
+
+class AsyncProviderAdapter(Protocol):
+    async def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        """Asynchronously retrieve normalized market context for internal platform use."""
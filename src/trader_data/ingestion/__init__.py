@@ -0,0 +1,37 @@
+"""Streaming ingestion entry points for canonical models."""
+
+from .ndjson import (
+    RECORD_MODELS,
+    ListQuarantineSink,
+    LoggingQuarantineSink,
+    NDJSONQuarantineSink,
+    QuarantinedRecord,
+    QuarantineSink,
+    ingest_ndjson,
+    iter_ndjson_lines,
+    rejection_reason,
+    validate_payload,
+)
+from .parallel import PayloadRejection, ValidationResult, ValidationTimings, validate_payloads
+from .router import ShardedIngestRouter, ShardStats, routing_key, shard_for
+
+__all__ = [
+    "RECORD_MODELS",
+    "ListQuarantineSink",
+    "LoggingQuarantineSink",
+    "NDJSONQuarantineSink",
+    "PayloadRejection",
+    "QuarantinedRecord",
+    "QuarantineSink",
+    "ShardStats",
+    "ShardedIngestRouter",
+    "ValidationResult",
+    "ValidationTimings",
+    "ingest_ndjson",
+    "iter_ndjson_lines",
+    "rejection_reason",
+    "routing_key",
+    "shard_for",
+    "validate_payload",
+    "validate_payloads",
+]
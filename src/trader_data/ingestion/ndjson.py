@@ -0,0 +1,257 @@
+"""Streaming NDJSON ingestion with a quarantine sink.
+
+Records are read in bounded chunks from files, pipes or gzip streams and
+validated one at a time, so memory stays flat regardless of input size.
+Records that fail validation are handed to a quarantine sink together with
+their position and the caller's request context instead of aborting the run.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import gzip
+import io
+import json
+import logging
+import os
+from typing import IO, Any, Iterator, Mapping, Protocol
+
+from trader_data.models import (
+    CandleV1,
+    ContextualCandleV1,
+    MarketSnapshotV1,
+    OrderBookSnapshotV1,
+    TickV1,
+)
+
+RECORD_MODELS: Mapping[str, Any] = {
+    "tick": TickV1,
+    "order_book_snapshot": OrderBookSnapshotV1,
+    "candle": CandleV1,
+    "contextual_candle": ContextualCandleV1,
+    "market_snapshot": MarketSnapshotV1,
+}
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MAX_LINE_BYTES = 16 << 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_RAW_PREVIEW_BYTES = 4096
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QuarantinedRecord:
+    """A rejected NDJSON line with the position it was read from."""
+
+    line_number: int
+    byte_offset: int
+    reason: str
+    raw: bytes
+    context: Mapping[str, str] = field(default_factory=dict)
+
+
+class QuarantineSink(Protocol):
+    def write(self, record: QuarantinedRecord) -> None:
+        """Persist or report a rejected record."""
+
+
+class ListQuarantineSink:
+    """Keeps rejected records in memory; intended for tests and small jobs."""
+
+    def __init__(self) -> None:
+        self.records: list[QuarantinedRecord] = []
+
+    def write(self, record: QuarantinedRecord) -> None:
+        self.records.append(record)
+
+
+class LoggingQuarantineSink:
+    """Logs each rejected record with its request context."""
+
+    def __init__(self, log: logging.Logger | None = None) -> None:
+        self._log = log or logger
+
+    def write(self, record: QuarantinedRecord) -> None:
+        self._log.warning(
+            "quarantined record at line %d (byte %d): %s",
+            record.line_number,
+            record.byte_offset,
+            record.reason,
+            extra={"quarantine_context": dict(record.context)},
+        )
+
+
+class NDJSONQuarantineSink:
+    """Appends rejected records as NDJSON to a text stream."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+
+    def write(self, record: QuarantinedRecord) -> None:
+        entry = {
+            "line_number": record.line_number,
+            "byte_offset": record.byte_offset,
+            "reason": record.reason,
+            "raw": record.raw.decode("utf-8", errors="replace"),
+            "context": dict(record.context),
+        }
+        self._stream.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def ingest_ndjson(
+    source: str | os.PathLike[str] | IO[bytes],
+    *,
+    model: Any = None,
+    record_type_field: str = "record_type",
+    quarantine: QuarantineSink | None = None,
+    context: Mapping[str, str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+) -> Iterator[Any]:
+    """Yield validated models from an NDJSON source.
+
+    With `model` set every record goes to `model.from_payload`; otherwise the
+    model is looked up in `RECORD_MODELS` by the record's `record_type_field`.
+    Gzip input is detected from its magic bytes. Byte offsets refer to the
+    decompressed stream.
+    """
+    sink = quarantine if quarantine is not None else LoggingQuarantineSink()
+    request_context = dict(context or {})
+
+    with _open_source(source) as stream:
+        for line_number, byte_offset, line in iter_ndjson_lines(
+            stream, chunk_size=chunk_size, max_line_bytes=max_line_bytes
+        ):
+            if line is None:
+                reason = f"line exceeds max_line_bytes ({max_line_bytes})."
+                sink.write(QuarantinedRecord(line_number, byte_offset, reason, b"", request_context))
+                continue
+            if not line.strip():
+                continue
+            try:
+                record = _parse_record(line, model, record_type_field)
+            except (KeyError, ValueError) as exc:
+                reason = rejection_reason(exc)
+            else:
+                yield record
+                continue
+            sink.write(QuarantinedRecord(line_number, byte_offset, reason, line[:_RAW_PREVIEW_BYTES], request_context))
+
+
+def iter_ndjson_lines(
+    stream: IO[bytes],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+) -> Iterator[tuple[int, int, bytes | None]]:
+    """Split a binary stream into `(line_number, byte_offset, line)` tuples.
+
+    At most `chunk_size + max_line_bytes` bytes are buffered. Lines longer
+    than `max_line_bytes` are skipped and reported with `line` set to None.
+    """
+    pending = b""
+    pending_offset = 0
+    line_number = 0
+    oversized = False
+    oversized_offset = 0
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer = pending + chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line_number += 1
+            offset = pending_offset + start
+            if oversized:
+                oversized = False
+                yield line_number, oversized_offset, None
+            elif end - start > max_line_bytes:
+                yield line_number, offset, None
+            else:
+                yield line_number, offset, buffer[start:end]
+            start = end + 1
+        pending = buffer[start:]
+        pending_offset += start
+        if len(pending) > max_line_bytes:
+            # Keep counting the oversized line but stop buffering it.
+            if not oversized:
+                oversized = True
+                oversized_offset = pending_offset
+            pending_offset += len(pending)
+            pending = b""
+
+    if pending or oversized:
+        line_number += 1
+        if oversized:
+            yield line_number, oversized_offset, None
+        else:
+            yield line_number, pending_offset, pending
+
+
+def _parse_record(line: bytes, model: Any, record_type_field: str) -> Any:
+    payload = json.loads(line)
+    if not isinstance(payload, dict):
+        raise ValueError("record must be a JSON object.")
+    return validate_payload(payload, model=model, record_type_field=record_type_field)
+
+
+def validate_payload(payload: Mapping[str, object], *, model: Any = None, record_type_field: str = "record_type") -> Any:
+    """Validate one payload with `model`, or the model named by its `record_type_field`."""
+    if model is None:
+        record_type = payload.get(record_type_field)
+        try:
+            model = RECORD_MODELS[record_type]  # type: ignore[index]
+        except (KeyError, TypeError):
+            raise ValueError(f"{record_type_field} must be one of: {', '.join(RECORD_MODELS)}.") from None
+    return model.from_payload(payload)
+
+
+def rejection_reason(exc: Exception) -> str:
+    """Render a validation failure the way quarantine reports expect."""
+    if isinstance(exc, KeyError):
+        return f"missing required field {exc}."
+    return str(exc)
+
+
+@contextmanager
+def _open_source(source: str | os.PathLike[str] | IO[bytes]) -> Iterator[IO[bytes]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as raw:
+            magic = raw.read(2)
+            raw.seek(0)
+            if magic == _GZIP_MAGIC:
+                with gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+                    yield stream
+            else:
+                yield raw
+        return
+
+    if hasattr(source, "peek"):
+        magic = source.peek(2)[:2]  # type: ignore[attr-defined]
+    elif source.seekable():
+        start = source.tell()
+        magic = source.read(2)
+        source.seek(start)
+    else:
+        # Raw, unbuffered streams: buffer them to look ahead, and detach afterwards so the
+        # caller's stream is not closed along with the wrapper.
+        buffered = io.BufferedReader(source)  # type: ignore[arg-type]
+        try:
+            with _open_source(buffered) as stream:
+                yield stream
+        finally:
+            buffered.detach()
+        return
+    if magic == _GZIP_MAGIC:
+        with gzip.GzipFile(fileobj=source, mode="rb") as stream:
+            yield stream
+    else:
+        yield source
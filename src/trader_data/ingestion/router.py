@@ -0,0 +1,273 @@
+"""Symbol-sharded ingestion across worker processes.
+
+`ShardedIngestRouter` hashes each payload's (exchange, symbol) with CRC-32
+to one of a fixed set of worker processes. A symbol always lands on the
+same shard and each shard consumes its queue in order, so per-symbol event
+order (which the monotonicity check in DATA_QUALITY.md relies on) survives
+parallel ingestion. Payloads travel in small batches over bounded queues:
+when a shard falls behind, `submit` blocks instead of buffering without
+limit.
+
+Workers validate with `validate_payload` and pass each batch's records and
+rejections to `handler(shard, records, rejections)`, which must be
+picklable (a module-level function or a `functools.partial` of one). A
+handler exception is logged and counted in `ShardStats.handler_errors`; the
+worker moves on to the next batch. If a worker process dies anyway,
+`submit`, `flush` and `close` raise `RuntimeError` instead of blocking on
+its queue.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import multiprocessing
+import queue
+import time
+from typing import Any, Callable, Mapping
+import zlib
+
+from .ndjson import rejection_reason, validate_payload
+from .parallel import PayloadRejection
+
+DEFAULT_SHARDS = 4
+DEFAULT_QUEUE_BATCHES = 64
+DEFAULT_BATCH_SIZE = 256
+# How often a blocked put re-checks that the shard's worker is still alive.
+_LIVENESS_POLL_SECONDS = 0.5
+
+logger = logging.getLogger(__name__)
+
+ShardHandler = Callable[[int, list[Any], list[PayloadRejection]], None]
+
+
+@dataclass(frozen=True)
+class ShardStats:
+    """Router-side view of one shard; `queued` counts payloads sent but not yet processed."""
+
+    shard: int
+    queued: int
+    processed: int
+    rejected: int
+    handler_errors: int
+    records_per_second: float
+
+
+def routing_key(payload: Mapping[str, object]) -> tuple[str, str]:
+    """Normalized (exchange, symbol) of a payload, matching model normalization.
+
+    Market snapshots route by `source`, contextual candles by their nested
+    candle. Payloads without usable fields map to `("", "")`.
+    """
+    candle = payload.get("candle")
+    if isinstance(candle, Mapping):
+        payload = candle
+    exchange = payload.get("exchange", payload.get("source"))
+    symbol = payload.get("symbol")
+    return (
+        exchange.strip().lower() if isinstance(exchange, str) else "",
+        symbol.strip().upper() if isinstance(symbol, str) else "",
+    )
+
+
+def shard_for(exchange: str, symbol: str, shards: int) -> int:
+    """Stable shard index for (exchange, symbol); identical across processes and runs."""
+    return zlib.crc32(f"{exchange}\x1f{symbol}".encode()) % shards
+
+
+class ShardedIngestRouter:
+    """Route payloads to per-shard worker processes over bounded queues.
+
+    Each shard's queue holds at most `queue_batches` batches of up to
+    `batch_size` payloads. Call `flush()` to send partial batches and
+    `close()` (or leave the `with` block) to drain and stop the workers.
+    Rejection indexes are submission sequence numbers across the router.
+    """
+
+    def __init__(
+        self,
+        handler: ShardHandler,
+        *,
+        shards: int = DEFAULT_SHARDS,
+        queue_batches: int = DEFAULT_QUEUE_BATCHES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        model: Any = None,
+        record_type_field: str = "record_type",
+        context: Any = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1.")
+        if queue_batches < 1:
+            raise ValueError("queue_batches must be >= 1.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1.")
+        context = context or multiprocessing.get_context()
+        self._shards = shards
+        self._batch_size = batch_size
+        self._queues = [context.Queue(maxsize=queue_batches) for _ in range(shards)]
+        self._processed = [context.Value("q", 0) for _ in range(shards)]
+        self._rejected = [context.Value("q", 0) for _ in range(shards)]
+        self._handler_errors = [context.Value("q", 0) for _ in range(shards)]
+        self._pending: list[list[tuple[int, Mapping[str, object]]]] = [[] for _ in range(shards)]
+        self._sent = [0] * shards
+        self._sequence = 0
+        self._closed = False
+        self._started_at = time.monotonic()
+        self._workers = [
+            context.Process(
+                target=_run_shard,
+                args=(
+                    shard,
+                    self._queues[shard],
+                    handler,
+                    model,
+                    record_type_field,
+                    self._processed[shard],
+                    self._rejected[shard],
+                    self._handler_errors[shard],
+                ),
+                name=f"trader-data-shard-{shard}",
+                daemon=True,
+            )
+            for shard in range(shards)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "ShardedIngestRouter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(self, payload: Mapping[str, object], *, timeout: float | None = None) -> int:
+        """Queue one payload for its shard and return that shard's index.
+
+        Blocks while the shard's queue is full; with `timeout` raises
+        `queue.Full` once it expires. Raises `RuntimeError` if the shard's
+        worker has died.
+        """
+        if self._closed:
+            raise ValueError("router is closed.")
+        shard = shard_for(*routing_key(payload), self._shards)
+        pending = self._pending[shard]
+        pending.append((self._sequence, payload))
+        self._sequence += 1
+        if len(pending) >= self._batch_size:
+            self._send(shard, timeout)
+        return shard
+
+    def flush(self, *, timeout: float | None = None) -> None:
+        """Send every partial batch to its shard."""
+        for shard in range(self._shards):
+            if self._pending[shard]:
+                self._send(shard, timeout)
+
+    def close(self) -> None:
+        """Flush, let every worker drain its queue, and wait for it to exit.
+
+        Live shards are still drained when another shard's worker has died;
+        the dead shards are reported afterwards with `RuntimeError`.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        failed = set()
+        for shard in range(self._shards):
+            try:
+                if self._pending[shard]:
+                    self._send(shard, None)
+                self._put(shard, None, None)
+            except RuntimeError:
+                failed.add(shard)
+        for shard, worker in enumerate(self._workers):
+            worker.join()
+            if worker.exitcode != 0:
+                failed.add(shard)
+        for shard_queue in self._queues:
+            if failed:
+                shard_queue.cancel_join_thread()
+            shard_queue.close()
+        if failed:
+            raise RuntimeError(f"ingest shard worker(s) {sorted(failed)} exited abnormally.")
+
+    def terminate(self) -> None:
+        """Stop every worker immediately, dropping queued payloads."""
+        self._closed = True
+        for worker in self._workers:
+            worker.terminate()
+        for worker in self._workers:
+            worker.join()
+        for shard_queue in self._queues:
+            shard_queue.cancel_join_thread()
+            shard_queue.close()
+
+    def stats(self) -> list[ShardStats]:
+        elapsed = time.monotonic() - self._started_at
+        stats = []
+        for shard in range(self._shards):
+            processed = self._processed[shard].value
+            stats.append(
+                ShardStats(
+                    shard=shard,
+                    queued=self._sent[shard] - processed,
+                    processed=processed,
+                    rejected=self._rejected[shard].value,
+                    handler_errors=self._handler_errors[shard].value,
+                    records_per_second=processed / elapsed if elapsed > 0 else 0.0,
+                )
+            )
+        return stats
+
+    def _send(self, shard: int, timeout: float | None) -> None:
+        batch = self._pending[shard]
+        self._put(shard, batch, timeout)
+        self._pending[shard] = []
+        self._sent[shard] += len(batch)
+
+    def _put(self, shard: int, item: object, timeout: float | None) -> None:
+        # Wait in short slices so a dead worker surfaces as an error instead of a put that never returns.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        shard_queue, worker = self._queues[shard], self._workers[shard]
+        while True:
+            if not worker.is_alive():
+                raise RuntimeError(f"ingest shard {shard} worker is not running (exit code {worker.exitcode}).")
+            wait = _LIVENESS_POLL_SECONDS
+            if deadline is not None:
+                wait = max(min(wait, deadline - time.monotonic()), 0.0)
+            try:
+                shard_queue.put(item, timeout=wait)
+                return
+            except queue.Full:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+
+def _run_shard(
+    shard: int,
+    shard_queue: Any,
+    handler: ShardHandler,
+    model: Any,
+    record_type_field: str,
+    processed: Any,
+    rejected: Any,
+    handler_errors: Any,
+) -> None:
+    while (batch := shard_queue.get()) is not None:
+        records: list[Any] = []
+        rejections: list[PayloadRejection] = []
+        for index, payload in batch:
+            try:
+                records.append(validate_payload(payload, model=model, record_type_field=record_type_field))
+            except (KeyError, ValueError) as exc:
+                rejections.append(PayloadRejection(index=index, reason=rejection_reason(exc)))
+        try:
+            handler(shard, records, rejections)
+        except Exception:
+            logger.exception("ingest shard %d handler failed on a batch of %d payloads.", shard, len(batch))
+            with handler_errors.get_lock():
+                handler_errors.value += 1
+        with rejected.get_lock():
+            rejected.value += len(rejections)
+        with processed.get_lock():
+            processed.value += len(batch)
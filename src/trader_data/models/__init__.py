@@ -3,19 +3,23 @@
 from .market_snapshot import MarketSnapshotV1
 from .market_data import (
     MARKET_DATA_SCHEMA_VERSION,
+    CandleBatchV1,
     CandleV1,
     ContextualCandleV1,
     OrderBookLevelV1,
     OrderBookSnapshotV1,
+    TickBatchV1,
     TickV1,
 )
 
 __all__ = [
     "MARKET_DATA_SCHEMA_VERSION",
+    "CandleBatchV1",
     "CandleV1",
     "ContextualCandleV1",
     "MarketSnapshotV1",
     "OrderBookLevelV1",
     "OrderBookSnapshotV1",
+    "TickBatchV1",
     "TickV1",
 ]
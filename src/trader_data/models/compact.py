@@ -0,0 +1,235 @@
+"""Memory-lean, read-only representations of high-volume models.
+
+`CompactTick`, `CompactCandle` and `CompactOrderBookLevel` are slotted
+classes: no per-instance `__dict__`. `symbol`, `exchange`, `side` and
+`interval` go through a shared `StringTable`, so every record for a symbol
+references one string object. Timestamps are stored as UTC epoch
+nanoseconds (`event_time_ns`) instead of a `datetime`.
+
+Per-object byte budgets (CPython 3.11, 64-bit), counted by `owned_bytes`:
+the instance plus every attribute value it does not share through the
+string table.
+
+    CompactTick              256 bytes, with a trade_id of up to 32 ASCII characters
+    CompactCandle            288 bytes
+    CompactOrderBookLevel     96 bytes
+
+A `TickV1` holding the same data typically owns over 600 bytes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import sys
+from typing import Any
+
+from .market_data import MARKET_DATA_SCHEMA_VERSION, CandleV1, OrderBookLevelV1, TickV1
+from .timestamps import from_epoch_ns, to_epoch_ns
+
+TICK_BYTE_BUDGET = 256
+CANDLE_BYTE_BUDGET = 288
+ORDER_BOOK_LEVEL_BYTE_BUDGET = 96
+
+_set = object.__setattr__
+
+
+class StringTable:
+    """Canonical instances of repeated strings; equal inputs come back as one object."""
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        """True only for the canonical object itself, not for an equal copy."""
+        return isinstance(value, str) and self._strings.get(value) is value
+
+    def intern(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+
+SHARED_STRINGS = StringTable()
+
+
+class _CompactRecord:
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactTick(_CompactRecord):
+    __slots__ = ("symbol", "exchange", "event_time_ns", "price", "quantity", "side", "trade_id")
+
+    symbol: str
+    exchange: str
+    event_time_ns: int
+    price: float
+    quantity: float
+    side: str
+    trade_id: str
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: str,
+        event_time_ns: int,
+        price: float,
+        quantity: float,
+        side: str,
+        trade_id: str,
+        table: StringTable = SHARED_STRINGS,
+    ) -> None:
+        intern = table.intern
+        _set(self, "symbol", intern(symbol))
+        _set(self, "exchange", intern(exchange))
+        _set(self, "event_time_ns", event_time_ns)
+        _set(self, "price", price)
+        _set(self, "quantity", quantity)
+        _set(self, "side", intern(side))
+        _set(self, "trade_id", trade_id)
+
+    @classmethod
+    def from_model(cls, tick: TickV1, table: StringTable = SHARED_STRINGS) -> "CompactTick":
+        return cls(
+            tick.symbol,
+            tick.exchange,
+            to_epoch_ns(tick.event_time),
+            tick.price,
+            tick.quantity,
+            tick.side,
+            tick.trade_id,
+            table,
+        )
+
+    @property
+    def event_time(self) -> datetime:
+        return from_epoch_ns(self.event_time_ns)
+
+    def to_model(self) -> TickV1:
+        return TickV1(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=self.symbol,
+            exchange=self.exchange,
+            event_time=self.event_time,
+            price=self.price,
+            quantity=self.quantity,
+            side=self.side,
+            trade_id=self.trade_id,
+        )
+
+
+class CompactCandle(_CompactRecord):
+    __slots__ = ("symbol", "exchange", "interval", "event_time_ns", "open", "high", "low", "close", "volume")
+
+    symbol: str
+    exchange: str
+    interval: str
+    event_time_ns: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: str,
+        interval: str,
+        event_time_ns: int,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        table: StringTable = SHARED_STRINGS,
+    ) -> None:
+        intern = table.intern
+        _set(self, "symbol", intern(symbol))
+        _set(self, "exchange", intern(exchange))
+        _set(self, "interval", intern(interval))
+        _set(self, "event_time_ns", event_time_ns)
+        _set(self, "open", open)
+        _set(self, "high", high)
+        _set(self, "low", low)
+        _set(self, "close", close)
+        _set(self, "volume", volume)
+
+    @classmethod
+    def from_model(cls, candle: CandleV1, table: StringTable = SHARED_STRINGS) -> "CompactCandle":
+        return cls(
+            candle.symbol,
+            candle.exchange,
+            candle.interval,
+            to_epoch_ns(candle.event_time),
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+            table,
+        )
+
+    @property
+    def event_time(self) -> datetime:
+        return from_epoch_ns(self.event_time_ns)
+
+    def to_model(self) -> CandleV1:
+        return CandleV1(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=self.symbol,
+            exchange=self.exchange,
+            interval=self.interval,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            event_time=self.event_time,
+        )
+
+
+class CompactOrderBookLevel(_CompactRecord):
+    __slots__ = ("price", "quantity")
+
+    price: float
+    quantity: float
+
+    def __init__(self, price: float, quantity: float) -> None:
+        _set(self, "price", price)
+        _set(self, "quantity", quantity)
+
+    @classmethod
+    def from_model(cls, level: OrderBookLevelV1) -> "CompactOrderBookLevel":
+        return cls(level.price, level.quantity)
+
+    def to_model(self) -> OrderBookLevelV1:
+        return OrderBookLevelV1(price=self.price, quantity=self.quantity)
+
+
+def owned_bytes(record: _CompactRecord, table: StringTable = SHARED_STRINGS) -> int:
+    """Bytes held by `record` alone: the instance plus attribute values not shared through `table`."""
+    return sys.getsizeof(record) + sum(
+        sys.getsizeof(value) for value in record._values() if value not in table
+    )
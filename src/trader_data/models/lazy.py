@@ -0,0 +1,109 @@
+"""Lazy, trusted views over previously validated payloads.
+
+`LazyRecord` wraps a payload that an internal source already validated and
+converts each field only when it is first read, so replay consumers that
+look at `price` and `event_time` never pay for `trade_id` or book levels
+they ignore. No checks run: payloads must come from our own archives, not
+from providers. `materialize()` builds the full model through
+`from_trusted_payload`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from .market_data import CandleV1, ContextualCandleV1, OrderBookSnapshotV1, TickV1, _trusted_levels
+from .market_snapshot import MarketSnapshotV1
+from .timestamps import parse_trusted_timestamp
+
+_FIELD_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "event_time": parse_trusted_timestamp,
+    "ingest_time": parse_trusted_timestamp,
+    "bids": _trusted_levels,
+    "asks": _trusted_levels,
+    "candle": CandleV1.from_trusted_payload,
+}
+
+# Optional payload keys, with the value `from_payload` assumes when they are absent.
+_PAYLOAD_DEFAULTS: dict[str, Callable[[], Any]] = {
+    "sentiment": lambda: 0.0,
+    "regime": lambda: None,
+    "news": list,
+    "custom": dict,
+    "bids": list,
+    "asks": list,
+}
+
+_MISSING_FIELD = object()
+_field_names: dict[Any, frozenset[str]] = {}
+
+
+class LazyRecord:
+    """Read-only view of a trusted payload that parses fields on first access."""
+
+    __slots__ = ("_model", "_payload", "_parsed")
+
+    def __init__(self, model: Any, payload: Mapping[str, Any]) -> None:
+        if model not in (TickV1, OrderBookSnapshotV1, CandleV1, ContextualCandleV1, MarketSnapshotV1):
+            raise ValueError(f"{getattr(model, '__name__', model)!r} has no trusted construction path.")
+        self._model = model
+        self._payload = payload
+        self._parsed: dict[str, Any] = {}
+
+    @property
+    def model(self) -> Any:
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        # Only unset slots and protocol lookups (copy, pickle) reach here with "_" names;
+        # answering them from `_parsed` would recurse while the slots are still empty.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        parsed = self._parsed
+        if name in parsed:
+            return parsed[name]
+        names = _field_names.get(self._model)
+        if names is None:
+            names = _field_names[self._model] = frozenset(model_field.name for model_field in fields(self._model))
+        if name not in names:
+            raise AttributeError(f"{self._model.__name__} has no field {name!r}.")
+        raw = self._payload.get(name, _MISSING_FIELD)
+        if raw is _MISSING_FIELD:
+            if name not in _PAYLOAD_DEFAULTS:
+                raise KeyError(name)
+            value = _PAYLOAD_DEFAULTS[name]()
+        else:
+            parser = _FIELD_PARSERS.get(name)
+            value = raw if parser is None else parser(raw)
+        parsed[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyRecord.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError("LazyRecord is read-only.")
+
+    def __getstate__(self) -> tuple[Any, Mapping[str, Any]]:
+        # Parsed fields are a cache; the receiving side re-parses on access.
+        return self._model, self._payload
+
+    def __setstate__(self, state: tuple[Any, Mapping[str, Any]]) -> None:
+        model, payload = state
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_payload", payload)
+        object.__setattr__(self, "_parsed", {})
+
+    def __repr__(self) -> str:
+        return f"LazyRecord({self._model.__name__}, parsed={sorted(self._parsed)})"
+
+    def materialize(self) -> Any:
+        """Build the full model instance, without validation."""
+        return self._model.from_trusted_payload(self._payload)
+
+
+def lazy_records(model: Any, payloads: Iterable[Mapping[str, Any]]) -> Iterator[LazyRecord]:
+    """Wrap each trusted payload in a `LazyRecord`."""
+    for payload in payloads:
+        yield LazyRecord(model, payload)
@@ -2,45 +2,100 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 import math
-from typing import Any, Mapping
+from math import isfinite
+from operator import le
+from typing import Any, Callable, Iterable, Mapping
 
-MARKET_DATA_SCHEMA_VERSION = "1.0"
-
-
-def _as_str(value: object, field_name: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{field_name} must be a non-empty string.")
-    return value.strip()
+from . import wire
+from .schema import Check, Compute, Field, SchemaSpec, _as_float, _as_str, compile_from_payload
+from .timestamps import from_epoch_ns, parse_epoch_ns, parse_trusted_timestamp, to_epoch_ns
 
+MARKET_DATA_SCHEMA_VERSION = "1.0"
 
-def _as_float(value: object, field_name: str) -> float:
-    if isinstance(value, bool) or not isinstance(value, (int, float)):
-        raise ValueError(f"{field_name} must be numeric.")
-    converted = float(value)
-    if not math.isfinite(converted):
-        raise ValueError(f"{field_name} must be finite.")
-    return converted
+_SIDE_STEPS = (
+    Field("side", "str", normalize="lower"),
+    Check("side != 'buy' and side != 'sell'", "side must be 'buy' or 'sell'."),
+)
+_SYMBOL_EXCHANGE_STEPS = (
+    Field("symbol", "str", normalize="upper"),
+    Field("exchange", "str", normalize="lower"),
+)
 
+TICK_SCHEMAS = (
+    SchemaSpec(
+        MARKET_DATA_SCHEMA_VERSION,
+        (
+            *_SIDE_STEPS,
+            Field("price", "float"),
+            Field("quantity", "float"),
+            Check("price <= 0", "price must be > 0."),
+            Check("quantity <= 0", "quantity must be > 0."),
+            *_SYMBOL_EXCHANGE_STEPS,
+            Field("event_time", "timestamp"),
+            Field("trade_id", "str"),
+        ),
+    ),
+)
 
-def _as_timestamp(value: object, field_name: str) -> datetime:
-    if not isinstance(value, str):
-        raise ValueError(f"{field_name} must be an ISO-8601 timestamp string.")
-    try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must be a valid ISO-8601 timestamp.") from exc
-    if parsed.tzinfo is None:
-        raise ValueError(f"{field_name} must include timezone information.")
-    return parsed.astimezone(timezone.utc)
+ORDER_BOOK_SCHEMAS = (
+    SchemaSpec(
+        MARKET_DATA_SCHEMA_VERSION,
+        (
+            Field("bids", default="None"),
+            Compute("bids", "_parse_levels(bids, 'bids')"),
+            Field("asks", default="None"),
+            Compute("asks", "_parse_levels(asks, 'asks')"),
+            Check("not bids and not asks", "at least one of bids/asks must be provided."),
+            *_SYMBOL_EXCHANGE_STEPS,
+            Field("event_time", "timestamp"),
+        ),
+    ),
+)
 
+CANDLE_SCHEMAS = (
+    SchemaSpec(
+        MARKET_DATA_SCHEMA_VERSION,
+        (
+            Field("open", "float"),
+            Field("high", "float"),
+            Field("low", "float"),
+            Field("close", "float"),
+            Field("volume", "float"),
+            Check("min(open, high, low, close) <= 0", "OHLC values must be > 0."),
+            Check("high < low", "high must be >= low."),
+            Check("not (low <= open <= high)", "open must be within [low, high]."),
+            Check("not (low <= close <= high)", "close must be within [low, high]."),
+            Check("volume < 0", "volume must be >= 0."),
+            *_SYMBOL_EXCHANGE_STEPS,
+            Field("interval", "str"),
+            Field("event_time", "timestamp"),
+        ),
+    ),
+)
 
-def _validate_schema(payload: Mapping[str, object]) -> None:
-    schema_version = payload.get("schema_version")
-    if schema_version != MARKET_DATA_SCHEMA_VERSION:
-        raise ValueError(f"Unsupported schema_version; expected '{MARKET_DATA_SCHEMA_VERSION}'.")
+CONTEXTUAL_CANDLE_SCHEMAS = (
+    SchemaSpec(
+        MARKET_DATA_SCHEMA_VERSION,
+        (
+            Field("candle", default="None"),
+            Check("not isinstance(candle, Mapping)", "candle must be an object payload."),
+            Field("sentiment", "float", default="0.0"),
+            Check("sentiment < -1 or sentiment > 1", "sentiment must be between -1 and 1."),
+            Field("news", default="[]"),
+            Check("not isinstance(news, list)", "news must be a list."),
+            Field("custom", default="{}"),
+            Check("not isinstance(custom, Mapping)", "custom must be a key-value object."),
+            Compute("custom", "_parse_custom(custom)"),
+            Compute("news", "_parse_news(news)"),
+            Compute("candle", "CandleV1.from_payload(candle)"),
+            Field("regime", "optional_str"),
+        ),
+    ),
+)
 
 
 @dataclass(frozen=True)
@@ -54,29 +109,29 @@ class TickV1:
     side: str
     trade_id: str
 
+    from_payload = compile_from_payload("TickV1", TICK_SCHEMAS, namespace=globals())
+
     @classmethod
-    def from_payload(cls, payload: Mapping[str, object]) -> "TickV1":
-        _validate_schema(payload)
-        side = _as_str(payload["side"], "side").lower()
-        if side not in {"buy", "sell"}:
-            raise ValueError("side must be 'buy' or 'sell'.")
-        price = _as_float(payload["price"], "price")
-        quantity = _as_float(payload["quantity"], "quantity")
-        if price <= 0:
-            raise ValueError("price must be > 0.")
-        if quantity <= 0:
-            raise ValueError("quantity must be > 0.")
+    def from_trusted_payload(cls, payload: Mapping[str, Any]) -> "TickV1":
+        """Build from a payload that already passed `from_payload`, skipping every check."""
         return cls(
-            schema_version=MARKET_DATA_SCHEMA_VERSION,
-            symbol=_as_str(payload["symbol"], "symbol").upper(),
-            exchange=_as_str(payload["exchange"], "exchange").lower(),
-            event_time=_as_timestamp(payload["event_time"], "event_time"),
-            price=price,
-            quantity=quantity,
-            side=side,
-            trade_id=_as_str(payload["trade_id"], "trade_id"),
+            schema_version=payload["schema_version"],
+            symbol=payload["symbol"],
+            exchange=payload["exchange"],
+            event_time=parse_trusted_timestamp(payload["event_time"]),
+            price=payload["price"],
+            quantity=payload["quantity"],
+            side=payload["side"],
+            trade_id=payload["trade_id"],
         )
 
+    def to_bytes(self, table: wire.WireStringTable | None = None) -> bytes:
+        return wire.encode_tick(self, table)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, table: wire.WireStringTable | None = None) -> "TickV1":
+        return wire.decode_tick(cls, data, table)
+
 
 @dataclass(frozen=True)
 class OrderBookLevelV1:
@@ -93,22 +148,27 @@ class OrderBookSnapshotV1:
     bids: list[OrderBookLevelV1] = field(default_factory=list)
     asks: list[OrderBookLevelV1] = field(default_factory=list)
 
+    from_payload = compile_from_payload("OrderBookSnapshotV1", ORDER_BOOK_SCHEMAS, namespace=globals())
+
     @classmethod
-    def from_payload(cls, payload: Mapping[str, object]) -> "OrderBookSnapshotV1":
-        _validate_schema(payload)
-        bids = _parse_levels(payload.get("bids"), "bids")
-        asks = _parse_levels(payload.get("asks"), "asks")
-        if not bids and not asks:
-            raise ValueError("at least one of bids/asks must be provided.")
+    def from_trusted_payload(cls, payload: Mapping[str, Any]) -> "OrderBookSnapshotV1":
+        """Build from a payload that already passed `from_payload`, skipping every check."""
         return cls(
-            schema_version=MARKET_DATA_SCHEMA_VERSION,
-            symbol=_as_str(payload["symbol"], "symbol").upper(),
-            exchange=_as_str(payload["exchange"], "exchange").lower(),
-            event_time=_as_timestamp(payload["event_time"], "event_time"),
-            bids=bids,
-            asks=asks,
+            schema_version=payload["schema_version"],
+            symbol=payload["symbol"],
+            exchange=payload["exchange"],
+            event_time=parse_trusted_timestamp(payload["event_time"]),
+            bids=_trusted_levels(payload.get("bids")),
+            asks=_trusted_levels(payload.get("asks")),
         )
 
+    def to_bytes(self, table: wire.WireStringTable | None = None) -> bytes:
+        return wire.encode_order_book(self, table)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, table: wire.WireStringTable | None = None) -> "OrderBookSnapshotV1":
+        return wire.decode_order_book(cls, data, table)
+
 
 @dataclass(frozen=True)
 class CandleV1:
@@ -123,37 +183,31 @@ class CandleV1:
     volume: float
     event_time: datetime
 
+    from_payload = compile_from_payload("CandleV1", CANDLE_SCHEMAS, namespace=globals())
+
     @classmethod
-    def from_payload(cls, payload: Mapping[str, object]) -> "CandleV1":
-        _validate_schema(payload)
-        open_price = _as_float(payload["open"], "open")
-        high_price = _as_float(payload["high"], "high")
-        low_price = _as_float(payload["low"], "low")
-        close_price = _as_float(payload["close"], "close")
-        volume = _as_float(payload["volume"], "volume")
-        if min(open_price, high_price, low_price, close_price) <= 0:
-            raise ValueError("OHLC values must be > 0.")
-        if high_price < low_price:
-            raise ValueError("high must be >= low.")
-        if not (low_price <= open_price <= high_price):
-            raise ValueError("open must be within [low, high].")
-        if not (low_price <= close_price <= high_price):
-            raise ValueError("close must be within [low, high].")
-        if volume < 0:
-            raise ValueError("volume must be >= 0.")
+    def from_trusted_payload(cls, payload: Mapping[str, Any]) -> "CandleV1":
+        """Build from a payload that already passed `from_payload`, skipping every check."""
         return cls(
-            schema_version=MARKET_DATA_SCHEMA_VERSION,
-            symbol=_as_str(payload["symbol"], "symbol").upper(),
-            exchange=_as_str(payload["exchange"], "exchange").lower(),
-            interval=_as_str(payload["interval"], "interval"),
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=volume,
-            event_time=_as_timestamp(payload["event_time"], "event_time"),
+            schema_version=payload["schema_version"],
+            symbol=payload["symbol"],
+            exchange=payload["exchange"],
+            interval=payload["interval"],
+            open=payload["open"],
+            high=payload["high"],
+            low=payload["low"],
+            close=payload["close"],
+            volume=payload["volume"],
+            event_time=parse_trusted_timestamp(payload["event_time"]),
         )
 
+    def to_bytes(self, table: wire.WireStringTable | None = None) -> bytes:
+        return wire.encode_candle(self, table)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, table: wire.WireStringTable | None = None) -> "CandleV1":
+        return wire.decode_candle(cls, data, table)
+
 
 @dataclass(frozen=True)
 class ContextualCandleV1:
@@ -164,38 +218,240 @@ class ContextualCandleV1:
     news: list[dict[str, Any]] = field(default_factory=list)
     custom: dict[str, float] = field(default_factory=dict)
 
+    from_payload = compile_from_payload("ContextualCandleV1", CONTEXTUAL_CANDLE_SCHEMAS, namespace=globals())
+
+    @classmethod
+    def from_trusted_payload(cls, payload: Mapping[str, Any]) -> "ContextualCandleV1":
+        """Build from a payload that already passed `from_payload`, skipping every check.
+
+        `news` and `custom` are used as given rather than copied.
+        """
+        return cls(
+            schema_version=payload["schema_version"],
+            candle=CandleV1.from_trusted_payload(payload["candle"]),
+            sentiment=payload.get("sentiment", 0.0),
+            regime=payload.get("regime"),
+            news=payload.get("news", []),
+            custom=payload.get("custom", {}),
+        )
+
+
+@dataclass(frozen=True)
+class TickBatchV1:
+    """Columnar container for many `TickV1` rows.
+
+    Numeric fields live in contiguous typed arrays and `event_time_ns` holds
+    UTC epoch nanoseconds, so a backfill chunk costs a handful of objects
+    instead of one frozen dataclass per trade.
+    """
+
+    schema_version: str
+    symbol: list[str]
+    exchange: list[str]
+    event_time_ns: array
+    price: array
+    quantity: array
+    side: list[str]
+    trade_id: list[str]
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[Mapping[str, object]]) -> "TickBatchV1":
+        rows = list(payloads)
+        try:
+            return cls._from_columns(rows)
+        except (KeyError, OverflowError, TypeError, ValueError):
+            # Column checks only say that something is wrong; the row path
+            # pinpoints the offending payload with the usual error message.
+            return cls.from_rows(_rows_from_payloads(TickV1, rows))
+
+    @classmethod
+    def _from_columns(cls, rows: list[Mapping[str, object]]) -> "TickBatchV1":
+        _validate_schema_column(rows)
+        side = _normalized_str_column([row["side"] for row in rows], "side", str.lower)
+        if not set(side) <= {"buy", "sell"}:
+            raise ValueError("side must be 'buy' or 'sell'.")
+        price = _positive_float_column([row["price"] for row in rows], "price")
+        quantity = _positive_float_column([row["quantity"] for row in rows], "quantity")
+        return cls(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=_normalized_str_column([row["symbol"] for row in rows], "symbol", str.upper),
+            exchange=_normalized_str_column([row["exchange"] for row in rows], "exchange", str.lower),
+            event_time_ns=array("q", [parse_epoch_ns(row["event_time"], "event_time") for row in rows]),
+            price=price,
+            quantity=quantity,
+            side=side,
+            trade_id=_str_column([row["trade_id"] for row in rows], "trade_id"),
+        )
+
+    @classmethod
+    def from_rows(cls, ticks: Iterable[TickV1]) -> "TickBatchV1":
+        ticks = list(ticks)
+        return cls(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=[tick.symbol for tick in ticks],
+            exchange=[tick.exchange for tick in ticks],
+            event_time_ns=array("q", [to_epoch_ns(tick.event_time) for tick in ticks]),
+            price=array("d", [tick.price for tick in ticks]),
+            quantity=array("d", [tick.quantity for tick in ticks]),
+            side=[tick.side for tick in ticks],
+            trade_id=[tick.trade_id for tick in ticks],
+        )
+
+    def row(self, index: int) -> TickV1:
+        return TickV1(
+            schema_version=self.schema_version,
+            symbol=self.symbol[index],
+            exchange=self.exchange[index],
+            event_time=from_epoch_ns(self.event_time_ns[index]),
+            price=self.price[index],
+            quantity=self.quantity[index],
+            side=self.side[index],
+            trade_id=self.trade_id[index],
+        )
+
+    def to_rows(self) -> list[TickV1]:
+        return [self.row(index) for index in range(len(self))]
+
+
+@dataclass(frozen=True)
+class CandleBatchV1:
+    """Columnar container for many `CandleV1` rows."""
+
+    schema_version: str
+    symbol: list[str]
+    exchange: list[str]
+    interval: list[str]
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+    event_time_ns: array
+
+    def __len__(self) -> int:
+        return len(self.close)
+
     @classmethod
-    def from_payload(cls, payload: Mapping[str, object]) -> "ContextualCandleV1":
-        _validate_schema(payload)
-        candle_payload = payload.get("candle")
-        if not isinstance(candle_payload, Mapping):
-            raise ValueError("candle must be an object payload.")
-        sentiment = _as_float(payload.get("sentiment", 0.0), "sentiment")
-        if sentiment < -1 or sentiment > 1:
-            raise ValueError("sentiment must be between -1 and 1.")
-        news_payload = payload.get("news", [])
-        if not isinstance(news_payload, list):
-            raise ValueError("news must be a list.")
-        custom_payload = payload.get("custom", {})
-        if not isinstance(custom_payload, Mapping):
-            raise ValueError("custom must be a key-value object.")
-        custom: dict[str, float] = {str(key): _as_float(value, f"custom[{key}]") for key, value in custom_payload.items()}
-
-        news: list[dict[str, Any]] = []
-        for index, item in enumerate(news_payload):
-            if not isinstance(item, Mapping):
-                raise ValueError(f"news[{index}] must be an object.")
-            news.append(dict(item))
+    def from_payloads(cls, payloads: Iterable[Mapping[str, object]]) -> "CandleBatchV1":
+        rows = list(payloads)
+        try:
+            return cls._from_columns(rows)
+        except (KeyError, OverflowError, TypeError, ValueError):
+            return cls.from_rows(_rows_from_payloads(CandleV1, rows))
 
+    @classmethod
+    def _from_columns(cls, rows: list[Mapping[str, object]]) -> "CandleBatchV1":
+        _validate_schema_column(rows)
+        open_price = _positive_float_column([row["open"] for row in rows], "open")
+        high_price = _positive_float_column([row["high"] for row in rows], "high")
+        low_price = _positive_float_column([row["low"] for row in rows], "low")
+        close_price = _positive_float_column([row["close"] for row in rows], "close")
+        volume = _float_column([row["volume"] for row in rows], "volume")
+        if not all(map(le, low_price, high_price)):
+            raise ValueError("high must be >= low.")
+        if not (all(map(le, low_price, open_price)) and all(map(le, open_price, high_price))):
+            raise ValueError("open must be within [low, high].")
+        if not (all(map(le, low_price, close_price)) and all(map(le, close_price, high_price))):
+            raise ValueError("close must be within [low, high].")
+        if volume and min(volume) < 0:
+            raise ValueError("volume must be >= 0.")
         return cls(
             schema_version=MARKET_DATA_SCHEMA_VERSION,
-            candle=CandleV1.from_payload(candle_payload),
-            sentiment=sentiment,
-            regime=_as_str(payload["regime"], "regime") if payload.get("regime") is not None else None,
-            news=news,
-            custom=custom,
+            symbol=_normalized_str_column([row["symbol"] for row in rows], "symbol", str.upper),
+            exchange=_normalized_str_column([row["exchange"] for row in rows], "exchange", str.lower),
+            interval=_normalized_str_column([row["interval"] for row in rows], "interval", str),
+            open=open_price,
+            high=high_price,
+            low=low_price,
+            close=close_price,
+            volume=volume,
+            event_time_ns=array("q", [parse_epoch_ns(row["event_time"], "event_time") for row in rows]),
         )
 
+    @classmethod
+    def from_rows(cls, candles: Iterable[CandleV1]) -> "CandleBatchV1":
+        candles = list(candles)
+        return cls(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=[candle.symbol for candle in candles],
+            exchange=[candle.exchange for candle in candles],
+            interval=[candle.interval for candle in candles],
+            open=array("d", [candle.open for candle in candles]),
+            high=array("d", [candle.high for candle in candles]),
+            low=array("d", [candle.low for candle in candles]),
+            close=array("d", [candle.close for candle in candles]),
+            volume=array("d", [candle.volume for candle in candles]),
+            event_time_ns=array("q", [to_epoch_ns(candle.event_time) for candle in candles]),
+        )
+
+    def row(self, index: int) -> CandleV1:
+        return CandleV1(
+            schema_version=self.schema_version,
+            symbol=self.symbol[index],
+            exchange=self.exchange[index],
+            interval=self.interval[index],
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+            event_time=from_epoch_ns(self.event_time_ns[index]),
+        )
+
+    def to_rows(self) -> list[CandleV1]:
+        return [self.row(index) for index in range(len(self))]
+
+
+def _rows_from_payloads(model: Any, rows: list[Mapping[str, object]]) -> list[Any]:
+    parsed = []
+    for index, row in enumerate(rows):
+        try:
+            parsed.append(model.from_payload(row))
+        except (KeyError, ValueError) as exc:
+            exc.add_note(f"payloads[{index}]")
+            raise
+    return parsed
+
+
+def _validate_schema_column(rows: list[Mapping[str, object]]) -> None:
+    if any(row.get("schema_version") != MARKET_DATA_SCHEMA_VERSION for row in rows):
+        raise ValueError(f"Unsupported schema_version; expected '{MARKET_DATA_SCHEMA_VERSION}'.")
+
+
+def _str_column(values: list[object], field_name: str) -> list[str]:
+    if not set(map(type, values)) <= {str}:
+        raise ValueError(f"{field_name} must be a non-empty string.")
+    stripped = [value.strip() for value in values]  # type: ignore[attr-defined]
+    if not all(stripped):
+        raise ValueError(f"{field_name} must be a non-empty string.")
+    return stripped
+
+
+def _normalized_str_column(values: list[object], field_name: str, normalize: Callable[[str], str]) -> list[str]:
+    # Low-cardinality columns (symbol, exchange, side, interval) are validated
+    # once per distinct value and share a single normalized string per value.
+    normalized = {value: normalize(_as_str(value, field_name)) for value in set(values)}
+    return [normalized[value] for value in values]
+
+
+def _float_column(values: list[object], field_name: str) -> array:
+    if not set(map(type, values)) <= {float, int}:
+        raise ValueError(f"{field_name} must be numeric.")
+    column = array("d", values)
+    if not all(map(math.isfinite, column)):
+        raise ValueError(f"{field_name} must be finite.")
+    return column
+
+
+def _positive_float_column(values: list[object], field_name: str) -> array:
+    column = _float_column(values, field_name)
+    if column and min(column) <= 0:
+        raise ValueError(f"{field_name} must be > 0.")
+    return column
+
 
 def _parse_levels(value: object, field_name: str) -> list[OrderBookLevelV1]:
     if value is None:
@@ -207,9 +463,32 @@ def _parse_levels(value: object, field_name: str) -> list[OrderBookLevelV1]:
     for index, item in enumerate(value):
         if not isinstance(item, Mapping):
             raise ValueError(f"{field_name}[{index}] must be an object.")
-        price = _as_float(item.get("price"), f"{field_name}[{index}].price")
-        quantity = _as_float(item.get("quantity"), f"{field_name}[{index}].quantity")
+        price = item.get("price")
+        if type(price) is not float or not isfinite(price):
+            price = _as_float(price, f"{field_name}[{index}].price")
+        quantity = item.get("quantity")
+        if type(quantity) is not float or not isfinite(quantity):
+            quantity = _as_float(quantity, f"{field_name}[{index}].quantity")
         if price <= 0 or quantity <= 0:
             raise ValueError(f"{field_name}[{index}] has invalid price/quantity.")
         levels.append(OrderBookLevelV1(price=price, quantity=quantity))
     return levels
+
+
+def _parse_custom(value: Mapping[Any, object]) -> dict[str, float]:
+    return {str(key): _as_float(item, f"custom[{key}]") for key, item in value.items()}
+
+
+def _parse_news(value: list[object]) -> list[dict[str, Any]]:
+    news: list[dict[str, Any]] = []
+    for index, item in enumerate(value):
+        if not isinstance(item, Mapping):
+            raise ValueError(f"news[{index}] must be an object.")
+        news.append(dict(item))
+    return news
+
+
+def _trusted_levels(value: Any) -> list[OrderBookLevelV1]:
+    if not value:
+        return []
+    return [OrderBookLevelV1(price=item["price"], quantity=item["quantity"]) for item in value]
@@ -3,9 +3,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-import math
-from typing import Mapping
+from datetime import datetime
+from typing import Any, Mapping
+
+from . import wire
+from .schema import Check, Field, SchemaSpec, compile_from_payload
+from .timestamps import parse_trusted_timestamp
+
+MARKET_SNAPSHOT_SCHEMAS = (
+    SchemaSpec(
+        "1.0",
+        (
+            Field("symbol", "str", normalize="upper"),
+            Field("source", "str"),
+            Field("event_time", "timestamp"),
+            Field("ingest_time", "timestamp"),
+            Check("ingest_time < event_time", "ingest_time must be greater than or equal to event_time."),
+            Field("price", "float"),
+            Check("price <= 0", "price must be greater than zero."),
+            Field("volume", "float"),
+            Check("volume < 0", "volume must be greater than or equal to zero."),
+        ),
+    ),
+)
 
 
 @dataclass(frozen=True)
@@ -20,79 +40,30 @@ class MarketSnapshotV1:
     volume: float
     source: str
 
-    @classmethod
-    def from_payload(cls, payload: Mapping[str, object]) -> "MarketSnapshotV1":
-        required_keys = (
-            "schema_version",
-            "symbol",
-            "event_time",
-            "ingest_time",
-            "price",
-            "volume",
-            "source",
-        )
-
-        missing = [key for key in required_keys if key not in payload]
-        if missing:
-            raise ValueError(f"Missing required keys: {', '.join(missing)}")
-
-        schema_version = _as_str(payload["schema_version"], "schema_version")
-        if schema_version != "1.0":
-            raise ValueError("Unsupported schema_version; expected '1.0'.")
-
-        symbol = _as_str(payload["symbol"], "symbol").upper()
-        source = _as_str(payload["source"], "source")
-
-        event_time = _as_utc_timestamp(payload["event_time"], "event_time")
-        ingest_time = _as_utc_timestamp(payload["ingest_time"], "ingest_time")
-        if ingest_time < event_time:
-            raise ValueError("ingest_time must be greater than or equal to event_time.")
-
-        price = _as_float(payload["price"], "price")
-        if price <= 0:
-            raise ValueError("price must be greater than zero.")
-
-        volume = _as_float(payload["volume"], "volume")
-        if volume < 0:
-            raise ValueError("volume must be greater than or equal to zero.")
+    from_payload = compile_from_payload(
+        "MarketSnapshotV1",
+        MARKET_SNAPSHOT_SCHEMAS,
+        namespace=globals(),
+        required_keys=("schema_version", "symbol", "event_time", "ingest_time", "price", "volume", "source"),
+        strict_version=True,
+    )
 
+    @classmethod
+    def from_trusted_payload(cls, payload: Mapping[str, Any]) -> "MarketSnapshotV1":
+        """Build from a payload that already passed `from_payload`, skipping every check."""
         return cls(
-            schema_version=schema_version,
-            symbol=symbol,
-            event_time=event_time,
-            ingest_time=ingest_time,
-            price=price,
-            volume=volume,
-            source=source,
+            schema_version=payload["schema_version"],
+            symbol=payload["symbol"],
+            event_time=parse_trusted_timestamp(payload["event_time"]),
+            ingest_time=parse_trusted_timestamp(payload["ingest_time"]),
+            price=payload["price"],
+            volume=payload["volume"],
+            source=payload["source"],
         )
 
+    def to_bytes(self, table: wire.WireStringTable | None = None) -> bytes:
+        return wire.encode_market_snapshot(self, table)
 
-def _as_str(value: object, field_name: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{field_name} must be a non-empty string.")
-    return value.strip()
-
-
-def _as_float(value: object, field_name: str) -> float:
-    if isinstance(value, bool) or not isinstance(value, (int, float)):
-        raise ValueError(f"{field_name} must be numeric.")
-    numeric_value = float(value)
-    if not math.isfinite(numeric_value):
-        raise ValueError(f"{field_name} must be finite.")
-    return numeric_value
-
-
-def _as_utc_timestamp(value: object, field_name: str) -> datetime:
-    if not isinstance(value, str):
-        raise ValueError(f"{field_name} must be an ISO-8601 timestamp string.")
-
-    normalized = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must be a valid ISO-8601 timestamp.") from exc
-
-    if parsed.tzinfo is None:
-        raise ValueError(f"{field_name} must include timezone information.")
-
-    return parsed.astimezone(timezone.utc)
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, table: wire.WireStringTable | None = None) -> "MarketSnapshotV1":
+        return wire.decode_market_snapshot(cls, data, table)
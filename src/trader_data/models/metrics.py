@@ -0,0 +1,185 @@
+"""Opt-in validation metrics for canonical models.
+
+`enable()` swaps each model's `from_payload` for an instrumented version that
+records call counts, a latency histogram, rejection counts by failure reason
+and accepted records per (exchange, symbol). `disable()` restores the
+original classmethods, so when metrics are off the hot path is exactly the
+uninstrumented code. Callers that cached a bound `from_payload` before
+`enable()` keep the version they cached.
+
+Rejection reasons are normalized to their message template (`bids[17]`
+becomes `bids[]`, `custom[foo]` becomes `custom[]`) and capped at
+`MAX_REJECTION_REASONS` per model, beyond which they count as `"other"`. A
+nested candle rejection is counted under `CandleV1` only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+import threading
+import time
+from typing import Any, Callable
+
+from .market_data import CandleV1, ContextualCandleV1, OrderBookSnapshotV1, TickV1
+from .market_snapshot import MarketSnapshotV1
+
+INSTRUMENTED_MODELS: tuple[Any, ...] = (TickV1, OrderBookSnapshotV1, CandleV1, ContextualCandleV1, MarketSnapshotV1)
+
+# Bucket i counts calls with latency in [2**(i-1), 2**i) ns; the last bucket is open-ended.
+LATENCY_BUCKETS = 40
+MAX_REJECTION_REASONS = 64
+OTHER_REASON = "other"
+
+# Greedy so that keys containing "]" are still blanked out entirely.
+_SUBSCRIPT = re.compile(r"\[.*\]", re.DOTALL)
+
+_lock = threading.Lock()
+_originals: dict[Any, classmethod] = {}
+_started_at = time.monotonic()
+_calls: dict[str, int] = {}
+_latencies: dict[str, list[int]] = {}
+_rejections: dict[str, dict[str, int]] = {}
+_throughput: dict[tuple[str, str], int] = {}
+# Per-thread nesting depth and the rejection already counted by an inner from_payload.
+_nesting = threading.local()
+
+
+@dataclass(frozen=True)
+class ModelMetrics:
+    calls: int
+    rejections: dict[str, int]
+    latency_histogram_ns: dict[int, int]
+
+    def latency_quantile_ns(self, quantile: float) -> int | None:
+        """Upper bound of the histogram bucket holding `quantile` of the calls."""
+        total = sum(self.latency_histogram_ns.values())
+        if total == 0:
+            return None
+        threshold = quantile * total
+        seen = 0
+        for upper_bound, count in sorted(self.latency_histogram_ns.items()):
+            seen += count
+            if seen >= threshold:
+                return upper_bound
+        return max(self.latency_histogram_ns)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    window_seconds: float
+    models: dict[str, ModelMetrics]
+    throughput: dict[tuple[str, str], int]
+
+    def records_per_second(self, exchange: str, symbol: str) -> float:
+        count = self.throughput.get((exchange, symbol), 0)
+        return count / self.window_seconds if self.window_seconds > 0 else 0.0
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Instrument every model's `from_payload`; a no-op when already enabled."""
+    with _lock:
+        if _originals:
+            return
+        for model in INSTRUMENTED_MODELS:
+            original = model.__dict__["from_payload"]
+            _originals[model] = original
+            model.from_payload = _instrumented(model.__name__, original.__func__)
+
+
+def disable() -> None:
+    """Restore the original `from_payload` classmethods; collected metrics are kept."""
+    with _lock:
+        for model, original in _originals.items():
+            model.from_payload = original
+        _originals.clear()
+
+
+def reset() -> None:
+    """Clear collected metrics and restart the throughput window."""
+    global _started_at
+    with _lock:
+        _calls.clear()
+        _latencies.clear()
+        _rejections.clear()
+        _throughput.clear()
+        _started_at = time.monotonic()
+
+
+def snapshot() -> MetricsSnapshot:
+    with _lock:
+        models = {
+            name: ModelMetrics(
+                calls=calls,
+                rejections=dict(_rejections.get(name, {})),
+                latency_histogram_ns={
+                    1 << bucket: count for bucket, count in enumerate(_latencies.get(name, ())) if count
+                },
+            )
+            for name, calls in _calls.items()
+        }
+        return MetricsSnapshot(
+            window_seconds=time.monotonic() - _started_at,
+            models=models,
+            throughput=dict(_throughput),
+        )
+
+
+def _instrumented(name: str, from_payload: Callable[..., Any]) -> classmethod:
+    def instrumented_from_payload(cls: Any, payload: Any) -> Any:
+        depth = getattr(_nesting, "depth", 0)
+        _nesting.depth = depth + 1
+        started = time.perf_counter_ns()
+        try:
+            record = from_payload(cls, payload)
+        except (KeyError, ValueError) as exc:
+            if getattr(_nesting, "counted", None) is exc:
+                reason = None
+            else:
+                _nesting.counted = exc
+                reason = _rejection_template(exc)
+            _observe(name, time.perf_counter_ns() - started, reason, None, rejected=True)
+            raise
+        finally:
+            _nesting.depth = depth
+            if depth == 0:
+                _nesting.counted = None
+        _observe(name, time.perf_counter_ns() - started, None, record)
+        return record
+
+    instrumented_from_payload.__name__ = "from_payload"
+    instrumented_from_payload.__doc__ = from_payload.__doc__
+    return classmethod(instrumented_from_payload)
+
+
+def _rejection_template(exc: Exception) -> str:
+    """Rejection reason with payload-specific subscripts (indexes, custom keys) blanked out."""
+    if isinstance(exc, KeyError):
+        return f"missing required field {exc}."
+    return _SUBSCRIPT.sub("[]", str(exc))
+
+
+def _observe(name: str, elapsed_ns: int, reason: str | None, record: Any, *, rejected: bool = False) -> None:
+    bucket = min(elapsed_ns.bit_length(), LATENCY_BUCKETS - 1)
+    with _lock:
+        _calls[name] = _calls.get(name, 0) + 1
+        histogram = _latencies.get(name)
+        if histogram is None:
+            histogram = _latencies[name] = [0] * LATENCY_BUCKETS
+        histogram[bucket] += 1
+        if rejected:
+            if reason is not None:
+                reasons = _rejections.setdefault(name, {})
+                if reason not in reasons and len(reasons) >= MAX_REJECTION_REASONS:
+                    reason = OTHER_REASON
+                reasons[reason] = reasons.get(reason, 0) + 1
+            return
+        if isinstance(record, ContextualCandleV1):
+            # The nested CandleV1.from_payload call already counted this stream.
+            return
+        key = (getattr(record, "exchange", None) or getattr(record, "source", ""), record.symbol)
+        _throughput[key] = _throughput.get(key, 0) + 1
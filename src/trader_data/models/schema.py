@@ -0,0 +1,197 @@
+"""Declarative payload schemas compiled into specialized validators.
+
+Each model declares, per `schema_version`, an ordered list of steps:
+`Field` reads and checks one payload key, `Check` raises when a condition
+over already-read fields holds, and `Compute` rebinds a field from a helper
+expression. `compile_from_payload` turns those specs into the source of a
+single straight-line `from_payload` classmethod, once at import time, so
+validation runs without any per-field dispatch. Steps run in declaration
+order, which fixes both the error raised first and its message.
+
+Generated `str` and `float` checks inline the common case (an exact `str`
+with content, a finite `float`) and fall back to `_as_str`/`_as_float` for
+everything else, so messages are identical to the helpers'.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import linecache
+import math
+from typing import Any, Sequence
+
+from .timestamps import parse_timestamp
+
+FIELD_KINDS = ("raw", "str", "optional_str", "float", "timestamp")
+NORMALIZERS = ("upper", "lower")
+
+
+def _as_str(value: object, field_name: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{field_name} must be a non-empty string.")
+    return value.strip()
+
+
+def _as_float(value: object, field_name: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{field_name} must be numeric.")
+    converted = float(value)
+    if not math.isfinite(converted):
+        raise ValueError(f"{field_name} must be finite.")
+    return converted
+
+
+# Names every generated validator relies on; added to its namespace when absent.
+_HELPERS: dict[str, Any] = {
+    "_as_str": _as_str,
+    "_as_float": _as_float,
+    "_isfinite": math.isfinite,
+    "_parse_timestamp": parse_timestamp,
+}
+
+
+@dataclass(frozen=True)
+class Field:
+    """Read payload key `name` into the local of the same name.
+
+    `default` is a source expression used when the key is absent; without it
+    the key is required and a missing key raises `KeyError`.
+    """
+
+    name: str
+    kind: str = "raw"
+    normalize: str | None = None
+    default: str | None = None
+
+
+@dataclass(frozen=True)
+class Check:
+    """Raise `ValueError(message)` when the source expression `condition` is true."""
+
+    condition: str
+    message: str
+
+
+@dataclass(frozen=True)
+class Compute:
+    """Rebind the local `name` to the value of the source expression `expression`."""
+
+    name: str
+    expression: str
+
+
+@dataclass(frozen=True)
+class SchemaSpec:
+    """Ordered validation steps for one `schema_version` of a model.
+
+    Every `Field`/`Compute` name that does not start with an underscore is
+    passed to the model constructor, alongside `schema_version`.
+    """
+
+    version: str
+    steps: tuple[Field | Check | Compute, ...]
+
+
+def compile_from_payload(
+    model_name: str,
+    specs: Sequence[SchemaSpec],
+    *,
+    namespace: dict[str, Any] | None = None,
+    required_keys: Sequence[str] = (),
+    strict_version: bool = False,
+) -> classmethod:
+    """Compile `specs` into a `from_payload` classmethod.
+
+    `namespace` is the globals dict the validator runs in, normally the
+    defining module's `globals()`, so `Check`/`Compute` expressions can use
+    anything defined in that module by the time the validator is called.
+    `required_keys` adds an up-front check that reports every absent key at
+    once. With `strict_version` the `schema_version` value must itself be a
+    non-empty string (and is stripped) before it is matched.
+    """
+    if not specs:
+        raise ValueError("at least one schema spec is required.")
+    versions = [spec.version for spec in specs]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"duplicate schema_version in specs for {model_name}.")
+
+    lines = ["def from_payload(cls, payload):"]
+    if required_keys:
+        lines.append(f"    _missing = [key for key in {tuple(required_keys)!r} if key not in payload]")
+        lines.append("    if _missing:")
+        lines.append("        raise ValueError(f\"Missing required keys: {', '.join(_missing)}\")")
+    if strict_version:
+        lines.append('    _version = _as_str(payload["schema_version"], "schema_version")')
+    else:
+        lines.append('    _version = payload.get("schema_version")')
+    for spec in specs:
+        lines.append(f"    if _version == {spec.version!r}:")
+        lines.extend(f"        {line}" for line in _compile_steps(spec))
+    if len(versions) == 1:
+        expected = f"'{versions[0]}'"
+    else:
+        expected = "one of " + ", ".join(f"'{version}'" for version in versions)
+    lines.append(f"    raise ValueError({f'Unsupported schema_version; expected {expected}.'!r})")
+
+    source = "\n".join(lines) + "\n"
+    filename = f"<schema {model_name}>"
+    # Registering the source lets tracebacks through validators show the generated lines.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    scope = {} if namespace is None else namespace
+    for helper, value in _HELPERS.items():
+        scope.setdefault(helper, value)
+    defined: dict[str, Any] = {}
+    exec(compile(source, filename, "exec"), scope, defined)
+    function = defined["from_payload"]
+    function.__qualname__ = f"{model_name}.from_payload"
+    function.__source__ = source
+    return classmethod(function)
+
+
+def _compile_steps(spec: SchemaSpec) -> list[str]:
+    lines: list[str] = []
+    outputs: list[str] = []
+    for step in spec.steps:
+        if isinstance(step, Check):
+            lines.append(f"if {step.condition}:")
+            lines.append(f"    raise ValueError({step.message!r})")
+            continue
+        if isinstance(step, Compute):
+            lines.append(f"{step.name} = {step.expression}")
+        else:
+            lines.extend(_compile_field(step))
+        if not step.name.startswith("_") and step.name not in outputs:
+            outputs.append(step.name)
+    arguments = ", ".join([f"schema_version={spec.version!r}"] + [f"{name}={name}" for name in outputs])
+    lines.append(f"return cls({arguments})")
+    return lines
+
+
+def _compile_field(field: Field) -> list[str]:
+    if field.kind not in FIELD_KINDS:
+        raise ValueError(f"unknown field kind '{field.kind}' for {field.name}.")
+    if field.normalize is not None and field.normalize not in NORMALIZERS:
+        raise ValueError(f"unknown normalizer '{field.normalize}' for {field.name}.")
+    name, label = field.name, repr(field.name)
+    read = f"payload[{label}]" if field.default is None else f"payload.get({label}, {field.default})"
+    if field.kind == "raw":
+        return [f"{name} = {read}"]
+    if field.kind == "timestamp":
+        return [f"{name} = _parse_timestamp({read}, {label})"]
+    if field.kind == "float":
+        return [
+            f"{name} = {read}",
+            f"if type({name}) is not float or not _isfinite({name}):",
+            f"    {name} = _as_float({name}, {label})",
+        ]
+    suffix = f".{field.normalize}()" if field.normalize else ""
+    if field.kind == "optional_str":
+        return [f"{name} = _as_str(payload[{label}], {label}){suffix} if payload.get({label}) is not None else None"]
+    lines = [
+        f"{name} = {read}",
+        f"if type({name}) is not str or not ({name} := {name}.strip()):",
+        f"    {name} = _as_str({name}, {label})",
+    ]
+    if suffix:
+        lines.append(f"{name} = {name}{suffix}")
+    return lines
@@ -0,0 +1,86 @@
+"""Shared ISO-8601 timestamp parsing for canonical models.
+
+Provider payloads overwhelmingly carry `YYYY-MM-DDTHH:MM:SS(.fff)Z`. On
+Python 3.11+ `datetime.fromisoformat` reads that shape natively and returns
+a `timezone.utc` datetime, so the fast path skips the `"Z"` rewrite and the
+`astimezone` round-trip. Epoch nanoseconds reuse the midnight offset of the
+previous payload's date, since time-ordered feeds almost always share it.
+Every other input goes through the original, stricter path and error messages.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NANOS_PER_SECOND = 1_000_000_000
+
+_EPOCH_ORDINAL = EPOCH.toordinal()
+_NANOS_PER_DAY = 86_400 * NANOS_PER_SECOND
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_fromisoformat = datetime.fromisoformat
+
+# (YYYY-MM-DD prefix, epoch nanoseconds at that UTC midnight) of the last fast-path payload.
+_cached_date: tuple[str, int] = ("1970-01-01", 0)
+
+
+def parse_timestamp(value: object, field_name: str) -> datetime:
+    """Parse an ISO-8601 string with timezone into an aware UTC datetime."""
+    if type(value) is str and value[-1:] == "Z":
+        try:
+            parsed = _fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is timezone.utc:
+                return parsed
+    return _parse_slow(value, field_name)
+
+
+def parse_trusted_timestamp(value: object) -> datetime:
+    """Read a UTC timestamp written by our own serializers without re-checking it.
+
+    Datetimes pass through untouched; strings go straight to `fromisoformat`.
+    """
+    if type(value) is str:
+        return _fromisoformat(value)
+    return value  # type: ignore[return-value]
+
+
+def parse_epoch_ns(value: object, field_name: str) -> int:
+    """Parse an ISO-8601 string with timezone into UTC epoch nanoseconds.
+
+    Precision is capped at microseconds, matching `parse_timestamp`.
+    """
+    global _cached_date
+
+    parsed = parse_timestamp(value, field_name)
+    time_of_day_us = ((parsed.hour * 60 + parsed.minute) * 60 + parsed.second) * 1_000_000 + parsed.microsecond
+    prefix, day_ns = _cached_date
+    if value[:10] != prefix or value[-1:] != "Z":  # type: ignore[index]
+        day_ns = (parsed.toordinal() - _EPOCH_ORDINAL) * _NANOS_PER_DAY
+        if value[-1:] == "Z" and value[4:5] == "-" and value[10:11] == "T":  # type: ignore[index]
+            _cached_date = (value[:10], day_ns)  # type: ignore[index]
+    return day_ns + time_of_day_us * 1000
+
+
+def to_epoch_ns(value: datetime) -> int:
+    """Convert an aware datetime into UTC epoch nanoseconds."""
+    return (value - EPOCH) // _ONE_MICROSECOND * 1000
+
+
+def from_epoch_ns(value: int) -> datetime:
+    """Convert UTC epoch nanoseconds into an aware UTC datetime (microsecond precision)."""
+    return EPOCH + timedelta(microseconds=value // 1000)
+
+
+def _parse_slow(value: object, field_name: str) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError(f"{field_name} must be an ISO-8601 timestamp string.")
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValueError(f"{field_name} must be a valid ISO-8601 timestamp.") from exc
+    if parsed.tzinfo is None:
+        raise ValueError(f"{field_name} must include timezone information.")
+    return parsed.astimezone(timezone.utc)
@@ -0,0 +1,303 @@
+"""Compact binary wire format for already-validated canonical models.
+
+Frames are little endian and fixed layout per record type::
+
+    header      u8 wire version, u8 record type
+    string      u16 ref; 0 = inline (u16 length + UTF-8 bytes),
+                k > 0 = entry k - 1 of the shared `WireStringTable`
+    timestamp   i64 UTC epoch nanoseconds
+    number      f64
+
+    tick             symbol, exchange, event_time, price, quantity, u8 side, trade_id (inline)
+    candle           symbol, exchange, interval, event_time, open, high, low, close, volume
+    order book       symbol, exchange, event_time, u32 bids, u32 asks, (price, quantity) pairs
+    market snapshot  symbol, source, event_time, ingest_time, price, volume
+
+Decoding reads straight from `bytes`/`memoryview` with `struct.unpack_from`
+and builds the model without re-running `from_payload`: frames must only
+be produced from validated models. Symbols, exchanges, sources and
+intervals are dictionary-encoded when both sides share a string table.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Iterable, Iterator
+
+from .timestamps import from_epoch_ns, to_epoch_ns
+
+WIRE_VERSION = 1
+# Every record in a version 1 frame carries this schema version.
+WIRE_SCHEMA_VERSION = "1.0"
+
+RECORD_TICK = 1
+RECORD_CANDLE = 2
+RECORD_ORDER_BOOK = 3
+RECORD_MARKET_SNAPSHOT = 4
+
+_HEADER = struct.Struct("<BB")
+_U16 = struct.Struct("<H")
+_TICK_BODY = struct.Struct("<qddB")
+_CANDLE_BODY = struct.Struct("<qddddd")
+_BOOK_BODY = struct.Struct("<qII")
+_SNAPSHOT_BODY = struct.Struct("<qqdd")
+_SIDES = ("buy", "sell")
+_SIDE_CODES = {"buy": 0, "sell": 1}
+_MAX_TABLE_SIZE = 0xFFFF
+
+
+class WireStringTable:
+    """Shared dictionary for repeated strings; both ends must build it identically."""
+
+    def __init__(self, strings: Iterable[str] = ()) -> None:
+        self._strings: list[str] = []
+        self._refs: dict[str, int] = {}
+        for value in strings:
+            self.add(value)
+
+    def add(self, value: str) -> int:
+        """Register `value` and return its ref (stable for the table's lifetime)."""
+        ref = self._refs.get(value)
+        if ref is None:
+            if len(self._strings) >= _MAX_TABLE_SIZE:
+                raise ValueError(f"WireStringTable holds at most {_MAX_TABLE_SIZE} strings.")
+            self._strings.append(value)
+            ref = self._refs[value] = len(self._strings)
+        return ref
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def ref(self, value: str) -> int:
+        return self._refs.get(value, 0)
+
+    def lookup(self, ref: int) -> str:
+        if not 0 < ref <= len(self._strings):
+            raise ValueError(f"unknown string table ref {ref}.")
+        return self._strings[ref - 1]
+
+
+def encode_tick(tick: Any, table: WireStringTable | None = None) -> bytes:
+    return b"".join(
+        (
+            _HEADER.pack(WIRE_VERSION, RECORD_TICK),
+            _encode_str(tick.symbol, table),
+            _encode_str(tick.exchange, table),
+            _TICK_BODY.pack(to_epoch_ns(tick.event_time), tick.price, tick.quantity, _SIDE_CODES[tick.side]),
+            _encode_str(tick.trade_id, None),
+        )
+    )
+
+
+def decode_tick(cls: Any, data: bytes | memoryview, table: WireStringTable | None = None) -> Any:
+    record, end = _decode_tick(cls, data, _expect_header(data, RECORD_TICK), table)
+    _expect_end(data, end)
+    return record
+
+
+def encode_candle(candle: Any, table: WireStringTable | None = None) -> bytes:
+    return b"".join(
+        (
+            _HEADER.pack(WIRE_VERSION, RECORD_CANDLE),
+            _encode_str(candle.symbol, table),
+            _encode_str(candle.exchange, table),
+            _encode_str(candle.interval, table),
+            _CANDLE_BODY.pack(
+                to_epoch_ns(candle.event_time), candle.open, candle.high, candle.low, candle.close, candle.volume
+            ),
+        )
+    )
+
+
+def decode_candle(cls: Any, data: bytes | memoryview, table: WireStringTable | None = None) -> Any:
+    record, end = _decode_candle(cls, data, _expect_header(data, RECORD_CANDLE), table)
+    _expect_end(data, end)
+    return record
+
+
+def encode_order_book(snapshot: Any, table: WireStringTable | None = None) -> bytes:
+    bids, asks = snapshot.bids, snapshot.asks
+    levels = [value for level in bids for value in (level.price, level.quantity)]
+    levels.extend(value for level in asks for value in (level.price, level.quantity))
+    return b"".join(
+        (
+            _HEADER.pack(WIRE_VERSION, RECORD_ORDER_BOOK),
+            _encode_str(snapshot.symbol, table),
+            _encode_str(snapshot.exchange, table),
+            _BOOK_BODY.pack(to_epoch_ns(snapshot.event_time), len(bids), len(asks)),
+            struct.pack(f"<{len(levels)}d", *levels),
+        )
+    )
+
+
+def decode_order_book(cls: Any, data: bytes | memoryview, table: WireStringTable | None = None) -> Any:
+    record, end = _decode_order_book(cls, data, _expect_header(data, RECORD_ORDER_BOOK), table)
+    _expect_end(data, end)
+    return record
+
+
+def encode_market_snapshot(snapshot: Any, table: WireStringTable | None = None) -> bytes:
+    return b"".join(
+        (
+            _HEADER.pack(WIRE_VERSION, RECORD_MARKET_SNAPSHOT),
+            _encode_str(snapshot.symbol, table),
+            _encode_str(snapshot.source, table),
+            _SNAPSHOT_BODY.pack(
+                to_epoch_ns(snapshot.event_time), to_epoch_ns(snapshot.ingest_time), snapshot.price, snapshot.volume
+            ),
+        )
+    )
+
+
+def decode_market_snapshot(cls: Any, data: bytes | memoryview, table: WireStringTable | None = None) -> Any:
+    record, end = _decode_market_snapshot(cls, data, _expect_header(data, RECORD_MARKET_SNAPSHOT), table)
+    _expect_end(data, end)
+    return record
+
+
+def iter_frames(data: bytes | memoryview, table: WireStringTable | None = None) -> Iterator[Any]:
+    """Decode a buffer of back-to-back frames of any record type."""
+    from .market_data import CandleV1, OrderBookSnapshotV1, TickV1
+    from .market_snapshot import MarketSnapshotV1
+
+    decoders = {
+        RECORD_TICK: (_decode_tick, TickV1),
+        RECORD_CANDLE: (_decode_candle, CandleV1),
+        RECORD_ORDER_BOOK: (_decode_order_book, OrderBookSnapshotV1),
+        RECORD_MARKET_SNAPSHOT: (_decode_market_snapshot, MarketSnapshotV1),
+    }
+    offset = 0
+    while offset < len(data):
+        version, record_type = _unpack(_HEADER, data, offset)
+        if version != WIRE_VERSION or record_type not in decoders:
+            raise ValueError(f"unsupported frame (version {version}, type {record_type}) at offset {offset}.")
+        decode, cls = decoders[record_type]
+        record, offset = decode(cls, data, offset + _HEADER.size, table)
+        yield record
+
+
+def _decode_tick(cls: Any, data: bytes | memoryview, offset: int, table: WireStringTable | None) -> tuple[Any, int]:
+    symbol, offset = _decode_str(data, offset, table)
+    exchange, offset = _decode_str(data, offset, table)
+    event_ns, price, quantity, side = _unpack(_TICK_BODY, data, offset)
+    trade_id, offset = _decode_str(data, offset + _TICK_BODY.size, None)
+    if side >= len(_SIDES):
+        raise ValueError(f"invalid side code {side}.")
+    record = cls(
+        schema_version=WIRE_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange=exchange,
+        event_time=from_epoch_ns(event_ns),
+        price=price,
+        quantity=quantity,
+        side=_SIDES[side],
+        trade_id=trade_id,
+    )
+    return record, offset
+
+
+def _decode_candle(cls: Any, data: bytes | memoryview, offset: int, table: WireStringTable | None) -> tuple[Any, int]:
+    symbol, offset = _decode_str(data, offset, table)
+    exchange, offset = _decode_str(data, offset, table)
+    interval, offset = _decode_str(data, offset, table)
+    event_ns, open_price, high_price, low_price, close_price, volume = _unpack(_CANDLE_BODY, data, offset)
+    record = cls(
+        schema_version=WIRE_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange=exchange,
+        interval=interval,
+        open=open_price,
+        high=high_price,
+        low=low_price,
+        close=close_price,
+        volume=volume,
+        event_time=from_epoch_ns(event_ns),
+    )
+    return record, offset + _CANDLE_BODY.size
+
+
+def _decode_order_book(
+    cls: Any, data: bytes | memoryview, offset: int, table: WireStringTable | None
+) -> tuple[Any, int]:
+    from .market_data import OrderBookLevelV1
+
+    symbol, offset = _decode_str(data, offset, table)
+    exchange, offset = _decode_str(data, offset, table)
+    event_ns, bid_count, ask_count = _unpack(_BOOK_BODY, data, offset)
+    offset += _BOOK_BODY.size
+    values = _unpack(struct.Struct(f"<{2 * (bid_count + ask_count)}d"), data, offset)
+    levels = [OrderBookLevelV1(price=values[index], quantity=values[index + 1]) for index in range(0, len(values), 2)]
+    record = cls(
+        schema_version=WIRE_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange=exchange,
+        event_time=from_epoch_ns(event_ns),
+        bids=levels[:bid_count],
+        asks=levels[bid_count:],
+    )
+    return record, offset + 16 * (bid_count + ask_count)
+
+
+def _decode_market_snapshot(
+    cls: Any, data: bytes | memoryview, offset: int, table: WireStringTable | None
+) -> tuple[Any, int]:
+    symbol, offset = _decode_str(data, offset, table)
+    source, offset = _decode_str(data, offset, table)
+    event_ns, ingest_ns, price, volume = _unpack(_SNAPSHOT_BODY, data, offset)
+    record = cls(
+        schema_version=WIRE_SCHEMA_VERSION,
+        symbol=symbol,
+        event_time=from_epoch_ns(event_ns),
+        ingest_time=from_epoch_ns(ingest_ns),
+        price=price,
+        volume=volume,
+        source=source,
+    )
+    return record, offset + _SNAPSHOT_BODY.size
+
+
+def _encode_str(value: str, table: WireStringTable | None) -> bytes:
+    if table is not None:
+        ref = table.ref(value)
+        if ref:
+            return _U16.pack(ref)
+    encoded = value.encode()
+    if len(encoded) > 0xFFFF:
+        raise ValueError("wire strings are limited to 65535 bytes.")
+    return b"\0\0" + _U16.pack(len(encoded)) + encoded
+
+
+def _decode_str(data: bytes | memoryview, offset: int, table: WireStringTable | None) -> tuple[str, int]:
+    (ref,) = _unpack(_U16, data, offset)
+    offset += 2
+    if ref:
+        if table is None:
+            raise ValueError("frame uses string table refs but no table was given.")
+        return table.lookup(ref), offset
+    (length,) = _unpack(_U16, data, offset)
+    offset += 2
+    end = offset + length
+    if end > len(data):
+        raise ValueError("truncated wire frame.")
+    return str(data[offset:end], "utf-8"), end
+
+
+def _unpack(layout: struct.Struct, data: bytes | memoryview, offset: int) -> tuple[Any, ...]:
+    try:
+        return layout.unpack_from(data, offset)
+    except struct.error as exc:
+        raise ValueError("truncated wire frame.") from exc
+
+
+def _expect_header(data: bytes | memoryview, record_type: int) -> int:
+    version, actual_type = _unpack(_HEADER, data, 0)
+    if version != WIRE_VERSION:
+        raise ValueError(f"unsupported wire version {version}; expected {WIRE_VERSION}.")
+    if actual_type != record_type:
+        raise ValueError(f"frame holds record type {actual_type}, expected {record_type}.")
+    return _HEADER.size
+
+
+def _expect_end(data: bytes | memoryview, end: int) -> None:
+    if end != len(data):
+        raise ValueError("trailing bytes after wire frame.")
@@ -0,0 +1,15 @@
+"""Order book engines built on canonical snapshots."""
+
+from .analytics import PackedOrderBooks
+from .book import BOOK_SIDES, OrderBook, OrderBookDelta
+from .diff import DeltaBookStore, DeltaFrame, diff_snapshots
+
+__all__ = [
+    "BOOK_SIDES",
+    "DeltaBookStore",
+    "DeltaFrame",
+    "OrderBook",
+    "OrderBookDelta",
+    "PackedOrderBooks",
+    "diff_snapshots",
+]
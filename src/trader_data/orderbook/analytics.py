@@ -0,0 +1,160 @@
+"""Batch order book analytics over packed snapshot levels.
+
+`PackedOrderBooks.from_snapshots` copies the top `depth` levels of many
+`OrderBookSnapshotV1` into four flat, row-major `array('d')` matrices (bid
+and ask price and quantity, `rows x depth`, zero padded), best level first
+whatever the payload order. That is the only
+pass over `OrderBookLevelV1` objects. Every metric then works on whole
+columns: a strided slice pulls level k of every row, and `map` with
+`operator` functions combines columns without running Python bytecode per
+element. Loops run over levels, never over snapshots.
+
+Rows whose book lacks a bid or an ask report NaN for the metrics that need
+both sides.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from heapq import nlargest, nsmallest
+from itertools import compress, repeat
+import math
+from operator import add, attrgetter, ge, le, mul, not_, sub, truediv
+from typing import Callable, Iterable, Sequence
+
+from trader_data.models import OrderBookLevelV1, OrderBookSnapshotV1
+
+_NAN = math.nan
+_PRICE = attrgetter("price")
+
+
+@dataclass(frozen=True)
+class PackedOrderBooks:
+    """Top-of-book levels of many snapshots as zero-padded `rows x depth` matrices."""
+
+    depth: int
+    bid_price: array
+    bid_quantity: array
+    ask_price: array
+    ask_quantity: array
+
+    def __len__(self) -> int:
+        return len(self.bid_price) // self.depth if self.depth else 0
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[OrderBookSnapshotV1], depth: int | None = None) -> "PackedOrderBooks":
+        """Pack the top `depth` levels per side (default: the deepest side seen)."""
+        books = list(snapshots)
+        if depth is None:
+            depth = max((max(len(book.bids), len(book.asks)) for book in books), default=1) or 1
+        if depth < 1:
+            raise ValueError("depth must be >= 1.")
+        padding = [0.0] * depth
+        bid_price, bid_quantity = array("d"), array("d")
+        ask_price, ask_quantity = array("d"), array("d")
+        for book in books:
+            _pack_side(nlargest, book.bids, depth, padding, bid_price, bid_quantity)
+            _pack_side(nsmallest, book.asks, depth, padding, ask_price, ask_quantity)
+        return cls(depth, bid_price, bid_quantity, ask_price, ask_quantity)
+
+    def column(self, matrix: array, level: int) -> array:
+        """Level `level` (0 = best) of every row of one of the packed matrices."""
+        if not 0 <= level < self.depth:
+            raise ValueError(f"level must be in [0, {self.depth}).")
+        return matrix[level :: self.depth]
+
+    def mid(self) -> array:
+        best_bid, best_ask = self.column(self.bid_price, 0), self.column(self.ask_price, 0)
+        return self._two_sided(array("d", map(mul, map(add, best_bid, best_ask), repeat(0.5))))
+
+    def spread(self) -> array:
+        best_bid, best_ask = self.column(self.bid_price, 0), self.column(self.ask_price, 0)
+        return self._two_sided(array("d", map(sub, best_ask, best_bid)))
+
+    def microprice(self) -> array:
+        """Top-level quantity-weighted price: (bid * ask_qty + ask * bid_qty) / (bid_qty + ask_qty)."""
+        best_bid, best_ask = self.column(self.bid_price, 0), self.column(self.ask_price, 0)
+        bid_qty, ask_qty = self.column(self.bid_quantity, 0), self.column(self.ask_quantity, 0)
+        weighted = map(add, map(mul, best_bid, ask_qty), map(mul, best_ask, bid_qty))
+        return self._two_sided(array("d", map(truediv, weighted, _nonzero(map(add, bid_qty, ask_qty)))))
+
+    def imbalance(self, levels: int = 1) -> array:
+        """(bid qty - ask qty) / (bid qty + ask qty) over the top `levels` levels, in [-1, 1]."""
+        bid_qty = self._level_sum(self.bid_quantity, levels)
+        ask_qty = self._level_sum(self.ask_quantity, levels)
+        return array("d", map(truediv, map(sub, bid_qty, ask_qty), _nonzero(map(add, bid_qty, ask_qty))))
+
+    def depth_within_bps(self, bps: float) -> tuple[array, array]:
+        """Bid and ask quantity resting within `bps` basis points of the mid.
+
+        This is the size a market order can take from each side before moving
+        the price by more than `bps`.
+        """
+        if bps < 0:
+            raise ValueError("bps must be >= 0.")
+        mid = self.mid()
+        bid_floor = array("d", map(mul, mid, repeat(1 - bps / 10_000)))
+        ask_ceiling = array("d", map(mul, mid, repeat(1 + bps / 10_000)))
+        # NaN mids compare false, and padded levels carry zero quantity.
+        bid_inside = [
+            map(mul, self.column(self.bid_quantity, level), map(ge, self.column(self.bid_price, level), bid_floor))
+            for level in range(self.depth)
+        ]
+        ask_inside = [
+            map(mul, self.column(self.ask_quantity, level), map(le, self.column(self.ask_price, level), ask_ceiling))
+            for level in range(self.depth)
+        ]
+        bid_depth = array("d", map(sum, zip(*bid_inside)))
+        ask_depth = array("d", map(sum, zip(*ask_inside)))
+        return bid_depth, ask_depth
+
+    def vwap(self, levels: int | None = None) -> array:
+        """Quantity-weighted average price of the top `levels` levels of both sides."""
+        levels = self.depth if levels is None else levels
+        notional = map(
+            add,
+            self._level_sum(self.bid_price, levels, self.bid_quantity),
+            self._level_sum(self.ask_price, levels, self.ask_quantity),
+        )
+        quantity = map(add, self._level_sum(self.bid_quantity, levels), self._level_sum(self.ask_quantity, levels))
+        return array("d", map(truediv, notional, _nonzero(quantity)))
+
+    def _level_sum(self, matrix: array, levels: int, weights: array | None = None) -> array:
+        if not 1 <= levels <= self.depth:
+            raise ValueError(f"levels must be in [1, {self.depth}].")
+        columns = [self.column(matrix, level) for level in range(levels)]
+        if weights is not None:
+            columns = [map(mul, column, self.column(weights, level)) for level, column in enumerate(columns)]
+        # zip regroups the columns into one tuple per row, which sum() reduces in C.
+        return array("d", map(sum, zip(*columns)))
+
+    def _two_sided(self, values: array) -> array:
+        # Level quantities are > 0, so a zero product means an empty side.
+        one_sided = map(not_, map(mul, self.column(self.bid_quantity, 0), self.column(self.ask_quantity, 0)))
+        for row in compress(range(len(values)), one_sided):
+            values[row] = _NAN
+        return values
+
+
+def _pack_side(
+    select: Callable[..., list[OrderBookLevelV1]],
+    levels: Sequence[OrderBookLevelV1],
+    depth: int,
+    padding: list[float],
+    prices: array,
+    quantities: array,
+) -> None:
+    # Snapshot levels are not guaranteed sorted: pick the best `depth` by price, best first.
+    top = select(depth, levels, key=_PRICE)
+    prices.extend([level.price for level in top])
+    quantities.extend([level.quantity for level in top])
+    missing = depth - len(top)
+    if missing:
+        prices.extend(padding[:missing])
+        quantities.extend(padding[:missing])
+
+
+def _nonzero(values: Iterable[float]) -> array:
+    # Empty books would divide by zero; NaN propagates as "undefined" instead.
+    return array("d", [value or _NAN for value in values])
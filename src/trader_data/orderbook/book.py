@@ -0,0 +1,142 @@
+"""Incremental order book maintained from per-level deltas.
+
+`OrderBook` is seeded from an `OrderBookSnapshotV1` and then mutated with
+`OrderBookDelta` updates, so a deep book does not have to be rebuilt for
+every change. Each side keeps a price -> quantity map plus a sorted price
+list with the best price at the end: best bid/ask is O(1), top-k depth is
+O(k), and locating a level is O(log n) via `bisect`. Adding or removing a
+level shifts the list tail (a memmove), while the far more common
+quantity change on an existing level is a single dict write.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+import math
+from typing import Iterable
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, OrderBookLevelV1, OrderBookSnapshotV1
+
+BOOK_SIDES = ("bid", "ask")
+
+
+@dataclass(frozen=True)
+class OrderBookDelta:
+    """Absolute new quantity for one price level; quantity 0 removes the level."""
+
+    side: str
+    price: float
+    quantity: float
+
+
+class _BookSide:
+    __slots__ = ("quantities", "keys", "sign")
+
+    def __init__(self, sign: float) -> None:
+        # Keys are price * sign so that the best level is always keys[-1]:
+        # bids are stored as-is (highest last), asks negated (lowest last).
+        self.quantities: dict[float, float] = {}
+        self.keys: list[float] = []
+        self.sign = sign
+
+    def set(self, price: float, quantity: float) -> None:
+        quantities = self.quantities
+        if quantity == 0:
+            if quantities.pop(price, None) is not None:
+                keys = self.keys
+                del keys[bisect_left(keys, price * self.sign)]
+            return
+        if price not in quantities:
+            insort(self.keys, price * self.sign)
+        quantities[price] = quantity
+
+    def best(self) -> OrderBookLevelV1 | None:
+        if not self.keys:
+            return None
+        price = self.keys[-1] * self.sign
+        return OrderBookLevelV1(price=price, quantity=self.quantities[price])
+
+    def top(self, depth: int | None) -> list[OrderBookLevelV1]:
+        keys = self.keys if depth is None else self.keys[-depth:] if depth > 0 else []
+        sign, quantities = self.sign, self.quantities
+        return [OrderBookLevelV1(price=key * sign, quantity=quantities[key * sign]) for key in reversed(keys)]
+
+
+class OrderBook:
+    """Mutable, sorted order book for one (exchange, symbol)."""
+
+    def __init__(self, symbol: str, exchange: str, event_time: datetime) -> None:
+        self.symbol = symbol
+        self.exchange = exchange
+        self.event_time = event_time
+        self._bids = _BookSide(1.0)
+        self._asks = _BookSide(-1.0)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: OrderBookSnapshotV1) -> "OrderBook":
+        book = cls(snapshot.symbol, snapshot.exchange, snapshot.event_time)
+        book.reset(snapshot)
+        return book
+
+    def reset(self, snapshot: OrderBookSnapshotV1) -> None:
+        """Replace the book contents with `snapshot`."""
+        if (snapshot.symbol, snapshot.exchange) != (self.symbol, self.exchange):
+            raise ValueError("snapshot symbol/exchange does not match the book.")
+        self._bids = _BookSide(1.0)
+        self._asks = _BookSide(-1.0)
+        for level in snapshot.bids:
+            self._bids.quantities[level.price] = level.quantity
+        for level in snapshot.asks:
+            self._asks.quantities[level.price] = level.quantity
+        self._bids.keys = sorted(self._bids.quantities)
+        self._asks.keys = sorted(-price for price in self._asks.quantities)
+        self.event_time = snapshot.event_time
+
+    def apply(self, delta: OrderBookDelta) -> None:
+        price, quantity = delta.price, delta.quantity
+        if not (math.isfinite(price) and price > 0):
+            raise ValueError("delta price must be finite and > 0.")
+        if not (math.isfinite(quantity) and quantity >= 0):
+            raise ValueError("delta quantity must be finite and >= 0.")
+        if delta.side == "bid":
+            self._bids.set(price, quantity)
+        elif delta.side == "ask":
+            self._asks.set(price, quantity)
+        else:
+            raise ValueError("delta side must be 'bid' or 'ask'.")
+
+    def apply_deltas(self, deltas: Iterable[OrderBookDelta], event_time: datetime | None = None) -> None:
+        for delta in deltas:
+            self.apply(delta)
+        if event_time is not None:
+            self.event_time = event_time
+
+    def best_bid(self) -> OrderBookLevelV1 | None:
+        return self._bids.best()
+
+    def best_ask(self) -> OrderBookLevelV1 | None:
+        return self._asks.best()
+
+    def bids(self, depth: int | None = None) -> list[OrderBookLevelV1]:
+        """Top `depth` bid levels, best first (all levels when depth is None)."""
+        return self._bids.top(depth)
+
+    def asks(self, depth: int | None = None) -> list[OrderBookLevelV1]:
+        """Top `depth` ask levels, best first (all levels when depth is None)."""
+        return self._asks.top(depth)
+
+    def __len__(self) -> int:
+        return len(self._bids.keys) + len(self._asks.keys)
+
+    def to_snapshot(self, depth: int | None = None) -> OrderBookSnapshotV1:
+        """Build an `OrderBookSnapshotV1` with levels sorted best first."""
+        return OrderBookSnapshotV1(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=self.symbol,
+            exchange=self.exchange,
+            event_time=self.event_time,
+            bids=self.bids(depth),
+            asks=self.asks(depth),
+        )
@@ -0,0 +1,136 @@
+"""Order book snapshot diffs and keyframe + delta storage.
+
+`diff_snapshots` turns two full snapshots of one book into the minimal list
+of `OrderBookDelta` that takes the first to the second: one delta per level
+whose quantity changed, appeared, or disappeared (quantity 0).
+
+`DeltaBookStore` keeps a full keyframe every `keyframe_every` snapshots and
+only the diff for the snapshots in between. `book_at(t)` bisects to the
+last keyframe at or before `t` and applies at most `keyframe_every - 1`
+delta frames, so rebuild cost is bounded no matter how long the history is.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from trader_data.models import OrderBookLevelV1, OrderBookSnapshotV1
+
+from .book import OrderBook, OrderBookDelta
+
+DEFAULT_KEYFRAME_EVERY = 100
+
+
+def _side_deltas(side: str, old: list[OrderBookLevelV1], new: list[OrderBookLevelV1]) -> list[OrderBookDelta]:
+    before = {level.price: level.quantity for level in old}
+    after = {level.price: level.quantity for level in new}
+    deltas = [
+        OrderBookDelta(side=side, price=price, quantity=quantity)
+        for price, quantity in after.items()
+        if before.get(price) != quantity
+    ]
+    deltas.extend(OrderBookDelta(side=side, price=price, quantity=0.0) for price in before if price not in after)
+    return deltas
+
+
+def diff_snapshots(old: OrderBookSnapshotV1, new: OrderBookSnapshotV1) -> list[OrderBookDelta]:
+    """Minimal deltas that turn `old` into `new`: bid changes first, then ask changes."""
+    if (old.symbol, old.exchange) != (new.symbol, new.exchange):
+        raise ValueError("snapshots must share symbol and exchange.")
+    return _side_deltas("bid", old.bids, new.bids) + _side_deltas("ask", old.asks, new.asks)
+
+
+@dataclass(frozen=True)
+class DeltaFrame:
+    """Deltas that take the stored book from the previous frame to `event_time`."""
+
+    event_time: datetime
+    deltas: tuple[OrderBookDelta, ...]
+
+
+class _Segment:
+    __slots__ = ("keyframe", "frame_times", "frames")
+
+    def __init__(self, keyframe: OrderBookSnapshotV1) -> None:
+        self.keyframe = keyframe
+        self.frame_times: list[datetime] = []
+        self.frames: list[DeltaFrame] = []
+
+
+class DeltaBookStore:
+    """Snapshot history of one (exchange, symbol) as keyframes plus delta frames.
+
+    Snapshots must be appended in non-decreasing `event_time` order.
+    """
+
+    def __init__(self, *, keyframe_every: int = DEFAULT_KEYFRAME_EVERY) -> None:
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every must be >= 1.")
+        self._keyframe_every = keyframe_every
+        self._segments: list[_Segment] = []
+        self._keyframe_times: list[datetime] = []
+        self._last: OrderBookSnapshotV1 | None = None
+        self._snapshot_levels = 0
+        self._stored_levels = 0
+
+    def append(self, snapshot: OrderBookSnapshotV1) -> DeltaFrame | None:
+        """Store `snapshot`; returns its delta frame, or None when it became a keyframe."""
+        last = self._last
+        if last is not None:
+            if (snapshot.symbol, snapshot.exchange) != (last.symbol, last.exchange):
+                raise ValueError("snapshot symbol/exchange does not match the store.")
+            if snapshot.event_time < last.event_time:
+                raise ValueError("snapshots must be appended in event_time order.")
+        self._last = snapshot
+        self._snapshot_levels += len(snapshot.bids) + len(snapshot.asks)
+        segments = self._segments
+        if last is None or len(segments[-1].frames) + 1 >= self._keyframe_every:
+            segments.append(_Segment(snapshot))
+            self._keyframe_times.append(snapshot.event_time)
+            self._stored_levels += len(snapshot.bids) + len(snapshot.asks)
+            return None
+        frame = DeltaFrame(event_time=snapshot.event_time, deltas=tuple(diff_snapshots(last, snapshot)))
+        segment = segments[-1]
+        segment.frame_times.append(frame.event_time)
+        segment.frames.append(frame)
+        self._stored_levels += len(frame.deltas)
+        return frame
+
+    def extend(self, snapshots: Iterable[OrderBookSnapshotV1]) -> None:
+        for snapshot in snapshots:
+            self.append(snapshot)
+
+    def book_at(self, timestamp: datetime) -> OrderBookSnapshotV1 | None:
+        """The book as of `timestamp` (latest snapshot at or before it), or None if earlier than all."""
+        index = bisect_right(self._keyframe_times, timestamp) - 1
+        if index < 0:
+            return None
+        segment = self._segments[index]
+        book = OrderBook.from_snapshot(segment.keyframe)
+        for frame in segment.frames[: bisect_right(segment.frame_times, timestamp)]:
+            book.apply_deltas(frame.deltas, frame.event_time)
+        return book.to_snapshot()
+
+    def replay(self) -> Iterator[OrderBookSnapshotV1]:
+        """Rebuild every stored snapshot in order, applying each delta frame once."""
+        for segment in self._segments:
+            book = OrderBook.from_snapshot(segment.keyframe)
+            yield book.to_snapshot()
+            for frame in segment.frames:
+                book.apply_deltas(frame.deltas, frame.event_time)
+                yield book.to_snapshot()
+
+    @property
+    def keyframes(self) -> int:
+        return len(self._segments)
+
+    @property
+    def compression_ratio(self) -> float:
+        """Levels in the appended snapshots per level or delta actually stored."""
+        return self._snapshot_levels / self._stored_levels if self._stored_levels else 1.0
+
+    def __len__(self) -> int:
+        return sum(1 + len(segment.frames) for segment in self._segments)
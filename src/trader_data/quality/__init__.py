@@ -0,0 +1,25 @@
+"""Streaming data-quality checks for canonical models."""
+
+from .engine import (
+    CHECK_DUPLICATE,
+    CHECK_MONOTONICITY,
+    CHECK_PRICE_OUTLIER,
+    CHECK_VOLUME_OUTLIER,
+    SEVERITY_CRITICAL,
+    SEVERITY_WARNING,
+    DataQualityEngine,
+    QualityIssue,
+    RotatingBloomFilter,
+)
+
+__all__ = [
+    "CHECK_DUPLICATE",
+    "CHECK_MONOTONICITY",
+    "CHECK_PRICE_OUTLIER",
+    "CHECK_VOLUME_OUTLIER",
+    "SEVERITY_CRITICAL",
+    "SEVERITY_WARNING",
+    "DataQualityEngine",
+    "QualityIssue",
+    "RotatingBloomFilter",
+]
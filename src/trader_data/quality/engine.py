@@ -0,0 +1,258 @@
+"""Bounded-memory streaming data-quality checks.
+
+`DataQualityEngine` runs the DATA_QUALITY.md checks inline on validated
+records. Every check is O(1) per record and state is either fixed-size
+(the duplicate filter) or one small slot per stream. A stream is one
+record type for one (exchange, symbol), and for candles one interval, so
+1m and 1h bars, or ticks and candle closes, never share state:
+
+- timestamp monotonicity per stream,
+- duplicate `trade_id` detection with a rotating Bloom filter,
+- outlier flags from exponentially weighted mean/variance of price
+  log-returns and of volume.
+
+Required field presence and numeric ranges are already enforced by the
+models' `from_payload`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from hashlib import blake2b
+import math
+from typing import Any
+
+from trader_data.models import CandleV1, ContextualCandleV1, MarketSnapshotV1, OrderBookSnapshotV1, TickV1
+
+SEVERITY_CRITICAL = "critical"
+SEVERITY_WARNING = "warning"
+
+CHECK_MONOTONICITY = "timestamp_monotonicity"
+CHECK_DUPLICATE = "duplicate_trade_id"
+CHECK_PRICE_OUTLIER = "price_outlier"
+CHECK_VOLUME_OUTLIER = "volume_outlier"
+
+
+@dataclass(frozen=True)
+class QualityIssue:
+    check: str
+    severity: str
+    exchange: str
+    symbol: str
+    event_time: datetime
+    detail: str
+
+
+class RotatingBloomFilter:
+    """Approximate set of recently seen keys with fixed memory.
+
+    Two generations of `capacity` keys each are kept; once the current one
+    is full the older one is discarded. Keys are remembered for at least
+    `capacity` insertions. Membership has no false negatives within that
+    window and roughly `error_rate` false positives per generation.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.capacity = capacity
+        self._bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._current = bytearray((self._bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def __contains__(self, key: str) -> bool:
+        positions = self._positions(key)
+        return _has_all(self._current, positions) or _has_all(self._previous, positions)
+
+    def add(self, key: str) -> bool:
+        """Insert `key`; return True if it was (probably) already present."""
+        positions = self._positions(key)
+        if _has_all(self._current, positions) or _has_all(self._previous, positions):
+            return True
+        if self._count >= self.capacity:
+            self._previous, self._current = self._current, self._previous
+            self._current[:] = bytes(len(self._current))
+            self._count = 0
+        current = self._current
+        for position in positions:
+            current[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+        return False
+
+    def _positions(self, key: str) -> list[int]:
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        bits = self._bits
+        return [(first + index * second) % bits for index in range(self._hashes)]
+
+
+def _has_all(bits: bytearray, positions: list[int]) -> bool:
+    for position in positions:
+        if not bits[position >> 3] & (1 << (position & 7)):
+            return False
+    return True
+
+
+class _EwStats:
+    """Exponentially weighted mean/variance (West's incremental form).
+
+    Until `1 / alpha` samples have been seen the weight is `1 / count`, i.e.
+    plain running statistics, so early estimates are not biased towards zero.
+    """
+
+    __slots__ = ("mean", "variance", "count")
+
+    def __init__(self) -> None:
+        self.mean = 0.0
+        self.variance = 0.0
+        self.count = 0
+
+    def zscore_then_update(self, value: float, alpha: float) -> float | None:
+        count = self.count
+        self.count = count + 1
+        if count == 0:
+            self.mean = value
+            return None
+        alpha = max(alpha, 1 / (count + 1))
+        diff = value - self.mean
+        std = math.sqrt(self.variance)
+        zscore = diff / std if std > 0 else None
+        increment = alpha * diff
+        self.mean += increment
+        self.variance = (1 - alpha) * (self.variance + diff * increment)
+        return zscore
+
+
+class _StreamState:
+    __slots__ = ("last_event_time", "last_price", "returns", "volumes")
+
+    def __init__(self) -> None:
+        self.last_event_time: datetime | None = None
+        self.last_price: float | None = None
+        self.returns = _EwStats()
+        self.volumes = _EwStats()
+
+
+class DataQualityEngine:
+    """Inline data-quality checks over a stream of canonical records.
+
+    Memory is one `_StreamState` per (record type, exchange, symbol,
+    candle interval) plus the fixed-size duplicate filter. `MarketSnapshotV1` streams are keyed by `source` in
+    place of exchange; `ContextualCandleV1` is checked through its candle.
+    """
+
+    def __init__(
+        self,
+        *,
+        duplicate_window: int = 1_000_000,
+        duplicate_error_rate: float = 0.001,
+        outlier_zscore: float = 6.0,
+        outlier_half_life: int = 500,
+        outlier_warmup: int = 30,
+    ) -> None:
+        if outlier_half_life < 1:
+            raise ValueError("outlier_half_life must be >= 1.")
+        self._duplicates = RotatingBloomFilter(duplicate_window, duplicate_error_rate)
+        self._streams: dict[tuple[str, str, str, str], _StreamState] = {}
+        self._zscore = outlier_zscore
+        self._alpha = 1 - 0.5 ** (1 / outlier_half_life)
+        self._warmup = outlier_warmup
+        self.issue_counts: dict[str, int] = {}
+
+    def check(self, record: Any) -> list[QualityIssue]:
+        """Run every applicable check on `record` and return the issues found."""
+        if isinstance(record, ContextualCandleV1):
+            record = record.candle
+        interval = ""
+        if isinstance(record, TickV1):
+            exchange, price, volume = record.exchange, record.price, record.quantity
+        elif isinstance(record, CandleV1):
+            exchange, price, volume = record.exchange, record.close, record.volume
+            interval = record.interval
+        elif isinstance(record, MarketSnapshotV1):
+            exchange, price, volume = record.source, record.price, record.volume
+        elif isinstance(record, OrderBookSnapshotV1):
+            exchange, price, volume = record.exchange, None, None
+        else:
+            raise TypeError(f"Unsupported record type: {type(record).__name__}")
+
+        symbol, event_time = record.symbol, record.event_time
+        stream = (type(record).__name__, exchange, symbol, interval)
+        state = self._streams.get(stream)
+        if state is None:
+            state = self._streams[stream] = _StreamState()
+        issues: list[QualityIssue] = []
+
+        last_event_time = state.last_event_time
+        if last_event_time is not None and event_time < last_event_time:
+            issues.append(
+                QualityIssue(
+                    CHECK_MONOTONICITY,
+                    SEVERITY_CRITICAL,
+                    exchange,
+                    symbol,
+                    event_time,
+                    f"event_time {event_time.isoformat()} precedes {last_event_time.isoformat()}.",
+                )
+            )
+        else:
+            state.last_event_time = event_time
+
+        if isinstance(record, TickV1) and self._duplicates.add(f"{exchange}\x1f{symbol}\x1f{record.trade_id}"):
+            issues.append(
+                QualityIssue(
+                    CHECK_DUPLICATE,
+                    SEVERITY_CRITICAL,
+                    exchange,
+                    symbol,
+                    event_time,
+                    f"trade_id {record.trade_id!r} was already seen.",
+                )
+            )
+
+        if price is not None:
+            if state.last_price is not None:
+                log_return = math.log(price / state.last_price)
+                zscore = state.returns.zscore_then_update(log_return, self._alpha)
+                if self._is_outlier(zscore, state.returns.count):
+                    issues.append(
+                        QualityIssue(
+                            CHECK_PRICE_OUTLIER,
+                            SEVERITY_WARNING,
+                            exchange,
+                            symbol,
+                            event_time,
+                            f"price {price} is a {zscore:+.1f} sigma move.",
+                        )
+                    )
+            state.last_price = price
+        if volume is not None:
+            zscore = state.volumes.zscore_then_update(volume, self._alpha)
+            if self._is_outlier(zscore, state.volumes.count):
+                issues.append(
+                    QualityIssue(
+                        CHECK_VOLUME_OUTLIER,
+                        SEVERITY_WARNING,
+                        exchange,
+                        symbol,
+                        event_time,
+                        f"volume {volume} is {zscore:+.1f} sigma from its rolling mean.",
+                    )
+                )
+
+        for issue in issues:
+            self.issue_counts[issue.check] = self.issue_counts.get(issue.check, 0) + 1
+        return issues
+
+    def _is_outlier(self, zscore: float | None, count: int) -> bool:
+        return zscore is not None and count > self._warmup and abs(zscore) > self._zscore
@@ -0,0 +1,5 @@
+"""Deterministic replay of canonical market data streams."""
+
+from .engine import PACING_MODES, ReplayEngine, ReplayEvent
+
+__all__ = ["PACING_MODES", "ReplayEngine", "ReplayEvent"]
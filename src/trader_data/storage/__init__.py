@@ -0,0 +1,14 @@
+"""Local storage engines for canonical models."""
+
+from .snapshot_store import DEFAULT_LOCK_STRIPES, LagHistogram, SnapshotStore
+from .tick_store import DEFAULT_SEGMENT_ROWS, DEFAULT_TRADE_ID_WIDTH, TickColumns, TickStore
+
+__all__ = [
+    "DEFAULT_LOCK_STRIPES",
+    "DEFAULT_SEGMENT_ROWS",
+    "DEFAULT_TRADE_ID_WIDTH",
+    "LagHistogram",
+    "SnapshotStore",
+    "TickColumns",
+    "TickStore",
+]
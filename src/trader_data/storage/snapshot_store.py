@@ -0,0 +1,180 @@
+"""In-memory latest-state store for `MarketSnapshotV1` with ingest-lag metrics.
+
+The store keeps the newest snapshot per (symbol, source). Each symbol maps
+to an immutable `{source: snapshot}` mapping that writers replace wholesale
+(copy-on-write), so readers never lock: a lookup sees either the previous or
+the next mapping, never a half-applied update. Writers serialize per symbol
+through a small set of striped locks, so threads updating different
+symbols rarely contend. The version, stale count and lag histograms are
+kept per stripe under that same lock and only summed when read.
+
+Every accepted update also records `ingest_time - event_time` in a log2
+histogram per source, which is what `lag_stats()` reports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from operator import add, attrgetter
+import threading
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from trader_data.models import MarketSnapshotV1
+
+DEFAULT_LOCK_STRIPES = 16
+# Bucket i counts lags in [2**(i-1), 2**i) ns; the last bucket is open-ended (about 9 minutes and up).
+LAG_BUCKETS = 40
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_EVENT_TIME = attrgetter("event_time")
+_EMPTY: Mapping[str, MarketSnapshotV1] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class LagHistogram:
+    count: int
+    max_ns: int
+    buckets_ns: dict[int, int]
+
+    def quantile_ns(self, quantile: float) -> int | None:
+        """Upper bound of the histogram bucket holding `quantile` of the updates."""
+        if self.count == 0:
+            return None
+        threshold = quantile * self.count
+        seen = 0
+        for upper_bound, bucket_count in sorted(self.buckets_ns.items()):
+            seen += bucket_count
+            if seen >= threshold:
+                return upper_bound
+        return max(self.buckets_ns)
+
+
+class _LagCounter:
+    __slots__ = ("count", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.max_ns = 0
+        self.buckets = [0] * LAG_BUCKETS
+
+
+class _Stripe:
+    __slots__ = ("lock", "version", "stale_updates", "lags")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.version = 0
+        self.stale_updates = 0
+        self.lags: dict[str, _LagCounter] = {}
+
+    def record_lag(self, source: str, lag_ns: int) -> None:
+        lag_ns = max(lag_ns, 0)
+        counter = self.lags.get(source)
+        if counter is None:
+            counter = self.lags[source] = _LagCounter()
+        counter.count += 1
+        counter.max_ns = max(counter.max_ns, lag_ns)
+        counter.buckets[min(lag_ns.bit_length(), LAG_BUCKETS - 1)] += 1
+
+
+class SnapshotStore:
+    """Latest `MarketSnapshotV1` per (symbol, source), safe for concurrent use.
+
+    An update older (by `event_time`) than the stored snapshot for the same
+    (symbol, source) is ignored and counted in `stale_updates`.
+    """
+
+    def __init__(self, *, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        if lock_stripes < 1:
+            raise ValueError("lock_stripes must be >= 1.")
+        self._by_symbol: dict[str, Mapping[str, MarketSnapshotV1]] = {}
+        self._stripes = [_Stripe() for _ in range(lock_stripes)]
+
+    @property
+    def version(self) -> int:
+        """Increases with every accepted update; equal versions mean an unchanged store."""
+        return sum(stripe.version for stripe in self._stripes)
+
+    @property
+    def stale_updates(self) -> int:
+        return sum(stripe.stale_updates for stripe in self._stripes)
+
+    def __len__(self) -> int:
+        return sum(len(sources) for sources in list(self._by_symbol.values()))
+
+    def update(self, snapshot: MarketSnapshotV1) -> bool:
+        """Store `snapshot` unless a newer one is already held; return whether it was stored."""
+        symbol, source = snapshot.symbol, snapshot.source
+        stripe = self._stripes[hash(symbol) % len(self._stripes)]
+        with stripe.lock:
+            current = self._by_symbol.get(symbol, _EMPTY)
+            previous = current.get(source)
+            if previous is not None and snapshot.event_time < previous.event_time:
+                stripe.stale_updates += 1
+                return False
+            sources = dict(current)
+            sources[source] = snapshot
+            self._by_symbol[symbol] = MappingProxyType(sources)
+            stripe.version += 1
+            stripe.record_lag(source, (snapshot.ingest_time - snapshot.event_time) // _ONE_MICROSECOND * 1000)
+        return True
+
+    def update_many(self, snapshots: Iterable[MarketSnapshotV1]) -> int:
+        """Apply `update` to each snapshot; return how many were stored."""
+        return sum(self.update(snapshot) for snapshot in snapshots)
+
+    def get(self, symbol: str, source: str | None = None) -> MarketSnapshotV1 | None:
+        """Latest snapshot for `symbol` from `source`, or from any source when `source` is None."""
+        sources = self._by_symbol.get(symbol)
+        if not sources:
+            return None
+        if source is not None:
+            return sources.get(source)
+        return max(sources.values(), key=_EVENT_TIME)
+
+    def get_many(self, symbols: Iterable[str], source: str | None = None) -> dict[str, MarketSnapshotV1]:
+        """Latest snapshot per symbol (see `get`); symbols without one are left out."""
+        by_symbol = self._by_symbol
+        found: dict[str, MarketSnapshotV1] = {}
+        for symbol in symbols:
+            sources = by_symbol.get(symbol)
+            if not sources:
+                continue
+            if source is None:
+                snapshot = max(sources.values(), key=_EVENT_TIME)
+            else:
+                snapshot = sources.get(source)
+                if snapshot is None:
+                    continue
+            found[symbol] = snapshot
+        return found
+
+    def sources(self, symbol: str) -> Mapping[str, MarketSnapshotV1]:
+        """Read-only `{source: snapshot}` view for `symbol`; later updates do not change it."""
+        return self._by_symbol.get(symbol, _EMPTY)
+
+    def symbols(self) -> list[str]:
+        return sorted(self._by_symbol)
+
+    def lag_stats(self) -> dict[str, LagHistogram]:
+        """`ingest_time - event_time` distribution of accepted updates, per source."""
+        merged: dict[str, _LagCounter] = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                for source, counter in stripe.lags.items():
+                    total = merged.get(source)
+                    if total is None:
+                        total = merged[source] = _LagCounter()
+                    total.count += counter.count
+                    total.max_ns = max(total.max_ns, counter.max_ns)
+                    total.buckets = list(map(add, total.buckets, counter.buckets))
+        return {
+            source: LagHistogram(
+                count=counter.count,
+                max_ns=counter.max_ns,
+                buckets_ns={1 << bucket: hits for bucket, hits in enumerate(counter.buckets) if hits},
+            )
+            for source, counter in merged.items()
+        }
@@ -0,0 +1,303 @@
+"""Memory-mapped append-only tick store with a time-range index.
+
+Ticks are stored per symbol in fixed-capacity segment files under
+`<root>/<exchange>/<symbol>/`, each name percent-encoded into a single path
+component (`/`, `.` and `%` included) so that no symbol can escape the
+store root or nest directories. Every row has the same width, but a segment
+lays its rows out column by column (all event times, then all prices, ...)
+so that a time range maps to contiguous byte ranges per column. Reads mmap
+the segment and hand out `memoryview` slices of those ranges: nothing is
+parsed or copied until the caller asks for row models.
+
+Segment layout (little endian)::
+
+    header   64 bytes: magic, capacity, trade_id width, row count
+    event_time_ns  int64   x capacity
+    price          float64 x capacity
+    quantity       float64 x capacity
+    side           int8    x capacity   (1 = buy, -1 = sell)
+    trade_id       bytes[trade_id_width] x capacity, NUL padded
+
+The sparse index holds the first event time of each segment; within a
+segment the time column is binary searched in place. Rows appended to an
+existing segment are visible to other processes immediately; segments
+created after a store instance first indexed a symbol are not.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import Iterable
+from urllib.parse import quote, unquote
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, TickV1
+from trader_data.models.timestamps import from_epoch_ns, to_epoch_ns
+
+DEFAULT_SEGMENT_ROWS = 262_144
+DEFAULT_TRADE_ID_WIDTH = 32
+
+_MAGIC = b"TDTICK01"
+_HEADER = struct.Struct("<8sIHxxQ")
+_HEADER_SIZE = 64
+_ROW_COUNT_OFFSET = 16
+_ROW_COUNT = struct.Struct("<Q")
+_SEGMENT_SUFFIX = ".ticks"
+_SIDE_CODES = {"buy": 1, "sell": -1}
+_SIDE_NAMES = {1: "buy", -1: "sell"}
+
+
+@dataclass(frozen=True)
+class TickColumns:
+    """Zero-copy column views over a contiguous run of stored ticks."""
+
+    symbol: str
+    exchange: str
+    event_time_ns: memoryview
+    price: memoryview
+    quantity: memoryview
+    side: memoryview
+    trade_id: memoryview
+    trade_id_width: int
+
+    def __len__(self) -> int:
+        return len(self.event_time_ns)
+
+    def row(self, index: int) -> TickV1:
+        width = self.trade_id_width
+        trade_id = bytes(self.trade_id[index * width : (index + 1) * width]).rstrip(b"\0").decode()
+        return TickV1(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            symbol=self.symbol,
+            exchange=self.exchange,
+            event_time=from_epoch_ns(self.event_time_ns[index]),
+            price=self.price[index],
+            quantity=self.quantity[index],
+            side=_SIDE_NAMES[self.side[index]],
+            trade_id=trade_id,
+        )
+
+    def to_rows(self) -> list[TickV1]:
+        return [self.row(index) for index in range(len(self))]
+
+
+class _Segment:
+    def __init__(self, path: Path, capacity: int, trade_id_width: int) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.trade_id_width = trade_id_width
+        self.time_offset = _HEADER_SIZE
+        self.price_offset = self.time_offset + 8 * capacity
+        self.quantity_offset = self.price_offset + 8 * capacity
+        self.side_offset = self.quantity_offset + 8 * capacity
+        self.trade_id_offset = self.side_offset + capacity
+        self.size = self.trade_id_offset + trade_id_width * capacity
+        self._map: mmap.mmap | None = None
+
+    @classmethod
+    def create(cls, path: Path, capacity: int, trade_id_width: int) -> "_Segment":
+        segment = cls(path, capacity, trade_id_width)
+        with open(path, "xb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, capacity, trade_id_width, 0).ljust(_HEADER_SIZE, b"\0"))
+            handle.truncate(segment.size)
+        return segment
+
+    @classmethod
+    def open(cls, path: Path) -> "_Segment":
+        with open(path, "rb") as handle:
+            magic, capacity, trade_id_width, _ = _HEADER.unpack(handle.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a tick segment.")
+        return cls(path, capacity, trade_id_width)
+
+    @property
+    def mapped(self) -> mmap.mmap:
+        if self._map is None:
+            with open(self.path, "rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def row_count(self) -> int:
+        return _ROW_COUNT.unpack_from(self.mapped, _ROW_COUNT_OFFSET)[0]
+
+    def times(self) -> memoryview:
+        return memoryview(self.mapped)[self.time_offset : self.price_offset].cast("q")[: self.row_count()]
+
+    def columns(self, symbol: str, exchange: str, start: int, stop: int) -> TickColumns:
+        view = memoryview(self.mapped)
+        width = self.trade_id_width
+        return TickColumns(
+            symbol=symbol,
+            exchange=exchange,
+            event_time_ns=view[self.time_offset : self.price_offset].cast("q")[start:stop],
+            price=view[self.price_offset : self.quantity_offset].cast("d")[start:stop],
+            quantity=view[self.quantity_offset : self.side_offset].cast("d")[start:stop],
+            side=view[self.side_offset : self.trade_id_offset].cast("b")[start:stop],
+            trade_id=view[self.trade_id_offset + start * width : self.trade_id_offset + stop * width],
+            trade_id_width=width,
+        )
+
+    def write_rows(self, first_row: int, ticks: list[TickV1]) -> None:
+        count = len(ticks)
+        width = self.trade_id_width
+        times = struct.pack(f"<{count}q", *(to_epoch_ns(tick.event_time) for tick in ticks))
+        prices = struct.pack(f"<{count}d", *(tick.price for tick in ticks))
+        quantities = struct.pack(f"<{count}d", *(tick.quantity for tick in ticks))
+        sides = struct.pack(f"<{count}b", *(_SIDE_CODES[tick.side] for tick in ticks))
+        trade_ids = b"".join(_encode_trade_id(tick.trade_id, width) for tick in ticks)
+        fd = os.open(self.path, os.O_WRONLY)
+        try:
+            os.pwrite(fd, times, self.time_offset + 8 * first_row)
+            os.pwrite(fd, prices, self.price_offset + 8 * first_row)
+            os.pwrite(fd, quantities, self.quantity_offset + 8 * first_row)
+            os.pwrite(fd, sides, self.side_offset + first_row)
+            os.pwrite(fd, trade_ids, self.trade_id_offset + width * first_row)
+            # The row count is published last so readers never see unwritten rows.
+            os.pwrite(fd, _ROW_COUNT.pack(first_row + count), _ROW_COUNT_OFFSET)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def _path_component(name: str) -> str:
+    """`name` as one safe directory name; `unquote` reverses it."""
+    return quote(name, safe="").replace(".", "%2E")
+
+
+def _encode_trade_id(trade_id: str, width: int) -> bytes:
+    encoded = trade_id.encode()
+    if len(encoded) > width or b"\0" in encoded:
+        raise ValueError(f"trade_id must be at most {width} bytes without NUL characters.")
+    return encoded.ljust(width, b"\0")
+
+
+@dataclass
+class _SymbolIndex:
+    segments: list[_Segment]
+    first_ns: list[int]
+    last_ns: int | None
+
+
+class TickStore:
+    """Append-only, per-symbol tick store for one exchange.
+
+    Appends must be in non-decreasing `event_time` order per symbol. Column
+    views returned by `read_range` keep their segment mapped; release them
+    before calling `close`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        exchange: str,
+        *,
+        segment_rows: int = DEFAULT_SEGMENT_ROWS,
+        trade_id_width: int = DEFAULT_TRADE_ID_WIDTH,
+    ) -> None:
+        if segment_rows < 1 or trade_id_width < 1:
+            raise ValueError("segment_rows and trade_id_width must be >= 1.")
+        if sys.byteorder != "little":
+            raise RuntimeError("TickStore column views require a little-endian host.")
+        self.exchange = exchange
+        self.root = Path(root) / _path_component(exchange)
+        self.segment_rows = segment_rows
+        self.trade_id_width = trade_id_width
+        self._indexes: dict[str, _SymbolIndex] = {}
+
+    def symbols(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(unquote(path.name) for path in self.root.iterdir() if path.is_dir())
+
+    def append(self, ticks: Iterable[TickV1]) -> int:
+        """Append ticks, grouped per symbol into one write per column; return the row count."""
+        grouped: dict[str, list[TickV1]] = {}
+        for tick in ticks:
+            if tick.exchange != self.exchange:
+                raise ValueError(f"tick exchange '{tick.exchange}' does not match store '{self.exchange}'.")
+            grouped.setdefault(tick.symbol, []).append(tick)
+        for symbol, symbol_ticks in grouped.items():
+            self._append_symbol(symbol, symbol_ticks)
+        return sum(len(symbol_ticks) for symbol_ticks in grouped.values())
+
+    def read_range(self, symbol: str, start: datetime, end: datetime) -> list[TickColumns]:
+        """Column views for ticks with `start <= event_time < end`, one per touched segment."""
+        index = self._index(symbol)
+        start_ns, end_ns = to_epoch_ns(start), to_epoch_ns(end)
+        first = max(bisect_left(index.first_ns, start_ns) - 1, 0)
+        views: list[TickColumns] = []
+        for position in range(first, len(index.segments)):
+            if index.first_ns[position] >= end_ns:
+                break
+            segment = index.segments[position]
+            times = segment.times()
+            lo = bisect_left(times, start_ns)
+            hi = bisect_left(times, end_ns, lo)
+            if hi > lo:
+                views.append(segment.columns(symbol, self.exchange, lo, hi))
+        return views
+
+    def close(self) -> None:
+        for index in self._indexes.values():
+            for segment in index.segments:
+                segment.close()
+        self._indexes.clear()
+
+    def _index(self, symbol: str) -> _SymbolIndex:
+        index = self._indexes.get(symbol)
+        if index is not None:
+            return index
+        segments: list[_Segment] = []
+        directory = self.root / _path_component(symbol)
+        if directory.is_dir():
+            for path in sorted(directory.glob(f"*{_SEGMENT_SUFFIX}")):
+                segment = _Segment.open(path)
+                if segment.row_count():
+                    segments.append(segment)
+        first_ns = [segment.times()[0] for segment in segments]
+        last_ns = segments[-1].times()[-1] if segments else None
+        index = self._indexes[symbol] = _SymbolIndex(segments, first_ns, last_ns)
+        return index
+
+    def _append_symbol(self, symbol: str, ticks: list[TickV1]) -> None:
+        index = self._index(symbol)
+        last_ns = index.last_ns
+        for tick in ticks:
+            event_ns = to_epoch_ns(tick.event_time)
+            if last_ns is not None and event_ns < last_ns:
+                raise ValueError(f"ticks for {symbol} must be appended in event_time order.")
+            last_ns = event_ns
+            _encode_trade_id(tick.trade_id, self.trade_id_width)
+
+        offset = 0
+        while offset < len(ticks):
+            segment = index.segments[-1] if index.segments else None
+            used = segment.row_count() if segment is not None else 0
+            if segment is None or used >= segment.capacity:
+                segment = self._new_segment(symbol, len(index.segments))
+                index.segments.append(segment)
+                index.first_ns.append(to_epoch_ns(ticks[offset].event_time))
+                used = 0
+            chunk = ticks[offset : offset + segment.capacity - used]
+            segment.write_rows(used, chunk)
+            offset += len(chunk)
+        index.last_ns = last_ns
+
+    def _new_segment(self, symbol: str, number: int) -> _Segment:
+        directory = self.root / _path_component(symbol)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{number:08d}{_SEGMENT_SUFFIX}"
+        if path.exists():
+            # Left empty by an interrupted append; the index skipped it.
+            return _Segment.open(path)
+        return _Segment.create(path, self.segment_rows, self.trade_id_width)
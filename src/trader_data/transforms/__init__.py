@@ -0,0 +1,25 @@
+"""Streaming transforms over canonical models."""
+
+from .asof_join import asof_join, asof_join_batches
+from .candles import DEFAULT_INTERVALS, TickCandleAggregator, interval_to_ns
+from .indicators import ATR, EMA, IndicatorEngine, RealizedVolatility, RollingMax, RollingMin, RollingVWAP, ZScore
+from .rollups import DEFAULT_ROLLUP_CAPACITY, DEFAULT_ROLLUP_INTERVALS, CandleRollupCache
+
+__all__ = [
+    "ATR",
+    "DEFAULT_INTERVALS",
+    "DEFAULT_ROLLUP_CAPACITY",
+    "DEFAULT_ROLLUP_INTERVALS",
+    "EMA",
+    "CandleRollupCache",
+    "IndicatorEngine",
+    "RealizedVolatility",
+    "RollingMax",
+    "RollingMin",
+    "RollingVWAP",
+    "TickCandleAggregator",
+    "ZScore",
+    "asof_join",
+    "asof_join_batches",
+    "interval_to_ns",
+]
@@ -0,0 +1,163 @@
+"""Streaming as-of join that builds `ContextualCandleV1` records.
+
+`asof_join` walks a candle stream once, alongside time-sorted sentiment,
+regime and news streams, advancing one cursor per stream. Each context item
+is visited a constant number of times, so a join costs
+O(candles + context items) instead of a search per candle.
+
+Context streams are given per `(exchange, symbol)`, keyed like the
+normalized candle fields (for example `("binance", "BTCUSDT")`), as
+iterables of `(timestamp, value)` pairs; a candle only ever sees its own
+symbol's context. A candle is joined as of its `event_time`: sentiment and
+regime take the latest value no older than `tolerance`; news takes every
+item inside `news_lookback`.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, ContextualCandleV1
+
+DEFAULT_TOLERANCE = timedelta(minutes=5)
+DEFAULT_BATCH_SIZE = 10_000
+
+StreamKey = tuple[str, str]
+
+_EXHAUSTED = object()
+_NO_CONTEXT: Mapping[StreamKey, Any] = MappingProxyType({})
+
+
+class _AsOfCursor:
+    """Latest `(timestamp, value)` at or before the last `advance` time."""
+
+    __slots__ = ("_items", "_name", "_pending", "time", "value")
+
+    def __init__(self, items: Iterable[tuple[datetime, Any]], name: str) -> None:
+        self._items = iter(items)
+        self._name = name
+        self._pending: Any = next(self._items, _EXHAUSTED)
+        self.time: datetime | None = None
+        self.value: Any = None
+
+    def advance(self, until: datetime) -> None:
+        for _ in self.consume(until):
+            pass
+
+    def consume(self, until: datetime) -> Iterator[tuple[datetime, Any]]:
+        """Step over every item at or before `until`, yielding each one."""
+        pending = self._pending
+        while pending is not _EXHAUSTED and pending[0] <= until:
+            if self.time is not None and pending[0] < self.time:
+                raise ValueError(f"{self._name} stream must be sorted by timestamp.")
+            self.time, self.value = pending
+            self._pending = pending = next(self._items, _EXHAUSTED)
+            yield self.time, self.value
+
+    def value_as_of(self, at: datetime, tolerance: timedelta, default: Any) -> Any:
+        if self.time is None or at - self.time > tolerance:
+            return default
+        return self.value
+
+
+class _WindowCursor:
+    """All values with a timestamp in `(until - lookback, until]`."""
+
+    __slots__ = ("_cursor", "_lookback", "_window")
+
+    def __init__(self, items: Iterable[tuple[datetime, Any]], name: str, lookback: timedelta) -> None:
+        self._cursor = _AsOfCursor(items, name)
+        self._lookback = lookback
+        self._window: deque[tuple[datetime, Any]] = deque()
+
+    def advance(self, until: datetime) -> list[Any]:
+        window = self._window
+        window.extend(self._cursor.consume(until))
+        cutoff = until - self._lookback
+        while window and window[0][0] <= cutoff:
+            window.popleft()
+        return [value for _, value in window]
+
+
+class _SymbolContext:
+    """Context cursors and last candle time of one (exchange, symbol)."""
+
+    __slots__ = ("sentiment", "regime", "news", "previous")
+
+    def __init__(
+        self,
+        key: StreamKey,
+        sentiment: Iterable[tuple[datetime, float]],
+        regimes: Iterable[tuple[datetime, str]],
+        news: Iterable[tuple[datetime, Mapping[str, Any]]],
+        lookback: timedelta,
+    ) -> None:
+        label = "/".join(key)
+        self.sentiment = _AsOfCursor(sentiment, f"sentiment for {label}")
+        self.regime = _AsOfCursor(regimes, f"regimes for {label}")
+        self.news = _WindowCursor(news, f"news for {label}", lookback)
+        self.previous: datetime | None = None
+
+
+def asof_join(
+    candles: Iterable[CandleV1],
+    *,
+    sentiment: Mapping[StreamKey, Iterable[tuple[datetime, float]]] = _NO_CONTEXT,
+    regimes: Mapping[StreamKey, Iterable[tuple[datetime, str]]] = _NO_CONTEXT,
+    news: Mapping[StreamKey, Iterable[tuple[datetime, Mapping[str, Any]]]] = _NO_CONTEXT,
+    tolerance: timedelta = DEFAULT_TOLERANCE,
+    news_lookback: timedelta | None = None,
+) -> Iterator[ContextualCandleV1]:
+    """Yield one `ContextualCandleV1` per candle, in input order.
+
+    Symbols may interleave, but each (exchange, symbol)'s candles must be
+    sorted by `event_time`. Sentiment falls back to 0.0 and regime to None
+    when the symbol has no value within `tolerance`. `news_lookback`
+    defaults to `tolerance`. Context values are trusted as-is: sentiment
+    must already lie in [-1, 1] and news dicts are shared, not copied,
+    between the candles that see them.
+    """
+    if tolerance < timedelta(0):
+        raise ValueError("tolerance must be >= 0.")
+    lookback = tolerance if news_lookback is None else news_lookback
+    if lookback < timedelta(0):
+        raise ValueError("news_lookback must be >= 0.")
+    contexts: dict[StreamKey, _SymbolContext] = {}
+    for candle in candles:
+        key = (candle.exchange, candle.symbol)
+        context = contexts.get(key)
+        if context is None:
+            context = contexts[key] = _SymbolContext(
+                key, sentiment.get(key, ()), regimes.get(key, ()), news.get(key, ()), lookback
+            )
+        at = candle.event_time
+        if context.previous is not None and at < context.previous:
+            raise ValueError(f"candles for {key[0]}/{key[1]} must be sorted by event_time.")
+        context.previous = at
+        context.sentiment.advance(at)
+        context.regime.advance(at)
+        yield ContextualCandleV1(
+            schema_version=MARKET_DATA_SCHEMA_VERSION,
+            candle=candle,
+            sentiment=context.sentiment.value_as_of(at, tolerance, 0.0),
+            regime=context.regime.value_as_of(at, tolerance, None),
+            news=context.news.advance(at),
+        )
+
+
+def asof_join_batches(
+    candles: Iterable[CandleV1],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **options: Any,
+) -> Iterator[list[ContextualCandleV1]]:
+    """Run `asof_join` and yield its output in lists of up to `batch_size`."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1.")
+    joined = asof_join(candles, **options)
+    while batch := list(islice(joined, batch_size)):
+        yield batch
@@ -0,0 +1,150 @@
+"""Incremental tick-to-candle aggregation.
+
+`TickCandleAggregator` builds `CandleV1` bars for several intervals from a
+single pass over a tick stream. Each tick costs O(1) per interval: it lands
+in its bucket's open bar, and bars are emitted once the per-(exchange,
+symbol) watermark passes the bucket end plus the allowed lateness.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, TickV1
+from trader_data.models.timestamps import NANOS_PER_SECOND, from_epoch_ns, to_epoch_ns
+
+DEFAULT_INTERVALS = ("1s", "1m", "5m", "1h")
+
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86_400}
+
+
+def interval_to_ns(interval: str) -> int:
+    """Convert an interval label such as `"5m"` into nanoseconds."""
+    count, unit = interval[:-1], interval[-1:]
+    if unit not in _INTERVAL_UNITS or not count.isdigit() or int(count) <= 0:
+        raise ValueError(f"Unsupported interval '{interval}'; expected <count><s|m|h|d>.")
+    return int(count) * _INTERVAL_UNITS[unit] * NANOS_PER_SECOND
+
+
+@dataclass
+class _OpenBar:
+    start_ns: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class TickCandleAggregator:
+    """Aggregates ticks into candles for several intervals at once.
+
+    Candles are stamped with their bucket start. Buckets without ticks emit
+    nothing. A bar closes once its stream's watermark (latest event time)
+    minus `allowed_lateness` reaches the bucket end; a tick arriving for a
+    closed bucket is dropped and counted in `late_ticks` for that interval.
+    """
+
+    def __init__(
+        self,
+        intervals: Sequence[str] = DEFAULT_INTERVALS,
+        *,
+        allowed_lateness: timedelta = timedelta(0),
+    ) -> None:
+        if not intervals:
+            raise ValueError("at least one interval is required.")
+        if allowed_lateness < timedelta(0):
+            raise ValueError("allowed_lateness must be >= 0.")
+        self._intervals = [(interval, interval_to_ns(interval)) for interval in intervals]
+        self._lateness_ns = allowed_lateness // timedelta(microseconds=1) * 1000
+        # Per (exchange, symbol): bars ending at or before the cutoff are final.
+        self._cutoffs: dict[tuple[str, str], int] = {}
+        self._bars: dict[tuple[str, str, str], dict[int, _OpenBar]] = {}
+        self.late_ticks: dict[str, int] = {interval: 0 for interval in intervals}
+
+    def update(self, tick: TickV1) -> list[CandleV1]:
+        """Add one tick and return the candles it closed, oldest first."""
+        event_ns = to_epoch_ns(tick.event_time)
+        stream = (tick.exchange, tick.symbol)
+        cutoff = self._cutoffs.get(stream)
+        if cutoff is None or event_ns - self._lateness_ns > cutoff:
+            cutoff = self._cutoffs[stream] = event_ns - self._lateness_ns
+
+        price = tick.price
+        for interval, interval_ns in self._intervals:
+            start_ns = event_ns - event_ns % interval_ns
+            if start_ns + interval_ns <= cutoff:
+                self.late_ticks[interval] += 1
+                continue
+            key = (tick.exchange, tick.symbol, interval)
+            bars = self._bars.setdefault(key, {})
+            bar = bars.get(start_ns)
+            if bar is None:
+                bars[start_ns] = _OpenBar(start_ns, price, price, price, price, tick.quantity)
+            else:
+                if price > bar.high:
+                    bar.high = price
+                elif price < bar.low:
+                    bar.low = price
+                bar.close = price
+                bar.volume += tick.quantity
+        return self._close(stream, cutoff)
+
+    def extend(self, ticks: Iterable[TickV1]) -> list[CandleV1]:
+        candles: list[CandleV1] = []
+        for tick in ticks:
+            candles.extend(self.update(tick))
+        return candles
+
+    def advance(self, until: datetime) -> list[CandleV1]:
+        """Close bars of every stream whose bucket ends at or before `until`.
+
+        Use this as a heartbeat so quiet symbols still emit their last bars.
+        """
+        until_ns = to_epoch_ns(until)
+        candles: list[CandleV1] = []
+        for stream, cutoff in self._cutoffs.items():
+            if until_ns > cutoff:
+                self._cutoffs[stream] = until_ns
+            candles.extend(self._close(stream, self._cutoffs[stream]))
+        return candles
+
+    def flush(self) -> list[CandleV1]:
+        """Emit every open bar regardless of the watermark; call at end of stream."""
+        candles: list[CandleV1] = []
+        for stream in self._cutoffs:
+            candles.extend(self._close(stream, None))
+        return candles
+
+    def _close(self, stream: tuple[str, str], cutoff_ns: int | None) -> list[CandleV1]:
+        exchange, symbol = stream
+        candles: list[CandleV1] = []
+        for interval, interval_ns in self._intervals:
+            key = (exchange, symbol, interval)
+            bars = self._bars.get(key)
+            if not bars:
+                continue
+            # Open bars per key are bounded by allowed_lateness / interval + 1.
+            ready = sorted(
+                start_ns for start_ns in bars if cutoff_ns is None or start_ns + interval_ns <= cutoff_ns
+            )
+            for start_ns in ready:
+                candles.append(_to_candle(bars.pop(start_ns), exchange, symbol, interval))
+        return candles
+
+
+def _to_candle(bar: _OpenBar, exchange: str, symbol: str, interval: str) -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange=exchange,
+        interval=interval,
+        open=bar.open,
+        high=bar.high,
+        low=bar.low,
+        close=bar.close,
+        volume=bar.volume,
+        event_time=from_epoch_ns(bar.start_ns),
+    )
@@ -0,0 +1,257 @@
+"""Streaming indicators with O(1) updates and fixed memory per stream.
+
+Each indicator keeps only what its window needs: running sums for VWAP and
+z-score, monotonic deques for rolling min/max, a single smoothed value for
+EMA and ATR. Windows count updates, not wall-clock time. `value` is None
+until an indicator has seen enough updates (a full window, or `period`
+true ranges for ATR); EMA is seeded with its first input.
+
+`IndicatorEngine` keeps a separate set of indicators per (exchange,
+symbol), feeds them `TickV1` or `CandleV1` records, and returns the ready
+values as a flat `{name: float}` map that fits `ContextualCandleV1.custom`.
+Ticks count as bars whose high, low and close are the trade price.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any, Callable, Mapping
+
+from trader_data.models import CandleV1, TickV1
+
+
+def _bar(record: TickV1 | CandleV1) -> tuple[float, float, float, float]:
+    """(high, low, close, volume) of a candle, or of a tick seen as a one-trade bar."""
+    if isinstance(record, TickV1):
+        return record.price, record.price, record.price, record.quantity
+    return record.high, record.low, record.close, record.volume
+
+
+def _check_window(window: int, name: str = "window") -> None:
+    if window < 1:
+        raise ValueError(f"{name} must be >= 1.")
+
+
+class EMA:
+    """Exponential moving average with alpha = 2 / (period + 1)."""
+
+    def __init__(self, period: int) -> None:
+        _check_window(period, "period")
+        self._alpha = 2.0 / (period + 1)
+        self.value: float | None = None
+
+    def update(self, value: float) -> float:
+        current = self.value
+        self.value = value if current is None else current + self._alpha * (value - current)
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        return self.update(_bar(record)[2])
+
+
+class RollingVWAP:
+    """Volume-weighted average price over the last `window` updates."""
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self._window: deque[tuple[float, float]] = deque()
+        self._size = window
+        self._notional = 0.0
+        self._volume = 0.0
+        self.value: float | None = None
+
+    def update(self, price: float, volume: float) -> float | None:
+        window = self._window
+        window.append((price, volume))
+        self._notional += price * volume
+        self._volume += volume
+        if len(window) > self._size:
+            old_price, old_volume = window.popleft()
+            self._notional -= old_price * old_volume
+            self._volume -= old_volume
+        if len(window) == self._size:
+            self.value = self._notional / self._volume if self._volume > 0 else None
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        _, _, close, volume = _bar(record)
+        return self.update(close, volume)
+
+
+class RealizedVolatility:
+    """Square root of the sum of squared log returns over the last `window` returns."""
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self._returns: deque[float] = deque()
+        self._size = window
+        self._sum_squares = 0.0
+        self._previous: float | None = None
+        self.value: float | None = None
+
+    def update(self, price: float) -> float | None:
+        previous, self._previous = self._previous, price
+        if previous is None:
+            return self.value
+        log_return = math.log(price / previous)
+        self._returns.append(log_return)
+        self._sum_squares += log_return * log_return
+        if len(self._returns) > self._size:
+            dropped = self._returns.popleft()
+            self._sum_squares -= dropped * dropped
+        if len(self._returns) == self._size:
+            self.value = math.sqrt(max(self._sum_squares, 0.0))
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        return self.update(_bar(record)[2])
+
+
+class ATR:
+    """Average true range with Wilder smoothing, seeded by the mean of the first `period` ranges."""
+
+    def __init__(self, period: int) -> None:
+        _check_window(period, "period")
+        self._period = period
+        self._seen = 0
+        self._seed_sum = 0.0
+        self._previous_close: float | None = None
+        self.value: float | None = None
+
+    def update(self, high: float, low: float, close: float) -> float | None:
+        previous_close, self._previous_close = self._previous_close, close
+        true_range = high - low
+        if previous_close is not None:
+            true_range = max(true_range, abs(high - previous_close), abs(low - previous_close))
+        if self.value is not None:
+            self.value += (true_range - self.value) / self._period
+            return self.value
+        self._seen += 1
+        self._seed_sum += true_range
+        if self._seen == self._period:
+            self.value = self._seed_sum / self._period
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        high, low, close, _ = _bar(record)
+        return self.update(high, low, close)
+
+
+class _MonotonicExtreme:
+    """Rolling extreme over the last `window` updates with a monotonic deque."""
+
+    _keep: Callable[[float, float], bool]
+    _use_high: bool
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self._size = window
+        self._count = 0
+        # (update index, value); values are monotonic, so the extreme is at the front.
+        self._candidates: deque[tuple[int, float]] = deque()
+        self.value: float | None = None
+
+    def update(self, value: float) -> float | None:
+        candidates, keep = self._candidates, self._keep
+        while candidates and not keep(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self._count, value))
+        self._count += 1
+        if candidates[0][0] <= self._count - 1 - self._size:
+            candidates.popleft()
+        if self._count >= self._size:
+            self.value = candidates[0][1]
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        high, low, _, _ = _bar(record)
+        return self.update(high if self._use_high else low)
+
+
+class RollingMin(_MonotonicExtreme):
+    """Lowest low over the last `window` updates."""
+
+    _use_high = False
+
+    @staticmethod
+    def _keep(kept: float, incoming: float) -> bool:
+        return kept < incoming
+
+
+class RollingMax(_MonotonicExtreme):
+    """Highest high over the last `window` updates."""
+
+    _use_high = True
+
+    @staticmethod
+    def _keep(kept: float, incoming: float) -> bool:
+        return kept > incoming
+
+
+class ZScore:
+    """(latest - rolling mean) / rolling standard deviation over the last `window` updates."""
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self._window: deque[float] = deque()
+        self._size = window
+        # Windowed Welford accumulators: far less cancellation than sum / sum of squares.
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.value: float | None = None
+
+    def update(self, value: float) -> float | None:
+        window = self._window
+        window.append(value)
+        delta = value - self._mean
+        self._mean += delta / len(window)
+        self._m2 += delta * (value - self._mean)
+        if len(window) > self._size:
+            dropped = window.popleft()
+            delta = dropped - self._mean
+            self._mean -= delta / len(window)
+            self._m2 -= delta * (dropped - self._mean)
+        if len(window) == self._size:
+            variance = max(self._m2, 0.0) / len(window)
+            self.value = (value - self._mean) / math.sqrt(variance) if variance > 0 else 0.0
+        return self.value
+
+    def feed(self, record: TickV1 | CandleV1) -> float | None:
+        return self.update(_bar(record)[2])
+
+
+class IndicatorEngine:
+    """Named indicators kept per (exchange, symbol).
+
+    `factories` maps an output name to a zero-argument callable returning a
+    fresh indicator, for example `{"ema_20": lambda: EMA(20)}`; each new
+    stream gets its own instances.
+    """
+
+    def __init__(self, factories: Mapping[str, Callable[[], Any]]) -> None:
+        if not factories:
+            raise ValueError("at least one indicator is required.")
+        self._factories = dict(factories)
+        self._streams: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def update(self, record: TickV1 | CandleV1) -> dict[str, float]:
+        """Feed one record to its stream's indicators and return the ready values."""
+        stream = (record.exchange, record.symbol)
+        indicators = self._streams.get(stream)
+        if indicators is None:
+            indicators = self._streams[stream] = {name: factory() for name, factory in self._factories.items()}
+        values: dict[str, float] = {}
+        for name, indicator in indicators.items():
+            value = indicator.feed(record)
+            if value is not None:
+                values[name] = value
+        return values
+
+    def values(self, exchange: str, symbol: str) -> dict[str, float]:
+        """Latest ready values for one stream, without updating it."""
+        indicators = self._streams.get((exchange, symbol), {})
+        return {name: indicator.value for name, indicator in indicators.items() if indicator.value is not None}
+
+    def streams(self) -> list[tuple[str, str]]:
+        return sorted(self._streams)
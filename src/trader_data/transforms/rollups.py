@@ -0,0 +1,138 @@
+"""Multi-timeframe candle rollup cache.
+
+`CandleRollupCache` consumes finalized base-interval candles (for example
+1m) and keeps higher-interval rollups up to date incrementally. Finalized
+candles of every interval live in a bounded ring buffer per (exchange,
+symbol, interval), so "last N 1h candles" is served from memory in O(N)
+without rescanning the base series.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import replace
+from itertools import islice
+from typing import Sequence
+
+from trader_data.models import CandleV1
+from trader_data.models.timestamps import from_epoch_ns, to_epoch_ns
+
+from .candles import interval_to_ns
+
+DEFAULT_ROLLUP_INTERVALS = ("5m", "15m", "1h", "4h", "1d")
+DEFAULT_ROLLUP_CAPACITY = 1_000
+
+
+class _Series:
+    __slots__ = ("finalized", "partial", "partial_start_ns")
+
+    def __init__(self, capacity: int) -> None:
+        self.finalized: deque[CandleV1] = deque(maxlen=capacity)
+        self.partial: CandleV1 | None = None
+        self.partial_start_ns = 0
+
+
+class CandleRollupCache:
+    """Bounded in-memory base and rollup candles per (exchange, symbol).
+
+    Base candles must arrive in event_time order per (exchange, symbol) and
+    be stamped with their bucket start. A rollup bar is finalized when the
+    base candle that ends its bucket arrives, or when a base candle from a
+    later bucket does (gaps are allowed). Rollup volume is the sum and OHLC
+    follow the usual first/max/min/last rules, so `CandleV1` invariants hold.
+    """
+
+    def __init__(
+        self,
+        base_interval: str = "1m",
+        intervals: Sequence[str] = DEFAULT_ROLLUP_INTERVALS,
+        *,
+        capacity: int = DEFAULT_ROLLUP_CAPACITY,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        base_ns = interval_to_ns(base_interval)
+        self._base_interval = base_interval
+        self._base_ns = base_ns
+        self._rollups: list[tuple[str, int]] = []
+        for interval in intervals:
+            interval_ns = interval_to_ns(interval)
+            if interval_ns <= base_ns or interval_ns % base_ns:
+                raise ValueError(f"interval '{interval}' must be a larger multiple of '{base_interval}'.")
+            self._rollups.append((interval, interval_ns))
+        self._capacity = capacity
+        self._series: dict[tuple[str, str, str], _Series] = {}
+        self._last_base_ns: dict[tuple[str, str], int] = {}
+
+    @property
+    def intervals(self) -> list[str]:
+        return [self._base_interval] + [interval for interval, _ in self._rollups]
+
+    def add(self, candle: CandleV1) -> list[CandleV1]:
+        """Add one finalized base candle; return the rollup candles it finalized."""
+        if candle.interval != self._base_interval:
+            raise ValueError(f"expected '{self._base_interval}' candles, got '{candle.interval}'.")
+        stream = (candle.exchange, candle.symbol)
+        start_ns = to_epoch_ns(candle.event_time)
+        last_ns = self._last_base_ns.get(stream)
+        if last_ns is not None and start_ns <= last_ns:
+            raise ValueError("base candles must arrive in increasing event_time order per symbol.")
+        self._last_base_ns[stream] = start_ns
+        self._series_for(stream, self._base_interval).finalized.append(candle)
+
+        finalized: list[CandleV1] = []
+        for interval, interval_ns in self._rollups:
+            series = self._series_for(stream, interval)
+            bucket_ns = start_ns - start_ns % interval_ns
+            partial = series.partial
+            if partial is not None and series.partial_start_ns != bucket_ns:
+                series.finalized.append(partial)
+                finalized.append(partial)
+                partial = None
+            if partial is None:
+                series.partial_start_ns = bucket_ns
+                partial = replace(candle, interval=interval, event_time=from_epoch_ns(bucket_ns))
+            else:
+                partial = replace(
+                    partial,
+                    high=max(partial.high, candle.high),
+                    low=min(partial.low, candle.low),
+                    close=candle.close,
+                    volume=partial.volume + candle.volume,
+                )
+            if start_ns + self._base_ns == bucket_ns + interval_ns:
+                series.finalized.append(partial)
+                finalized.append(partial)
+                partial = None
+            series.partial = partial
+        return finalized
+
+    def last(
+        self, exchange: str, symbol: str, interval: str, count: int, *, include_partial: bool = False
+    ) -> list[CandleV1]:
+        """Up to `count` most recent candles, oldest first.
+
+        With `include_partial` the still-forming rollup bar, if any, is the
+        last element.
+        """
+        series = self._series.get((exchange, symbol, interval))
+        if series is None:
+            if interval not in self.intervals:
+                raise ValueError(f"interval '{interval}' is not cached.")
+            return []
+        if count <= 0:
+            return []
+        partial = series.partial if include_partial else None
+        take = count - 1 if partial is not None else count
+        candles = list(islice(reversed(series.finalized), take))
+        candles.reverse()
+        if partial is not None:
+            candles.append(partial)
+        return candles
+
+    def _series_for(self, stream: tuple[str, str], interval: str) -> _Series:
+        key = (stream[0], stream[1], interval)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self._capacity)
+        return series
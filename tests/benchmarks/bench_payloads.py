@@ -0,0 +1,109 @@
+"""Deterministic synthetic payload generators for the benchmark suite."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+from typing import Any
+
+BASE_TIME = datetime(2026, 2, 14, tzinfo=timezone.utc)
+SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT", "DOGEUSDT", "AVAXUSDT", "LINKUSDT")
+
+
+def _timestamp(index: int) -> str:
+    return (BASE_TIME + timedelta(milliseconds=index * 37)).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def tick_payloads(count: int, seed: int = 1) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "schema_version": "1.0",
+            "symbol": rng.choice(SYMBOLS).lower(),
+            "exchange": "binance",
+            "event_time": _timestamp(index),
+            "price": round(rng.uniform(10.0, 100_000.0), 2),
+            "quantity": round(rng.uniform(0.001, 5.0), 6),
+            "side": rng.choice(("buy", "sell")),
+            "trade_id": f"t-{index:010d}",
+        }
+        for index in range(count)
+    ]
+
+
+def order_book_payloads(count: int, depth: int, seed: int = 2) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    payloads = []
+    for index in range(count):
+        mid = rng.uniform(1_000.0, 100_000.0)
+        bids = [{"price": round(mid - level - 0.5, 2), "quantity": rng.uniform(0.01, 10.0)} for level in range(depth)]
+        asks = [{"price": round(mid + level + 0.5, 2), "quantity": rng.uniform(0.01, 10.0)} for level in range(depth)]
+        payloads.append(
+            {
+                "schema_version": "1.0",
+                "symbol": rng.choice(SYMBOLS),
+                "exchange": "binance",
+                "event_time": _timestamp(index),
+                "bids": bids,
+                "asks": asks,
+            }
+        )
+    return payloads
+
+
+def candle_payloads(count: int, seed: int = 3) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    payloads = []
+    for index in range(count):
+        low = rng.uniform(100.0, 1_000.0)
+        high = low + rng.uniform(0.0, 50.0)
+        payloads.append(
+            {
+                "schema_version": "1.0",
+                "symbol": rng.choice(SYMBOLS),
+                "exchange": "binance",
+                "interval": "1m",
+                "open": rng.uniform(low, high),
+                "high": high,
+                "low": low,
+                "close": rng.uniform(low, high),
+                "volume": rng.uniform(0.0, 1_000.0),
+                "event_time": _timestamp(index * 1_622),
+            }
+        )
+    return payloads
+
+
+def contextual_candle_payloads(
+    count: int, news_items: int = 50, custom_keys: int = 200, seed: int = 4
+) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "schema_version": "1.0",
+            "candle": candle,
+            "sentiment": rng.uniform(-1.0, 1.0),
+            "regime": rng.choice(("trend", "range", "volatile")),
+            "news": [
+                {"headline": f"headline {item}", "source": "wire", "score": rng.random()} for item in range(news_items)
+            ],
+            "custom": {f"feature_{key}": rng.uniform(-10.0, 10.0) for key in range(custom_keys)},
+        }
+        for candle in candle_payloads(count, seed=seed)
+    ]
+
+
+def market_snapshot_payloads(count: int, seed: int = 5) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "schema_version": "1.0",
+            "symbol": rng.choice(SYMBOLS).lower(),
+            "event_time": _timestamp(index),
+            "ingest_time": _timestamp(index + 3),
+            "price": rng.uniform(10.0, 100_000.0),
+            "volume": rng.uniform(0.0, 100.0),
+            "source": "provider-sim",
+        }
+        for index in range(count)
+    ]
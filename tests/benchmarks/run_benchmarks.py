@@ -0,0 +1,205 @@
+"""Throughput and allocation benchmarks for model construction and validation.
+
+Usage::
+
+    uv run python tests/benchmarks/run_benchmarks.py --output bench.json
+    uv run python tests/benchmarks/run_benchmarks.py --baseline bench.json
+
+Each case validates a fixed, seeded payload set. `records_per_second` is the
+best of `--repeat` timed runs; allocation figures come from one traced run
+and are reported per record.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass
+import gc
+import json
+import platform
+from pathlib import Path
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bench_payloads  # noqa: E402
+
+from trader_data.models import (  # noqa: E402
+    CandleBatchV1,
+    CandleV1,
+    ContextualCandleV1,
+    MarketSnapshotV1,
+    OrderBookSnapshotV1,
+    TickBatchV1,
+    TickV1,
+)
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    payloads: Callable[[float], list[Any]]
+    run: Callable[[list[Any]], object]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    records: int
+    records_per_second: float
+    peak_bytes_per_record: float
+    retained_bytes_per_record: float
+    allocated_blocks_per_record: float
+
+
+def _scaled(count: int) -> Callable[[float], int]:
+    return lambda scale: max(1, int(count * scale))
+
+
+def _per_row(model: Any, constructor: str = "from_payload") -> Callable[[list[Any]], object]:
+    from_payload = getattr(model, constructor)
+    return lambda payloads: [from_payload(payload) for payload in payloads]
+
+
+def build_cases() -> list[BenchmarkCase]:
+    ticks, candles, snapshots = _scaled(50_000), _scaled(20_000), _scaled(50_000)
+
+    def tick_payloads(scale: float) -> list[Any]:
+        return bench_payloads.tick_payloads(ticks(scale))
+
+    def candle_payloads(scale: float) -> list[Any]:
+        return bench_payloads.candle_payloads(candles(scale))
+
+    cases = [
+        BenchmarkCase("tick.from_payload", tick_payloads, _per_row(TickV1)),
+        BenchmarkCase("tick.from_trusted_payload", tick_payloads, _per_row(TickV1, "from_trusted_payload")),
+        BenchmarkCase("tick_batch.from_payloads", tick_payloads, TickBatchV1.from_payloads),
+        BenchmarkCase("candle.from_payload", candle_payloads, _per_row(CandleV1)),
+        BenchmarkCase("candle_batch.from_payloads", candle_payloads, CandleBatchV1.from_payloads),
+        BenchmarkCase(
+            "contextual_candle.from_payload",
+            lambda scale: bench_payloads.contextual_candle_payloads(_scaled(2_000)(scale)),
+            _per_row(ContextualCandleV1),
+        ),
+        BenchmarkCase(
+            "market_snapshot.from_payload",
+            lambda scale: bench_payloads.market_snapshot_payloads(snapshots(scale)),
+            _per_row(MarketSnapshotV1),
+        ),
+    ]
+    for depth, count in ((1, 20_000), (10, 10_000), (100, 1_000), (1_000, 100)):
+        books = _scaled(count)
+        cases.append(
+            BenchmarkCase(
+                f"order_book_depth_{depth}.from_payload",
+                lambda scale, depth=depth, books=books: bench_payloads.order_book_payloads(books(scale), depth),
+                _per_row(OrderBookSnapshotV1),
+            )
+        )
+    return cases
+
+
+def run_case(case: BenchmarkCase, *, scale: float, repeat: int) -> BenchmarkResult:
+    payloads = case.payloads(scale)
+    records = len(payloads)
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        case.run(payloads)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    output = case.run(payloads)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+    del output
+
+    return BenchmarkResult(
+        name=case.name,
+        records=records,
+        records_per_second=records / best if best > 0 else float("inf"),
+        peak_bytes_per_record=peak / records,
+        retained_bytes_per_record=retained / records,
+        allocated_blocks_per_record=(blocks_after - blocks_before) / records,
+    )
+
+
+def run_suite(*, scale: float = 1.0, repeat: int = 3, only: str | None = None) -> dict[str, Any]:
+    results = [
+        asdict(run_case(case, scale=scale, repeat=repeat))
+        for case in build_cases()
+        if only is None or only in case.name
+    ]
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return one line per case whose throughput fell by more than `threshold`."""
+    previous = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(result["name"])
+        if old is None:
+            continue
+        ratio = result["records_per_second"] / old["records_per_second"]
+        if ratio < 1 - threshold:
+            regressions.append(f"{result['name']}: {ratio:.2f}x of baseline records/s")
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for payload counts.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is reported.")
+    parser.add_argument("--only", help="Run only cases whose name contains this string.")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this path.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous JSON results file.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    report = run_suite(scale=args.scale, repeat=args.repeat, only=args.only)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline is not None:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
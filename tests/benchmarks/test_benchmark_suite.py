@@ -0,0 +1,27 @@
+"""Keeps the benchmark suite runnable; throughput itself is not asserted."""
+
+import bench_payloads
+import run_benchmarks
+
+
+def test_payload_generators_are_deterministic() -> None:
+    assert bench_payloads.tick_payloads(5) == bench_payloads.tick_payloads(5)
+    assert bench_payloads.order_book_payloads(2, depth=3) == bench_payloads.order_book_payloads(2, depth=3)
+
+
+def test_suite_runs_every_case_at_tiny_scale() -> None:
+    report = run_benchmarks.run_suite(scale=0.001, repeat=1)
+
+    names = {result["name"] for result in report["results"]}
+    assert {"tick.from_payload", "order_book_depth_1000.from_payload", "market_snapshot.from_payload"} <= names
+    assert all(result["records_per_second"] > 0 for result in report["results"])
+
+
+def test_compare_flags_throughput_regressions() -> None:
+    baseline = {"results": [{"name": "tick.from_payload", "records_per_second": 100.0}]}
+    current = {"results": [{"name": "tick.from_payload", "records_per_second": 80.0}]}
+
+    regressions = run_benchmarks.compare(current, baseline, threshold=0.1)
+
+    assert regressions == ["tick.from_payload: 0.80x of baseline records/s"]
+    assert run_benchmarks.compare(current, baseline, threshold=0.25) == []
@@ -0,0 +1,73 @@
+"""Async provider fan-out tests for trader-data."""
+
+import asyncio
+
+import pytest
+
+from trader_data.adapters.fanout import (
+    ProviderCallError,
+    ProviderTimeoutError,
+    ThreadedAsyncAdapter,
+    fetch_many,
+)
+from trader_data.adapters.provider_interface import ProviderContext
+
+CONTEXT = ProviderContext(tenant_id="tenant-a", user_id="user-1", request_id="req-1")
+
+
+class _AsyncAdapter:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if symbol == "SLOW":
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.01)
+            if symbol == "BAD":
+                raise RuntimeError("upstream 503")
+            return {"symbol": symbol, "tenant": context.tenant_id}
+        finally:
+            self.in_flight -= 1
+
+
+class _SyncAdapter:
+    def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        return {"symbol": symbol}
+
+
+def test_fetch_many_returns_partial_results_with_typed_errors() -> None:
+    adapter = _AsyncAdapter()
+    symbols = [f"S{index}" for index in range(20)] + ["BAD", "SLOW", "S0"]
+
+    result = asyncio.run(fetch_many(adapter, symbols, CONTEXT, concurrency=4, timeout_seconds=0.2))
+
+    assert list(result.results) == [f"S{index}" for index in range(20)]
+    assert isinstance(result.errors["BAD"], ProviderCallError)
+    assert isinstance(result.errors["BAD"].__cause__, RuntimeError)
+    assert isinstance(result.errors["SLOW"], ProviderTimeoutError)
+    assert adapter.max_in_flight == 4
+
+
+def test_cancelling_fetch_many_cancels_outstanding_calls() -> None:
+    adapter = _AsyncAdapter()
+
+    async def run() -> None:
+        task = asyncio.create_task(fetch_many(adapter, ["SLOW", "S1"], CONTEXT, timeout_seconds=30))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert adapter.in_flight == 0
+
+
+def test_threaded_bridge_runs_sync_adapters() -> None:
+    result = asyncio.run(fetch_many(ThreadedAsyncAdapter(_SyncAdapter()), ["BTCUSDT", "ETHUSDT"], CONTEXT))
+
+    assert result.results == {"BTCUSDT": {"symbol": "BTCUSDT"}, "ETHUSDT": {"symbol": "ETHUSDT"}}
+    assert result.errors == {}
@@ -0,0 +1,88 @@
+"""Caching/coalescing adapter tests for trader-data."""
+
+import threading
+
+import pytest
+
+from trader_data.adapters.caching import CacheStats, CachingProviderAdapter
+from trader_data.adapters.provider_interface import ProviderContext
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingAdapter:
+    def __init__(self, release: threading.Event | None = None) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self._release = release
+
+    def fetch_market_context(self, *, symbol: str, context: ProviderContext) -> dict:
+        self.calls.append((symbol, context.tenant_id))
+        if self._release is not None:
+            self._release.wait(timeout=5)
+        return {"symbol": symbol, "call": len(self.calls)}
+
+
+def _context(tenant_id: str = "tenant-a") -> ProviderContext:
+    return ProviderContext(tenant_id=tenant_id, user_id="user-1", request_id="req-1")
+
+
+def test_serves_repeat_calls_from_cache_until_ttl_expires() -> None:
+    clock = _Clock()
+    upstream = _CountingAdapter()
+    adapter = CachingProviderAdapter(upstream, ttl_seconds=5, clock=clock)
+
+    first = adapter.fetch_market_context(symbol="BTCUSDT", context=_context())
+    first["mutated"] = True
+    assert adapter.fetch_market_context(symbol="BTCUSDT", context=_context()) == {"symbol": "BTCUSDT", "call": 1}
+    clock.now = 5.0
+    assert adapter.fetch_market_context(symbol="BTCUSDT", context=_context())["call"] == 2
+    assert adapter.stats == CacheStats(hits=1, misses=2, coalesced=0, evictions=0)
+
+
+def test_scope_controls_tenant_sharing_and_lru_evicts() -> None:
+    upstream = _CountingAdapter()
+    tenant_scoped = CachingProviderAdapter(upstream, ttl_seconds=60, max_entries=2)
+    tenant_scoped.fetch_market_context(symbol="BTCUSDT", context=_context("a"))
+    tenant_scoped.fetch_market_context(symbol="BTCUSDT", context=_context("b"))
+    tenant_scoped.fetch_market_context(symbol="ETHUSDT", context=_context("a"))
+    assert len(upstream.calls) == 3
+    assert tenant_scoped.stats.evictions == 1
+
+    shared = CachingProviderAdapter(_CountingAdapter(), ttl_seconds=60, scope="shared")
+    shared.fetch_market_context(symbol="BTCUSDT", context=_context("a"))
+    shared.fetch_market_context(symbol="BTCUSDT", context=_context("b"))
+    assert shared.stats.hits == 1
+
+
+def test_coalesces_concurrent_identical_requests() -> None:
+    release = threading.Event()
+    upstream = _CountingAdapter(release)
+    adapter = CachingProviderAdapter(upstream, ttl_seconds=60)
+    results: list[dict] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(adapter.fetch_market_context(symbol="BTCUSDT", context=_context())))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while adapter.stats.misses + adapter.stats.coalesced < 8:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(upstream.calls) == 1
+    assert results == [{"symbol": "BTCUSDT", "call": 1}] * 8
+    assert adapter.stats.coalesced == 7
+
+
+def test_rejects_unknown_scope() -> None:
+    with pytest.raises(ValueError):
+        CachingProviderAdapter(_CountingAdapter(), ttl_seconds=1, scope="global")
@@ -0,0 +1,86 @@
+"""Smoke tests for the streaming as-of join."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1
+from trader_data.transforms import asof_join, asof_join_batches
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+BTC = ("binance", "BTCUSDT")
+ETH = ("binance", "ETHUSDT")
+
+
+def _at(minutes: float) -> datetime:
+    return T0 + timedelta(minutes=minutes)
+
+
+def _candle(minute: int, symbol: str = "BTCUSDT") -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        interval="1m",
+        open=100.0,
+        high=101.0,
+        low=99.0,
+        close=100.5,
+        volume=3.0,
+        event_time=_at(minute),
+    )
+
+
+def test_joins_latest_context_within_tolerance() -> None:
+    candles = [_candle(minute) for minute in range(10)]
+    sentiment = [(_at(0.5), 0.2), (_at(2), -0.4)]
+    regimes = [(_at(0), "trend"), (_at(8), "range")]
+    news = [(_at(1), {"headline": "a"}), (_at(3.5), {"headline": "b"})]
+
+    joined = list(
+        asof_join(
+            candles,
+            sentiment={BTC: sentiment},
+            regimes={BTC: regimes},
+            news={BTC: news},
+            tolerance=timedelta(minutes=3),
+            news_lookback=timedelta(minutes=2),
+        )
+    )
+
+    assert [record.sentiment for record in joined] == [0.0, 0.2, -0.4, -0.4, -0.4, -0.4, 0.0, 0.0, 0.0, 0.0]
+    assert [record.regime for record in joined] == [
+        "trend", "trend", "trend", "trend", None, None, None, None, "range", "range"
+    ]
+    assert [[item["headline"] for item in record.news] for record in joined] == [
+        [], ["a"], ["a"], [], ["b"], ["b"], [], [], [], []
+    ]
+    assert all(record.candle is candle for record, candle in zip(joined, candles))
+
+
+def test_context_is_kept_per_symbol() -> None:
+    candles = [_candle(minute, symbol) for minute in range(5) for symbol in ("BTCUSDT", "ETHUSDT")]
+
+    batches = list(
+        asof_join_batches(
+            candles,
+            batch_size=4,
+            sentiment={BTC: [(_at(1), 0.5)], ETH: [(_at(2), -0.3)]},
+            regimes={ETH: [(_at(0), "range")]},
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    flat = [record for batch in batches for record in batch]
+    assert [record.candle for record in flat] == candles
+    assert [record.sentiment for record in flat[:6]] == [0.0, 0.0, 0.5, 0.0, 0.5, -0.3]
+    assert [record.regime for record in flat[:2]] == [None, "range"]
+
+
+def test_rejects_unsorted_streams() -> None:
+    with pytest.raises(ValueError, match="candles for binance/BTCUSDT must be sorted"):
+        list(asof_join([_candle(2), _candle(3, "ETHUSDT"), _candle(1)]))
+    with pytest.raises(ValueError, match="sentiment for binance/BTCUSDT stream must be sorted"):
+        list(asof_join([_candle(5)], sentiment={BTC: [(_at(2), 0.1), (_at(1), 0.2)]}))
+    with pytest.raises(ValueError, match="batch_size"):
+        list(asof_join_batches([], batch_size=0))
@@ -0,0 +1,83 @@
+"""Smoke tests for incremental tick-to-candle aggregation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, TickV1
+from trader_data.transforms import TickCandleAggregator, interval_to_ns
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _tick(seconds: float, price: float, quantity: float = 1.0, symbol: str = "BTCUSDT") -> TickV1:
+    return TickV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=seconds),
+        price=price,
+        quantity=quantity,
+        side="buy",
+        trade_id=f"t-{seconds}",
+    )
+
+
+def test_emits_closed_bars_for_every_interval() -> None:
+    aggregator = TickCandleAggregator(("1s", "1m"))
+
+    assert aggregator.update(_tick(0.1, 100.0)) == []
+    assert aggregator.update(_tick(0.5, 105.0, 2.0)) == []
+    assert aggregator.update(_tick(0.9, 95.0)) == []
+    closed = aggregator.update(_tick(1.2, 101.0))
+
+    assert len(closed) == 1
+    candle = closed[0]
+    assert (candle.interval, candle.open, candle.high, candle.low, candle.close, candle.volume) == (
+        "1s", 100.0, 105.0, 95.0, 95.0, 4.0
+    )
+    assert candle.event_time == T0
+
+    closed = aggregator.update(_tick(61.0, 102.0))
+    assert [(candle.interval, candle.event_time) for candle in closed] == [
+        ("1s", T0 + timedelta(seconds=1)),
+        ("1m", T0),
+    ]
+    assert closed[1].high == 105.0 and closed[1].close == 101.0
+
+
+def test_late_ticks_within_tolerance_are_merged() -> None:
+    aggregator = TickCandleAggregator(("1s",), allowed_lateness=timedelta(seconds=1))
+    aggregator.update(_tick(0.5, 100.0))
+    assert aggregator.update(_tick(1.5, 101.0)) == []
+    assert aggregator.update(_tick(0.7, 99.0)) == []
+
+    closed = aggregator.update(_tick(2.1, 102.0))
+    assert [candle.low for candle in closed] == [99.0]
+
+    assert aggregator.update(_tick(0.8, 50.0)) == []
+    assert aggregator.late_ticks == {"1s": 1}
+
+
+def test_emitted_candles_satisfy_candle_invariants() -> None:
+    aggregator = TickCandleAggregator(("1s", "5m"))
+    prices = [100.0, 100.5, 99.25, 101.0, 98.0, 100.0, 103.0, 97.5]
+    ticks = [
+        _tick(index * 0.4, price, symbol=symbol)
+        for index, price in enumerate(prices)
+        for symbol in ("BTCUSDT", "ETHUSDT")
+    ]
+    candles = aggregator.extend(ticks)
+    candles += aggregator.advance(T0 + timedelta(minutes=5))
+
+    assert {candle.symbol for candle in candles} == {"BTCUSDT", "ETHUSDT"}
+    assert aggregator.flush() == []
+    for candle in candles:
+        payload = {**candle.__dict__, "event_time": candle.event_time.isoformat()}
+        assert CandleV1.from_payload(payload) == candle
+
+
+def test_interval_labels() -> None:
+    assert interval_to_ns("5m") == 300 * 1_000_000_000
+    with pytest.raises(ValueError):
+        interval_to_ns("5x")
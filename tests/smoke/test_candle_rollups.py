@@ -0,0 +1,80 @@
+"""Smoke tests for the multi-timeframe candle rollup cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1
+from trader_data.transforms import CandleRollupCache
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _candle(minute: int, close: float, symbol: str = "BTCUSDT") -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        interval="1m",
+        open=close - 1.0,
+        high=close + 2.0,
+        low=close - 3.0,
+        close=close,
+        volume=1.0,
+        event_time=T0 + timedelta(minutes=minute),
+    )
+
+
+def test_rollups_finalize_when_bucket_completes() -> None:
+    cache = CandleRollupCache(intervals=("5m", "15m"))
+
+    finalized = []
+    for minute in range(15):
+        finalized.extend(cache.add(_candle(minute, 100.0 + minute)))
+
+    assert [(candle.interval, candle.event_time) for candle in finalized] == [
+        ("5m", T0),
+        ("5m", T0 + timedelta(minutes=5)),
+        ("5m", T0 + timedelta(minutes=10)),
+        ("15m", T0),
+    ]
+    hour = cache.last("binance", "BTCUSDT", "15m", 1)[0]
+    assert (hour.open, hour.high, hour.low, hour.close, hour.volume) == (99.0, 116.0, 97.0, 114.0, 15.0)
+    assert [candle.close for candle in cache.last("binance", "BTCUSDT", "5m", 2)] == [109.0, 114.0]
+    assert len(cache.last("binance", "BTCUSDT", "1m", 100)) == 15
+
+
+def test_gap_finalizes_previous_bucket_and_partial_is_optional() -> None:
+    cache = CandleRollupCache(intervals=("5m",))
+    cache.add(_candle(0, 100.0))
+    cache.add(_candle(1, 101.0))
+
+    assert cache.last("binance", "BTCUSDT", "5m", 3) == []
+    partial = cache.last("binance", "BTCUSDT", "5m", 3, include_partial=True)
+    assert [(candle.close, candle.volume) for candle in partial] == [(101.0, 2.0)]
+
+    finalized = cache.add(_candle(7, 107.0))
+    assert [(candle.event_time, candle.close) for candle in finalized] == [(T0, 101.0)]
+
+
+def test_ring_buffers_are_bounded_per_symbol() -> None:
+    cache = CandleRollupCache(intervals=("5m",), capacity=3)
+    for minute in range(30):
+        cache.add(_candle(minute, 100.0 + minute))
+        cache.add(_candle(minute, 10.0 + minute, symbol="ETHUSDT"))
+
+    recent = cache.last("binance", "BTCUSDT", "5m", 10)
+    assert [candle.event_time for candle in recent] == [T0 + timedelta(minutes=m) for m in (15, 20, 25)]
+    assert [candle.close for candle in cache.last("binance", "ETHUSDT", "1m", 2)] == [38.0, 39.0]
+
+
+def test_rejects_bad_input() -> None:
+    with pytest.raises(ValueError, match="larger multiple"):
+        CandleRollupCache(base_interval="1m", intervals=("90s",))
+
+    cache = CandleRollupCache(intervals=("5m",))
+    cache.add(_candle(3, 100.0))
+    with pytest.raises(ValueError, match="increasing event_time"):
+        cache.add(_candle(2, 100.0))
+    with pytest.raises(ValueError, match="not cached"):
+        cache.last("binance", "BTCUSDT", "1h", 1)
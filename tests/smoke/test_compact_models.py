@@ -0,0 +1,96 @@
+"""Smoke tests for compact, interned model representations."""
+
+from dataclasses import fields
+import sys
+
+import pytest
+
+from trader_data.models import CandleV1, OrderBookLevelV1, TickV1
+from trader_data.models.compact import (
+    CANDLE_BYTE_BUDGET,
+    ORDER_BOOK_LEVEL_BYTE_BUDGET,
+    TICK_BYTE_BUDGET,
+    CompactCandle,
+    CompactOrderBookLevel,
+    CompactTick,
+    StringTable,
+    owned_bytes,
+)
+
+TICK = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "exchange": "binance",
+    "event_time": "2026-02-14T12:00:00.123456789Z",
+    "price": 50000.5,
+    "quantity": 0.25,
+    "side": "buy",
+    "trade_id": "t-" + "9" * 30,
+}
+CANDLE = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "exchange": "binance",
+    "interval": "1m",
+    "open": 100.0,
+    "high": 101.0,
+    "low": 99.5,
+    "close": 100.5,
+    "volume": 12.0,
+    "event_time": "2026-02-14T12:00:00Z",
+}
+
+
+def _model_bytes(record: object) -> int:
+    values = [getattr(record, field.name) for field in fields(record)]
+    return sys.getsizeof(record) + sys.getsizeof(record.__dict__) + sum(map(sys.getsizeof, values))
+
+
+def test_compact_tick_round_trips_and_fits_budget() -> None:
+    tick = TickV1.from_payload(TICK)
+    compact = CompactTick.from_model(tick)
+
+    assert compact.to_model() == tick
+    assert compact.event_time == tick.event_time
+    assert owned_bytes(compact) <= TICK_BYTE_BUDGET
+    assert _model_bytes(tick) > 2 * TICK_BYTE_BUDGET
+
+
+def test_compact_candle_round_trips_and_fits_budget() -> None:
+    candle = CandleV1.from_payload(CANDLE)
+    compact = CompactCandle.from_model(candle)
+
+    assert compact.to_model() == candle
+    assert owned_bytes(compact) <= CANDLE_BYTE_BUDGET
+
+
+def test_compact_level_fits_budget() -> None:
+    level = OrderBookLevelV1(price=50000.5, quantity=1.5)
+    compact = CompactOrderBookLevel.from_model(level)
+
+    assert compact.to_model() == level
+    assert owned_bytes(compact) <= ORDER_BOOK_LEVEL_BYTE_BUDGET
+
+
+def test_repeated_strings_share_one_object() -> None:
+    table = StringTable()
+    ticks = [
+        CompactTick("".join(["BTC", "USDT"]), "bin" + "ance", 1_000 + index, 1.0, 1.0, "b" + "uy", f"t-{index}", table)
+        for index in range(3)
+    ]
+
+    assert len({id(tick.symbol) for tick in ticks}) == 1
+    assert len({id(tick.side) for tick in ticks}) == 1
+    assert len(table) == 3
+    assert ticks[0].symbol in table and ticks[0].trade_id not in table
+
+
+def test_compact_records_are_read_only_and_comparable() -> None:
+    compact = CompactTick.from_model(TickV1.from_payload(TICK))
+
+    with pytest.raises(AttributeError):
+        compact.price = 1.0  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        compact.extra = 1  # type: ignore[attr-defined]
+    assert compact == CompactTick.from_model(TickV1.from_payload(TICK))
+    assert len({compact, CompactTick.from_model(TickV1.from_payload(TICK))}) == 1
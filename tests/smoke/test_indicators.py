@@ -0,0 +1,111 @@
+"""Smoke tests for streaming indicators."""
+
+from datetime import datetime, timedelta, timezone
+import math
+import random
+import statistics
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, TickV1
+from trader_data.transforms import (
+    ATR,
+    EMA,
+    IndicatorEngine,
+    RealizedVolatility,
+    RollingMax,
+    RollingMin,
+    RollingVWAP,
+    ZScore,
+)
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _tick(index: int, price: float, quantity: float = 1.0, symbol: str = "BTCUSDT") -> TickV1:
+    return TickV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=index),
+        price=price,
+        quantity=quantity,
+        side="buy",
+        trade_id=str(index),
+    )
+
+
+def _candle(index: int, high: float, low: float, close: float) -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        interval="1m",
+        open=close,
+        high=high,
+        low=low,
+        close=close,
+        volume=1.0,
+        event_time=T0 + timedelta(minutes=index),
+    )
+
+
+def test_rolling_indicators_match_full_window_recomputation() -> None:
+    rng = random.Random(11)
+    prices = [100.0 + rng.uniform(-5.0, 5.0) for _ in range(300)]
+    volumes = [rng.uniform(0.1, 3.0) for _ in prices]
+    window = 20
+    vwap, low, high, zscore, vol = (
+        RollingVWAP(window), RollingMin(window), RollingMax(window), ZScore(window), RealizedVolatility(window)
+    )
+
+    for index, (price, volume) in enumerate(zip(prices, volumes)):
+        vwap.update(price, volume)
+        low.update(price)
+        high.update(price)
+        zscore.update(price)
+        vol.update(price)
+        if index + 1 < window:
+            assert (vwap.value, low.value, zscore.value) == (None, None, None)
+            continue
+        recent, weights = prices[index + 1 - window : index + 1], volumes[index + 1 - window : index + 1]
+        assert vwap.value == pytest.approx(sum(p * w for p, w in zip(recent, weights)) / sum(weights))
+        assert (low.value, high.value) == (min(recent), max(recent))
+        expected_z = (price - statistics.fmean(recent)) / statistics.pstdev(recent)
+        assert zscore.value == pytest.approx(expected_z, rel=1e-9)
+        if index >= window:
+            returns = [math.log(b / a) for a, b in zip(prices[index - window : index], recent)]
+            assert vol.value == pytest.approx(math.sqrt(sum(r * r for r in returns)))
+
+
+def test_ema_and_atr() -> None:
+    ema = EMA(3)
+    assert [ema.update(value) for value in (10.0, 20.0, 20.0)] == [10.0, 15.0, 17.5]
+
+    atr = ATR(2)
+    assert atr.update(11.0, 9.0, 10.0) is None
+    assert atr.update(14.0, 12.0, 13.0) == 3.0  # seed: mean(2, max(2, 4, 2))
+    assert atr.update(13.5, 12.5, 13.0) == 2.0  # Wilder: 3 + (1 - 3) / 2
+
+
+def test_engine_keeps_state_per_stream() -> None:
+    engine = IndicatorEngine({"ema_2": lambda: EMA(2), "max_2": lambda: RollingMax(2)})
+
+    assert engine.update(_tick(0, 100.0)) == {"ema_2": 100.0}
+    assert engine.update(_tick(1, 10.0, symbol="ETHUSDT")) == {"ema_2": 10.0}
+    assert engine.update(_tick(2, 103.0)) == {"ema_2": 102.0, "max_2": 103.0}
+    assert engine.values("binance", "ETHUSDT") == {"ema_2": 10.0}
+    assert engine.streams() == [("binance", "BTCUSDT"), ("binance", "ETHUSDT")]
+
+    candles = IndicatorEngine({"low_2": lambda: RollingMin(2), "atr_1": lambda: ATR(1)})
+    candles.update(_candle(0, 12.0, 8.0, 10.0))
+    assert candles.update(_candle(1, 11.0, 9.0, 10.5)) == {"low_2": 8.0, "atr_1": 2.0}
+
+
+def test_rejects_empty_windows() -> None:
+    with pytest.raises(ValueError, match="window"):
+        RollingVWAP(0)
+    with pytest.raises(ValueError, match="period"):
+        EMA(0)
+    with pytest.raises(ValueError, match="at least one"):
+        IndicatorEngine({})
@@ -0,0 +1,114 @@
+"""Smoke tests for the symbol-sharded ingestion router."""
+
+from functools import partial
+import json
+import os
+from pathlib import Path
+import queue
+import time
+
+import pytest
+
+from trader_data.ingestion import ShardedIngestRouter, routing_key, shard_for
+from trader_data.models import TickV1
+
+
+def _write_batch(directory: str, shard: int, records: list, rejections: list) -> None:
+    with open(Path(directory) / f"shard-{shard}.ndjson", "a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps({"symbol": record.symbol, "trade_id": record.trade_id}) + "\n")
+        for rejection in rejections:
+            handle.write(json.dumps({"rejected": rejection.index}) + "\n")
+
+
+def _block(*_args: object) -> None:
+    time.sleep(60)
+
+
+def _fail_first_batch(shard: int, records: list, rejections: list) -> None:
+    if records and records[0].trade_id == "0":
+        raise RuntimeError("sink unavailable")
+
+
+def _crash(*_args: object) -> None:
+    os._exit(3)
+
+
+def _tick(symbol: str, index: int, price: float = 100.0) -> dict:
+    return {
+        "schema_version": "1.0",
+        "symbol": symbol,
+        "exchange": "binance",
+        "event_time": f"2026-02-14T12:00:{index % 60:02d}Z",
+        "price": price,
+        "quantity": 1.0,
+        "side": "buy",
+        "trade_id": str(index),
+    }
+
+
+def test_routing_is_stable_and_normalized() -> None:
+    assert routing_key({"exchange": " Binance ", "symbol": "btcusdt"}) == ("binance", "BTCUSDT")
+    assert routing_key({"source": "feed", "symbol": "eth"}) == ("feed", "ETH")
+    assert routing_key({"candle": {"exchange": "kraken", "symbol": "xbt"}}) == ("kraken", "XBT")
+    assert shard_for("binance", "BTCUSDT", 8) == shard_for(*routing_key({"exchange": "BINANCE", "symbol": "btcusdt"}), 8)
+
+
+def test_preserves_per_symbol_order_within_shards(tmp_path: Path) -> None:
+    symbols = [f"SYM{index}" for index in range(12)]
+    with ShardedIngestRouter(partial(_write_batch, str(tmp_path)), shards=3, batch_size=7, model=TickV1) as router:
+        for index in range(600):
+            router.submit(_tick(symbols[index % len(symbols)], index, price=-1.0 if index == 5 else 100.0))
+    stats = router.stats()
+
+    seen: dict[str, list[int]] = {}
+    shards_by_symbol: dict[str, set[str]] = {}
+    rejected = []
+    for path in tmp_path.iterdir():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            row = json.loads(line)
+            if "rejected" in row:
+                rejected.append(row["rejected"])
+                continue
+            seen.setdefault(row["symbol"], []).append(int(row["trade_id"]))
+            shards_by_symbol.setdefault(row["symbol"], set()).add(path.name)
+
+    assert rejected == [5]
+    assert all(ids == sorted(ids) for ids in seen.values())
+    assert all(len(files) == 1 for files in shards_by_symbol.values())
+    assert sum(len(ids) for ids in seen.values()) == 599
+    assert sum(stat.processed for stat in stats) == 600
+    assert sum(stat.rejected for stat in stats) == 1
+    assert all(stat.queued == 0 for stat in stats)
+
+
+def test_full_shard_applies_backpressure() -> None:
+    router = ShardedIngestRouter(_block, shards=1, queue_batches=1, batch_size=1, model=TickV1)
+    try:
+        with pytest.raises(queue.Full):
+            for index in range(10):
+                router.submit(_tick("BTCUSDT", index), timeout=0.2)
+        assert router.stats()[0].queued >= 2
+    finally:
+        router.terminate()
+
+
+def test_handler_errors_are_counted_and_worker_keeps_running() -> None:
+    with ShardedIngestRouter(_fail_first_batch, shards=1, batch_size=2, model=TickV1) as router:
+        for index in range(6):
+            router.submit(_tick("BTCUSDT", index))
+    stats = router.stats()[0]
+
+    assert (stats.processed, stats.handler_errors) == (6, 1)
+
+
+def test_dead_worker_raises_instead_of_hanging() -> None:
+    router = ShardedIngestRouter(_crash, shards=1, queue_batches=1, batch_size=1, model=TickV1)
+    try:
+        with pytest.raises(RuntimeError, match="not running"):
+            for index in range(20):
+                router.submit(_tick("BTCUSDT", index))
+        with pytest.raises(RuntimeError, match="exited abnormally"):
+            router.close()
+    finally:
+        router.terminate()
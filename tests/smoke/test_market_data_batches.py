@@ -0,0 +1,88 @@
+"""Smoke tests for columnar market data batches."""
+
+import pytest
+
+from trader_data.models.market_data import CandleBatchV1, CandleV1, TickBatchV1, TickV1
+
+
+def _tick_payload(index: int) -> dict[str, object]:
+    return {
+        "schema_version": "1.0",
+        "symbol": " btcusdt ",
+        "exchange": "Binance",
+        "event_time": f"2026-02-14T12:00:{index:02d}.250+01:00",
+        "price": 102000.0 + index,
+        "quantity": 1 + index,
+        "side": "SELL" if index % 2 else "buy",
+        "trade_id": f"t-{index:03d}",
+    }
+
+
+def _candle_payload(index: int) -> dict[str, object]:
+    return {
+        "schema_version": "1.0",
+        "symbol": "ethusdt",
+        "exchange": "binance",
+        "interval": "1m",
+        "open": 2750.0,
+        "high": 2760.0 + index,
+        "low": 2740.0,
+        "close": 2755.0,
+        "volume": 0,
+        "event_time": f"2026-02-14T12:{index:02d}:00Z",
+    }
+
+
+def test_tick_batch_matches_row_validation() -> None:
+    payloads = [_tick_payload(index) for index in range(5)]
+    batch = TickBatchV1.from_payloads(iter(payloads))
+
+    assert len(batch) == 5
+    assert batch.price.typecode == "d"
+    assert batch.event_time_ns.typecode == "q"
+    assert batch.to_rows() == [TickV1.from_payload(payload) for payload in payloads]
+
+
+def test_tick_batch_round_trips_through_rows() -> None:
+    rows = [TickV1.from_payload(_tick_payload(index)) for index in range(3)]
+    assert TickBatchV1.from_rows(rows).to_rows() == rows
+
+
+@pytest.mark.parametrize(
+    ("field_name", "field_value", "message"),
+    [
+        ("price", 0.0, "price must be > 0."),
+        ("quantity", float("nan"), "quantity must be finite."),
+        ("price", True, "price must be numeric."),
+        ("side", "hold", "side must be 'buy' or 'sell'."),
+        ("trade_id", "  ", "trade_id must be a non-empty string."),
+    ],
+)
+def test_tick_batch_reports_first_invalid_payload(field_name: str, field_value: object, message: str) -> None:
+    payloads = [_tick_payload(index) for index in range(4)]
+    payloads[2][field_name] = field_value
+
+    with pytest.raises(ValueError, match=message) as exc_info:
+        TickBatchV1.from_payloads(payloads)
+    assert exc_info.value.__notes__ == ["payloads[2]"]
+
+
+def test_candle_batch_matches_row_validation() -> None:
+    payloads = [_candle_payload(index) for index in range(4)]
+    batch = CandleBatchV1.from_payloads(payloads)
+
+    assert batch.to_rows() == [CandleV1.from_payload(payload) for payload in payloads]
+    assert CandleBatchV1.from_rows(batch.to_rows()) == batch
+
+
+def test_candle_batch_enforces_ohlc_containment() -> None:
+    payloads = [_candle_payload(index) for index in range(3)]
+    payloads[1]["close"] = 2800.0
+
+    with pytest.raises(ValueError, match="close must be within"):
+        CandleBatchV1.from_payloads(payloads)
+
+
+def test_empty_batches_are_allowed() -> None:
+    assert len(TickBatchV1.from_payloads([])) == 0
+    assert CandleBatchV1.from_payloads([]).to_rows() == []
@@ -0,0 +1,95 @@
+"""Smoke tests for opt-in model validation metrics."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from trader_data.models import ContextualCandleV1, TickV1, metrics
+
+
+def _tick_payload(**overrides: object) -> dict[str, object]:
+    payload: dict[str, object] = {
+        "schema_version": "1.0",
+        "symbol": "btcusdt",
+        "exchange": "binance",
+        "event_time": "2026-02-14T12:00:00Z",
+        "price": 102000.1,
+        "quantity": 0.2,
+        "side": "buy",
+        "trade_id": "t-001",
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+def enabled_metrics() -> Iterator[None]:
+    metrics.reset()
+    metrics.enable()
+    try:
+        yield
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+def test_disabled_metrics_leave_from_payload_untouched() -> None:
+    original = TickV1.__dict__["from_payload"]
+    metrics.enable()
+    assert TickV1.__dict__["from_payload"] is not original
+    metrics.disable()
+
+    assert TickV1.__dict__["from_payload"] is original
+    assert not metrics.is_enabled()
+
+
+def test_records_calls_rejection_reasons_and_throughput(enabled_metrics: None) -> None:
+    TickV1.from_payload(_tick_payload())
+    TickV1.from_payload(_tick_payload(symbol="ethusdt"))
+    for overrides in ({"price": 0}, {"side": "hold"}, {"price": -5}):
+        with pytest.raises(ValueError):
+            TickV1.from_payload(_tick_payload(**overrides))
+
+    snapshot = metrics.snapshot()
+    tick_metrics = snapshot.models["TickV1"]
+
+    assert tick_metrics.calls == 5
+    assert tick_metrics.rejections == {"price must be > 0.": 2, "side must be 'buy' or 'sell'.": 1}
+    assert sum(tick_metrics.latency_histogram_ns.values()) == 5
+    assert tick_metrics.latency_quantile_ns(0.5) is not None
+    assert snapshot.throughput == {("binance", "BTCUSDT"): 1, ("binance", "ETHUSDT"): 1}
+
+
+def test_rejection_reasons_are_templated_and_counted_once(enabled_metrics: None) -> None:
+    candle = {
+        "schema_version": "1.0",
+        "symbol": "btcusdt",
+        "exchange": "binance",
+        "interval": "1m",
+        "open": 1.0,
+        "high": 1.0,
+        "low": 1.0,
+        "close": 1.0,
+        "volume": 1.0,
+        "event_time": "2026-02-14T12:00:00Z",
+    }
+    for index in range(100):
+        with pytest.raises(ValueError):
+            ContextualCandleV1.from_payload({"schema_version": "1.0", "candle": candle, "custom": {f"key-{index}]x": "n/a"}})
+    with pytest.raises(ValueError):
+        ContextualCandleV1.from_payload({"schema_version": "1.0", "candle": {**candle, "high": 0.5}})
+
+    models = metrics.snapshot().models
+
+    assert models["ContextualCandleV1"].rejections == {"custom[] must be numeric.": 100}
+    assert models["ContextualCandleV1"].calls == 101
+    assert len(models["CandleV1"].rejections) == 1
+
+
+def test_distinct_reasons_beyond_cap_count_as_other(monkeypatch: pytest.MonkeyPatch, enabled_metrics: None) -> None:
+    monkeypatch.setattr(metrics, "MAX_REJECTION_REASONS", 1)
+    for overrides in ({"price": 0}, {"side": "hold"}, {"quantity": 0}):
+        with pytest.raises(ValueError):
+            TickV1.from_payload(_tick_payload(**overrides))
+
+    assert metrics.snapshot().models["TickV1"].rejections == {"price must be > 0.": 1, "other": 2}
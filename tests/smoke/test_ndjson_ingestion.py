@@ -0,0 +1,107 @@
+"""Smoke tests for streaming NDJSON ingestion."""
+
+import gzip
+import io
+import json
+from pathlib import Path
+
+from trader_data.ingestion import ListQuarantineSink, ingest_ndjson, iter_ndjson_lines
+from trader_data.models import CandleV1, MarketSnapshotV1, TickV1
+
+TICK = {
+    "record_type": "tick",
+    "schema_version": "1.0",
+    "symbol": "btcusdt",
+    "exchange": "binance",
+    "event_time": "2026-02-14T12:00:00Z",
+    "price": 102000.1,
+    "quantity": 0.2,
+    "side": "buy",
+    "trade_id": "t-001",
+}
+SNAPSHOT = {
+    "record_type": "market_snapshot",
+    "schema_version": "1.0",
+    "symbol": "btc-usd",
+    "event_time": "2026-02-13T10:00:00Z",
+    "ingest_time": "2026-02-13T10:00:01Z",
+    "price": 100_000.5,
+    "volume": 1.25,
+    "source": "provider-sim",
+}
+
+
+def _ndjson(*records: object) -> bytes:
+    return b"".join(
+        (record if isinstance(record, bytes) else json.dumps(record).encode()) + b"\n" for record in records
+    )
+
+
+def test_dispatches_by_record_type_and_quarantines_failures() -> None:
+    data = _ndjson(TICK, b"{not json", {**TICK, "price": -1}, b"", SNAPSHOT, {**TICK, "record_type": "quote"})
+    sink = ListQuarantineSink()
+
+    records = list(
+        ingest_ndjson(io.BytesIO(data), quarantine=sink, context={"request_id": "req-1"}, chunk_size=16)
+    )
+
+    assert [type(record) for record in records] == [TickV1, MarketSnapshotV1]
+    assert [entry.line_number for entry in sink.records] == [2, 3, 6]
+    assert sink.records[1].reason == "price must be > 0."
+    assert sink.records[0].byte_offset == len(_ndjson(TICK))
+    assert all(entry.context == {"request_id": "req-1"} for entry in sink.records)
+
+
+def test_reads_gzip_files_with_fixed_model(tmp_path: Path) -> None:
+    candle = {
+        "schema_version": "1.0",
+        "symbol": "ethusdt",
+        "exchange": "binance",
+        "interval": "1m",
+        "open": 2750.0,
+        "high": 2760.0,
+        "low": 2740.0,
+        "close": 2755.0,
+        "volume": 50.0,
+        "event_time": "2026-02-14T12:00:00Z",
+    }
+    missing_close = {key: value for key, value in candle.items() if key != "close"}
+    path = tmp_path / "candles.ndjson.gz"
+    path.write_bytes(gzip.compress(_ndjson(candle, missing_close, candle)))
+    sink = ListQuarantineSink()
+
+    records = list(ingest_ndjson(path, model=CandleV1, quarantine=sink))
+
+    assert len(records) == 2
+    assert sink.records[0].reason == "missing required field 'close'."
+
+
+class _UnseekableStream(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        return self._data.readinto(buffer)
+
+
+def test_reads_gzip_from_in_memory_and_unbuffered_streams() -> None:
+    compressed = gzip.compress(_ndjson(TICK, SNAPSHOT))
+    raw = _UnseekableStream(compressed)
+
+    for stream in (io.BytesIO(compressed), raw):
+        sink = ListQuarantineSink()
+        records = list(ingest_ndjson(stream, quarantine=sink))
+        assert [type(record) for record in records] == [TickV1, MarketSnapshotV1]
+        assert sink.records == []
+    assert not raw.closed
+
+
+def test_line_splitter_bounds_oversized_lines() -> None:
+    data = b"short\n" + b"x" * 100 + b"\nlast"
+
+    lines = list(iter_ndjson_lines(io.BytesIO(data), chunk_size=8, max_line_bytes=32))
+
+    assert lines == [(1, 0, b"short"), (2, 6, None), (3, 107, b"last")]
@@ -0,0 +1,73 @@
+"""Smoke tests for packed, batch order book analytics."""
+
+from datetime import datetime, timezone
+import math
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, OrderBookLevelV1, OrderBookSnapshotV1
+from trader_data.orderbook import PackedOrderBooks
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _book(bids: list[tuple[float, float]], asks: list[tuple[float, float]]) -> OrderBookSnapshotV1:
+    return OrderBookSnapshotV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        event_time=T0,
+        bids=[OrderBookLevelV1(price=price, quantity=quantity) for price, quantity in bids],
+        asks=[OrderBookLevelV1(price=price, quantity=quantity) for price, quantity in asks],
+    )
+
+
+BOOKS = [
+    _book([(99.0, 1.0), (98.0, 3.0)], [(101.0, 3.0), (102.0, 1.0)]),
+    _book([(49.0, 2.0)], [(51.0, 2.0), (52.0, 4.0), (53.0, 1.0)]),
+    _book([(10.0, 1.0)], []),
+]
+
+
+def test_packs_levels_into_padded_rows() -> None:
+    packed = PackedOrderBooks.from_snapshots(BOOKS)
+
+    assert (len(packed), packed.depth) == (3, 3)
+    assert list(packed.bid_price) == [99.0, 98.0, 0.0, 49.0, 0.0, 0.0, 10.0, 0.0, 0.0]
+    assert list(packed.column(packed.ask_quantity, 1)) == [1.0, 4.0, 0.0]
+    assert len(PackedOrderBooks.from_snapshots(BOOKS, depth=1).ask_price) == 3
+
+
+def test_top_of_book_metrics() -> None:
+    packed = PackedOrderBooks.from_snapshots(BOOKS)
+
+    assert list(packed.mid()[:2]) == [100.0, 50.0]
+    assert list(packed.spread()[:2]) == [2.0, 2.0]
+    assert list(packed.microprice()[:2]) == [99.5, 50.0]
+    assert all(math.isnan(metric()[2]) for metric in (packed.mid, packed.spread, packed.microprice))
+
+
+def test_depth_imbalance_and_vwap() -> None:
+    packed = PackedOrderBooks.from_snapshots(BOOKS)
+
+    assert list(packed.imbalance()) == [-0.5, 0.0, 1.0]
+    assert list(packed.imbalance(levels=2)) == [0.0, pytest.approx(-4 / 8), 1.0]
+    bid_depth, ask_depth = packed.depth_within_bps(150)
+    assert (list(bid_depth[:2]), list(ask_depth[:2])) == ([1.0, 0.0], [3.0, 0.0])
+    bid_depth, ask_depth = packed.depth_within_bps(250)
+    assert (list(bid_depth[:2]), list(ask_depth[:2])) == ([4.0, 2.0], [4.0, 2.0])
+    assert packed.vwap()[0] == pytest.approx((99 + 98 * 3 + 101 * 3 + 102) / 8)
+    assert packed.vwap(levels=1)[1] == 50.0
+    with pytest.raises(ValueError, match="levels"):
+        packed.imbalance(levels=4)
+
+
+def test_unsorted_levels_are_packed_best_first() -> None:
+    unsorted = [_book([(97.0, 1.0), (98.0, 2.0), (99.0, 4.0)], [(103.0, 1.0), (102.0, 2.0), (101.0, 3.0)])]
+
+    packed = PackedOrderBooks.from_snapshots(unsorted, depth=2)
+
+    assert list(packed.bid_price) == [99.0, 98.0]
+    assert list(packed.ask_price) == [101.0, 102.0]
+    assert list(packed.spread()) == [2.0]
+    assert list(packed.mid()) == [100.0]
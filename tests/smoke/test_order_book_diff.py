@@ -0,0 +1,89 @@
+"""Smoke tests for order book diffs and keyframe + delta storage."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, OrderBookLevelV1, OrderBookSnapshotV1
+from trader_data.orderbook import DeltaBookStore, OrderBook, OrderBookDelta, diff_snapshots
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _snapshot(seconds: float, bids: dict[float, float], asks: dict[float, float]) -> OrderBookSnapshotV1:
+    return OrderBookSnapshotV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=seconds),
+        bids=[OrderBookLevelV1(price, quantity) for price, quantity in sorted(bids.items(), reverse=True)],
+        asks=[OrderBookLevelV1(price, quantity) for price, quantity in sorted(asks.items())],
+    )
+
+
+def _history(count: int) -> list[OrderBookSnapshotV1]:
+    snapshots = []
+    for step in range(count):
+        bids = {100.0 - level: 1.0 + level for level in range(20)}
+        asks = {101.0 + level: 1.0 + level for level in range(20)}
+        bids[100.0] = 1.0 + step
+        if step % 3 == 0:
+            asks.pop(101.0)
+        snapshots.append(_snapshot(step * 0.25, bids, asks))
+    return snapshots
+
+
+def test_diff_emits_only_changed_levels() -> None:
+    old = _snapshot(0, {100.0: 1.0, 99.0: 2.0}, {101.0: 1.0, 102.0: 3.0})
+    new = _snapshot(1, {100.0: 1.5, 99.0: 2.0, 98.0: 4.0}, {102.0: 3.0})
+
+    deltas = diff_snapshots(old, new)
+
+    assert deltas == [
+        OrderBookDelta("bid", 100.0, 1.5),
+        OrderBookDelta("bid", 98.0, 4.0),
+        OrderBookDelta("ask", 101.0, 0.0),
+    ]
+    book = OrderBook.from_snapshot(old)
+    book.apply_deltas(deltas, new.event_time)
+    assert book.to_snapshot() == new
+    assert diff_snapshots(new, new) == []
+
+
+def test_diff_rejects_different_books() -> None:
+    other = OrderBookSnapshotV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION, symbol="ETHUSDT", exchange="binance", event_time=T0, bids=[], asks=[]
+    )
+
+    with pytest.raises(ValueError, match="symbol and exchange"):
+        diff_snapshots(_snapshot(0, {}, {}), other)
+
+
+def test_store_rebuilds_any_timestamp_from_nearest_keyframe() -> None:
+    snapshots = _history(25)
+    store = DeltaBookStore(keyframe_every=10)
+    store.extend(snapshots)
+
+    assert len(store) == 25
+    assert store.keyframes == 3
+    assert list(store.replay()) == snapshots
+    assert store.book_at(T0 - timedelta(seconds=1)) is None
+    assert store.book_at(snapshots[13].event_time) == snapshots[13]
+    assert store.book_at(snapshots[13].event_time + timedelta(milliseconds=100)) == snapshots[13]
+    assert store.book_at(T0 + timedelta(days=1)) == snapshots[-1]
+    assert store.compression_ratio > 5
+
+
+def test_store_rejects_out_of_order_and_foreign_snapshots() -> None:
+    store = DeltaBookStore()
+    store.append(_snapshot(1, {100.0: 1.0}, {}))
+
+    with pytest.raises(ValueError, match="event_time order"):
+        store.append(_snapshot(0, {100.0: 1.0}, {}))
+    foreign = OrderBookSnapshotV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION, symbol="ETHUSDT", exchange="binance", event_time=T0, bids=[], asks=[]
+    )
+    with pytest.raises(ValueError, match="does not match"):
+        store.append(foreign)
+    with pytest.raises(ValueError, match="keyframe_every"):
+        DeltaBookStore(keyframe_every=0)
@@ -0,0 +1,72 @@
+"""Smoke tests for the incremental order book engine."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from trader_data.models import OrderBookLevelV1, OrderBookSnapshotV1
+from trader_data.orderbook import OrderBook, OrderBookDelta
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _snapshot() -> OrderBookSnapshotV1:
+    return OrderBookSnapshotV1.from_payload(
+        {
+            "schema_version": "1.0",
+            "symbol": "BTCUSDT",
+            "exchange": "binance",
+            "event_time": "2026-02-14T12:00:00Z",
+            "bids": [{"price": 99.0, "quantity": 2.0}, {"price": 100.0, "quantity": 1.0}, {"price": 98.0, "quantity": 3.0}],
+            "asks": [{"price": 102.0, "quantity": 4.0}, {"price": 101.0, "quantity": 0.5}],
+        }
+    )
+
+
+def test_seeds_sorted_levels_from_snapshot() -> None:
+    book = OrderBook.from_snapshot(_snapshot())
+
+    assert book.best_bid() == OrderBookLevelV1(100.0, 1.0)
+    assert book.best_ask() == OrderBookLevelV1(101.0, 0.5)
+    assert [level.price for level in book.bids(2)] == [100.0, 99.0]
+    assert [level.price for level in book.asks()] == [101.0, 102.0]
+    assert len(book) == 5
+
+
+def test_applies_deltas_and_removes_zero_quantity_levels() -> None:
+    book = OrderBook.from_snapshot(_snapshot())
+    later = datetime(2026, 2, 14, 12, 0, 1, tzinfo=timezone.utc)
+
+    book.apply_deltas(
+        [
+            OrderBookDelta("bid", 100.0, 0.0),
+            OrderBookDelta("bid", 99.5, 1.5),
+            OrderBookDelta("ask", 101.0, 0.0),
+            OrderBookDelta("ask", 100.5, 2.0),
+            OrderBookDelta("ask", 102.0, 1.0),
+            OrderBookDelta("ask", 150.0, 0.0),
+        ],
+        event_time=later,
+    )
+    snapshot = book.to_snapshot(depth=2)
+
+    assert snapshot.bids == [OrderBookLevelV1(99.5, 1.5), OrderBookLevelV1(99.0, 2.0)]
+    assert snapshot.asks == [OrderBookLevelV1(100.5, 2.0), OrderBookLevelV1(102.0, 1.0)]
+    assert snapshot.event_time == later
+    assert snapshot.symbol == "BTCUSDT"
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [OrderBookDelta("mid", 100.0, 1.0), OrderBookDelta("bid", 0.0, 1.0), OrderBookDelta("ask", 100.0, -1.0)],
+)
+def test_rejects_invalid_deltas(delta: OrderBookDelta) -> None:
+    book = OrderBook.from_snapshot(_snapshot())
+    with pytest.raises(ValueError):
+        book.apply(delta)
+
+
+def test_empty_side_has_no_best_level() -> None:
+    book = OrderBook("BTCUSDT", "binance", T0)
+    assert book.best_bid() is None
+    assert book.bids(5) == []
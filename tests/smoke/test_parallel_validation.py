@@ -0,0 +1,49 @@
+"""Smoke tests for process-pool batch validation."""
+
+import pytest
+
+from trader_data.ingestion import PayloadRejection, validate_payloads
+from trader_data.models import TickV1
+
+
+def _payloads(count: int) -> list[dict[str, object]]:
+    payloads: list[dict[str, object]] = []
+    for index in range(count):
+        payloads.append(
+            {
+                "schema_version": "1.0",
+                "symbol": "btcusdt",
+                "exchange": "binance",
+                "event_time": f"2026-02-14T12:{index // 60:02d}:{index % 60:02d}Z",
+                "price": 100.0 + index if index % 7 else -1.0,
+                "quantity": 1.0,
+                "side": "buy",
+                "trade_id": f"t-{index}",
+            }
+        )
+    del payloads[10]["side"]
+    return payloads
+
+
+def test_parallel_output_matches_serial_output() -> None:
+    payloads = _payloads(200)
+
+    serial = validate_payloads(payloads, model=TickV1)
+    parallel = validate_payloads(payloads, model=TickV1, workers=2, chunk_size=17)
+
+    assert parallel.records == serial.records
+    assert parallel.rejections == serial.rejections
+    assert [record.trade_id for record in serial.records][:3] == ["t-1", "t-2", "t-3"]
+    assert serial.rejections[:3] == [
+        PayloadRejection(0, "price must be > 0."),
+        PayloadRejection(7, "price must be > 0."),
+        PayloadRejection(10, "missing required field 'side'."),
+    ]
+    assert parallel.timings.total_seconds >= parallel.timings.validate_seconds
+
+
+def test_rejects_invalid_pool_settings() -> None:
+    with pytest.raises(ValueError):
+        validate_payloads([], model=TickV1, workers=0)
+    with pytest.raises(ValueError):
+        validate_payloads([], model=TickV1, chunk_size=0)
@@ -0,0 +1,100 @@
+"""Smoke tests for the streaming data-quality engine."""
+
+from datetime import datetime, timedelta, timezone
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, TickV1
+from trader_data.quality import (
+    CHECK_DUPLICATE,
+    CHECK_MONOTONICITY,
+    CHECK_PRICE_OUTLIER,
+    CHECK_VOLUME_OUTLIER,
+    DataQualityEngine,
+    RotatingBloomFilter,
+)
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _tick(index: int, price: float, *, quantity: float = 1.0, symbol: str = "BTCUSDT", trade_id: str = "") -> TickV1:
+    return TickV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=index),
+        price=price,
+        quantity=quantity,
+        side="buy",
+        trade_id=trade_id or f"t-{symbol}-{index}",
+    )
+
+
+def test_flags_out_of_order_events_per_symbol() -> None:
+    engine = DataQualityEngine()
+    assert engine.check(_tick(5, 100.0)) == []
+    assert engine.check(_tick(1, 100.0, symbol="ETHUSDT")) == []
+
+    issues = engine.check(_tick(4, 100.0))
+
+    assert [issue.check for issue in issues] == [CHECK_MONOTONICITY]
+    assert issues[0].severity == "critical"
+
+
+def _candle(minutes: int, interval: str, close: float = 100.0, volume: float = 1.0) -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        interval=interval,
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=volume,
+        event_time=T0 + timedelta(minutes=minutes),
+    )
+
+
+def test_keeps_separate_streams_per_record_type_and_interval() -> None:
+    engine = DataQualityEngine(outlier_warmup=5)
+    for minute in range(60):
+        assert engine.check(_candle(minute, "1m")) == []
+        assert engine.check(_tick(minute * 60, 100.0, quantity=0.01)) == []
+
+    assert engine.check(_candle(0, "1h", close=100.0, volume=60.0)) == []
+    assert engine.check(_candle(1, "1m")) != []
+    assert engine.issue_counts == {CHECK_MONOTONICITY: 1}
+
+
+def test_flags_duplicate_trade_ids() -> None:
+    engine = DataQualityEngine()
+    engine.check(_tick(1, 100.0, trade_id="dup"))
+
+    issues = engine.check(_tick(2, 100.0, trade_id="dup"))
+
+    assert [issue.check for issue in issues] == [CHECK_DUPLICATE]
+    assert engine.issue_counts == {CHECK_DUPLICATE: 1}
+
+
+def test_flags_price_and_volume_outliers_after_warmup() -> None:
+    engine = DataQualityEngine(outlier_warmup=20)
+    for index in range(200):
+        wiggle = 1 + (0.001 if index % 2 else -0.001)
+        assert engine.check(_tick(index, 100.0 * wiggle, quantity=1.0 + (index % 3) * 0.1)) == []
+
+    issues = engine.check(_tick(200, 150.0, quantity=50.0))
+
+    assert {issue.check for issue in issues} == {CHECK_PRICE_OUTLIER, CHECK_VOLUME_OUTLIER}
+
+
+def test_rotating_bloom_filter_has_fixed_size_and_forgets_old_keys() -> None:
+    bloom = RotatingBloomFilter(capacity=100, error_rate=0.01)
+    size = bloom.nbytes
+    assert bloom.add("first") is False
+    assert "first" in bloom
+
+    for index in range(250):
+        bloom.add(f"key-{index}")
+
+    assert bloom.nbytes == size
+    assert "first" not in bloom
+    assert "key-249" in bloom
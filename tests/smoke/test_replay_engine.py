@@ -0,0 +1,119 @@
+"""Smoke tests for the deterministic multi-stream replay engine."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, CandleV1, OrderBookLevelV1, OrderBookSnapshotV1, TickV1
+from trader_data.replay import ReplayEngine
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _tick(seconds: float, trade_id: str, exchange: str = "binance") -> TickV1:
+    return TickV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange=exchange,
+        event_time=T0 + timedelta(seconds=seconds),
+        price=100.0,
+        quantity=1.0,
+        side="buy",
+        trade_id=trade_id,
+    )
+
+
+def _book(seconds: float) -> OrderBookSnapshotV1:
+    return OrderBookSnapshotV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=seconds),
+        bids=[OrderBookLevelV1(price=99.0, quantity=1.0)],
+        asks=[OrderBookLevelV1(price=101.0, quantity=1.0)],
+    )
+
+
+def _candle(seconds: float) -> CandleV1:
+    return CandleV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol="BTCUSDT",
+        exchange="binance",
+        interval="1m",
+        open=100.0,
+        high=100.0,
+        low=100.0,
+        close=100.0,
+        volume=1.0,
+        event_time=T0 + timedelta(seconds=seconds),
+    )
+
+
+def test_merges_sources_in_event_time_order_with_stable_ties() -> None:
+    sources = {
+        "trades-kraken": [_tick(1, "k1", "kraken"), _tick(3, "k3", "kraken")],
+        "books": [_book(0), _book(3)],
+        "trades-binance": [_tick(1, "b1"), _tick(1, "b1b"), _tick(2, "b2")],
+        "candles": [_candle(0)],
+    }
+
+    events = list(ReplayEngine(sources))
+    reordered = list(ReplayEngine(dict(reversed(list(sources.items())))))
+
+    assert [(event.source, event.sequence) for event in events] == [
+        ("books", 0),
+        ("candles", 0),
+        ("trades-binance", 0),
+        ("trades-binance", 1),
+        ("trades-kraken", 0),
+        ("trades-binance", 2),
+        ("books", 1),
+        ("trades-kraken", 1),
+    ]
+    assert events == reordered
+
+
+def test_reads_sources_lazily() -> None:
+    pulled: list[int] = []
+
+    def endless():
+        seconds = 0
+        while True:
+            pulled.append(seconds)
+            yield _tick(seconds, str(seconds))
+            seconds += 1
+
+    events = iter(ReplayEngine({"a": endless(), "b": endless()}))
+    first = [next(events) for _ in range(4)]
+
+    assert [event.record.trade_id for event in first] == ["0", "0", "1", "1"]
+    assert len(pulled) <= 6
+
+
+def test_wall_clock_pacing_scales_event_gaps() -> None:
+    now = [100.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    engine = ReplayEngine(
+        {"a": [_tick(0, "0"), _tick(2, "2"), _tick(3, "3")]},
+        pacing="wall_clock",
+        speed=2.0,
+        clock=lambda: now[0],
+        sleep=sleep,
+    )
+
+    assert len(list(engine)) == 3
+    assert sleeps == [1.0, 0.5]
+
+
+def test_rejects_unsorted_source_and_bad_options() -> None:
+    with pytest.raises(ValueError, match="source 'a' is not sorted"):
+        list(ReplayEngine({"a": [_tick(2, "2"), _tick(1, "1")]}))
+    with pytest.raises(ValueError, match="pacing"):
+        ReplayEngine({}, pacing="slow")
+    with pytest.raises(ValueError, match="speed"):
+        ReplayEngine({}, speed=0)
@@ -0,0 +1,82 @@
+"""Smoke tests for compiled, declarative payload schemas."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from trader_data.models import CandleV1, TickV1
+from trader_data.models.schema import Check, Compute, Field, SchemaSpec, compile_from_payload
+
+
+@dataclass(frozen=True)
+class _Quote:
+    schema_version: str
+    symbol: str
+    price: float
+    venue: str | None = None
+
+    from_payload = compile_from_payload(
+        "_Quote",
+        (
+            SchemaSpec(
+                "1.0",
+                (Field("symbol", "str", normalize="upper"), Field("price", "float"), Check("price <= 0", "bad price.")),
+            ),
+            SchemaSpec(
+                "1.1",
+                (
+                    Field("symbol", "str", normalize="upper"),
+                    Field("price", "float"),
+                    Check("price <= 0", "bad price."),
+                    Field("venue", "str", default="'primary'"),
+                    Compute("_unused", "venue.upper()"),
+                ),
+            ),
+        ),
+    )
+
+
+def test_dispatches_on_schema_version() -> None:
+    assert _Quote.from_payload({"schema_version": "1.0", "symbol": " btc ", "price": 2}) == _Quote("1.0", "BTC", 2.0)
+    assert _Quote.from_payload({"schema_version": "1.1", "symbol": "eth", "price": 3.5}) == _Quote(
+        "1.1", "ETH", 3.5, "primary"
+    )
+    with pytest.raises(ValueError, match="expected one of '1.0', '1.1'"):
+        _Quote.from_payload({"schema_version": "2.0", "symbol": "btc", "price": 1.0})
+
+
+def test_generated_checks_keep_helper_messages() -> None:
+    with pytest.raises(ValueError, match="symbol must be a non-empty string."):
+        _Quote.from_payload({"schema_version": "1.0", "symbol": "   ", "price": 1.0})
+    with pytest.raises(ValueError, match="price must be numeric."):
+        _Quote.from_payload({"schema_version": "1.0", "symbol": "btc", "price": True})
+    with pytest.raises(ValueError, match="price must be finite."):
+        _Quote.from_payload({"schema_version": "1.0", "symbol": "btc", "price": float("inf")})
+    with pytest.raises(KeyError):
+        _Quote.from_payload({"schema_version": "1.0", "symbol": "btc"})
+
+
+def test_canonical_models_use_compiled_validators() -> None:
+    assert "_as_float" in TickV1.from_payload.__func__.__source__
+    with pytest.raises(ValueError, match="high must be >= low."):
+        CandleV1.from_payload(
+            {
+                "schema_version": "1.0",
+                "symbol": "BTCUSDT",
+                "exchange": "binance",
+                "interval": "1m",
+                "open": 100.0,
+                "high": 90.0,
+                "low": 95.0,
+                "close": 100.0,
+                "volume": 1.0,
+                "event_time": "2026-02-14T12:00:00Z",
+            }
+        )
+
+
+def test_rejects_invalid_specs() -> None:
+    with pytest.raises(ValueError, match="unknown field kind"):
+        compile_from_payload("Bad", (SchemaSpec("1.0", (Field("x", "decimal"),)),))
+    with pytest.raises(ValueError, match="duplicate schema_version"):
+        compile_from_payload("Bad", (SchemaSpec("1.0", ()), SchemaSpec("1.0", ())))
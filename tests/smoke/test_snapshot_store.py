@@ -0,0 +1,96 @@
+"""Smoke tests for the concurrent latest-state snapshot store."""
+
+from datetime import datetime, timedelta, timezone
+import threading
+
+from trader_data.models import MarketSnapshotV1
+from trader_data.storage import SnapshotStore
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _snapshot(symbol: str, seconds: float, price: float, source: str = "feed-a", lag_ms: float = 5.0) -> MarketSnapshotV1:
+    event_time = T0 + timedelta(seconds=seconds)
+    return MarketSnapshotV1(
+        schema_version="1.0",
+        symbol=symbol,
+        event_time=event_time,
+        ingest_time=event_time + timedelta(milliseconds=lag_ms),
+        price=price,
+        volume=1.0,
+        source=source,
+    )
+
+
+def test_keeps_latest_per_symbol_and_source() -> None:
+    store = SnapshotStore()
+
+    assert store.update(_snapshot("BTCUSDT", 1, 100.0))
+    assert store.update(_snapshot("BTCUSDT", 2, 101.0, source="feed-b"))
+    assert not store.update(_snapshot("BTCUSDT", 0, 99.0))
+    view = store.sources("BTCUSDT")
+    assert store.update(_snapshot("BTCUSDT", 3, 102.0))
+
+    assert store.get("BTCUSDT").price == 102.0
+    assert store.get("BTCUSDT", "feed-b").price == 101.0
+    assert view["feed-a"].price == 100.0
+    assert (len(store), store.stale_updates, store.version) == (2, 1, 3)
+    assert store.get("ETHUSDT") is None
+
+
+def test_get_many_skips_unknown_symbols() -> None:
+    store = SnapshotStore()
+    store.update_many(_snapshot(f"S{index}", 1, float(index + 1)) for index in range(2_000))
+
+    found = store.get_many([f"S{index}" for index in range(0, 2_000, 2)] + ["MISSING"])
+
+    assert len(found) == 1_000
+    assert found["S10"].price == 11.0
+    assert store.get_many(["S1"], source="feed-b") == {}
+
+
+def test_tracks_lag_distribution_per_source() -> None:
+    store = SnapshotStore()
+    for index in range(99):
+        store.update(_snapshot("BTCUSDT", index, 100.0, lag_ms=1.0))
+    store.update(_snapshot("BTCUSDT", 100, 100.0, lag_ms=2_000.0))
+    store.update(_snapshot("ETHUSDT", 1, 10.0, source="feed-b", lag_ms=0.0))
+
+    stats = store.lag_stats()
+    assert stats["feed-a"].count == 100
+    assert stats["feed-a"].max_ns == 2_000_000_000
+    assert 1_000_000 <= stats["feed-a"].quantile_ns(0.5) < 2_000_000
+    assert stats["feed-a"].quantile_ns(1.0) >= 2_000_000_000
+    assert stats["feed-b"].buckets_ns == {1: 1}
+
+
+def test_concurrent_writers_and_readers() -> None:
+    store = SnapshotStore(lock_stripes=4)
+    symbols = [f"S{index}" for index in range(50)]
+    errors: list[Exception] = []
+
+    def write(offset: int) -> None:
+        for step in range(200):
+            for symbol in symbols[offset::4]:
+                store.update(_snapshot(symbol, step, float(step + 1)))
+
+    def read() -> None:
+        try:
+            for _ in range(200):
+                for snapshot in store.get_many(symbols).values():
+                    assert snapshot.price > 0
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(offset,)) for offset in range(4)]
+    threads += [threading.Thread(target=read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert all(snapshot.price == 200.0 for snapshot in store.get_many(symbols).values())
+    assert store.version == 50 * 200
+    assert store.stale_updates == 0
+    assert store.lag_stats()["feed-a"].count == 50 * 200
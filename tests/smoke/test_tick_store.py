@@ -0,0 +1,82 @@
+"""Smoke tests for the memory-mapped tick store."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from trader_data.models import MARKET_DATA_SCHEMA_VERSION, TickV1
+from trader_data.storage import TickStore
+
+T0 = datetime(2026, 2, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def _tick(index: int, symbol: str = "BTCUSDT") -> TickV1:
+    return TickV1(
+        schema_version=MARKET_DATA_SCHEMA_VERSION,
+        symbol=symbol,
+        exchange="binance",
+        event_time=T0 + timedelta(seconds=index),
+        price=100.0 + index,
+        quantity=0.5,
+        side="buy" if index % 2 else "sell",
+        trade_id=f"t-{index}",
+    )
+
+
+def test_read_range_spans_segments_with_zero_copy_views(tmp_path: Path) -> None:
+    store = TickStore(tmp_path, "binance", segment_rows=4)
+    ticks = [_tick(index) for index in range(10)]
+    store.append(ticks[:3])
+    store.append(ticks[3:] + [_tick(0, "ETHUSDT")])
+
+    views = store.read_range("BTCUSDT", T0 + timedelta(seconds=2), T0 + timedelta(seconds=9))
+
+    assert [len(view) for view in views] == [2, 4, 1]
+    assert all(view.price.obj is view.event_time_ns.obj for view in views)
+    assert views[1].price.tolist() == [104.0, 105.0, 106.0, 107.0]
+    assert [tick for view in views for tick in view.to_rows()] == ticks[2:9]
+    assert store.symbols() == ["BTCUSDT", "ETHUSDT"]
+    del views
+    store.close()
+
+
+def test_reopened_store_sees_persisted_ticks(tmp_path: Path) -> None:
+    writer = TickStore(tmp_path, "binance", segment_rows=8)
+    writer.append(_tick(index) for index in range(5))
+
+    reader = TickStore(tmp_path, "binance")
+    views = reader.read_range("BTCUSDT", T0, T0 + timedelta(hours=1))
+
+    assert [tick.trade_id for view in views for tick in view.to_rows()] == [f"t-{index}" for index in range(5)]
+    assert reader.read_range("BTCUSDT", T0 - timedelta(hours=1), T0) == []
+    writer.append([_tick(5)])
+    views = reader.read_range("BTCUSDT", T0, T0 + timedelta(hours=1))
+    assert sum(len(view) for view in views) == 6
+
+
+def test_rejects_out_of_order_and_foreign_ticks(tmp_path: Path) -> None:
+    store = TickStore(tmp_path, "binance")
+    store.append([_tick(5)])
+
+    with pytest.raises(ValueError):
+        store.append([_tick(4)])
+    with pytest.raises(ValueError):
+        store.append([TickV1(**{**_tick(6).__dict__, "exchange": "kraken"})])
+
+
+def test_symbols_with_path_characters_stay_inside_the_store(tmp_path: Path) -> None:
+    root = tmp_path / "store"
+    store = TickStore(root, "binance")
+    symbols = ["BTC/USDT", "../../evil", "..", "50%OFF"]
+    store.append([_tick(0, symbol) for symbol in symbols])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["store"]
+    assert [path.parent.parent for path in root.rglob("*.ticks")] == [root / "binance"] * len(symbols)
+    assert store.symbols() == sorted(symbols)
+    for symbol in symbols:
+        [view] = TickStore(root, "binance").read_range(symbol, T0, T0 + timedelta(seconds=1))
+        assert view.row(0).symbol == symbol
+    del view
+    store.close()
+    assert TickStore(root, "../kraken").root.parent == root
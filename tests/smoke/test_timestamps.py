@@ -0,0 +1,57 @@
+"""Smoke tests for the shared timestamp parser."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from trader_data.models.timestamps import from_epoch_ns, parse_epoch_ns, parse_timestamp, to_epoch_ns
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2026-02-14T12:00:00Z",
+        "2026-02-14T12:00:00.250Z",
+        "2026-02-14T12:00:00.123456789Z",
+        "2026-02-14T23:30:00-05:00",
+        "2026-02-14T12:00:00+00:00",
+    ],
+)
+def test_fast_and_fallback_paths_agree_with_fromisoformat(value: str) -> None:
+    expected = datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+    parsed = parse_timestamp(value, "event_time")
+
+    assert parsed == expected
+    assert parsed.tzinfo == timezone.utc
+    assert parse_epoch_ns(value, "event_time") == to_epoch_ns(expected)
+
+
+def test_epoch_ns_uses_the_utc_date_after_offset_conversion() -> None:
+    parse_epoch_ns("2026-02-14T12:00:00Z", "event_time")
+
+    late_local = parse_epoch_ns("2026-02-14T23:30:00-05:00", "event_time")
+
+    assert from_epoch_ns(late_local) == datetime(2026, 2, 15, 4, 30, tzinfo=timezone.utc)
+
+
+def test_epoch_ns_orders_like_datetimes() -> None:
+    values = ["2026-02-14T12:00:01Z", "2026-02-14T12:00:00.999Z", "2026-02-13T23:59:59Z"]
+    assert sorted(values, key=lambda value: parse_epoch_ns(value, "event_time")) == sorted(
+        values, key=lambda value: parse_timestamp(value, "event_time")
+    )
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        (1700000000, "event_time must be an ISO-8601 timestamp string."),
+        ("2026-02-30T00:00:00Z", "event_time must be a valid ISO-8601 timestamp."),
+        ("2026-02-14T12:00:00", "event_time must include timezone information."),
+    ],
+)
+def test_invalid_timestamps_keep_error_messages(value: object, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_timestamp(value, "event_time")
+    with pytest.raises(ValueError, match=message):
+        parse_epoch_ns(value, "event_time")
@@ -0,0 +1,108 @@
+"""Smoke tests for trusted-source construction and lazy record views."""
+
+import copy
+from datetime import datetime, timezone
+import pickle
+
+import pytest
+
+from trader_data.models import (
+    CandleV1,
+    ContextualCandleV1,
+    MarketSnapshotV1,
+    OrderBookLevelV1,
+    OrderBookSnapshotV1,
+    TickV1,
+)
+from trader_data.models.lazy import LazyRecord, lazy_records
+
+TICK = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "exchange": "binance",
+    "event_time": "2026-02-14T12:00:00.250Z",
+    "price": 50000.5,
+    "quantity": 0.25,
+    "side": "buy",
+    "trade_id": "t-1",
+}
+CANDLE = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "exchange": "binance",
+    "interval": "1m",
+    "open": 100.0,
+    "high": 110.0,
+    "low": 95.0,
+    "close": 105.0,
+    "volume": 12.0,
+    "event_time": "2026-02-14T12:00:00Z",
+}
+BOOK = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "exchange": "binance",
+    "event_time": "2026-02-14T12:00:00Z",
+    "bids": [{"price": 99.5, "quantity": 1.0}],
+    "asks": [{"price": 100.5, "quantity": 2.0}],
+}
+SNAPSHOT = {
+    "schema_version": "1.0",
+    "symbol": "BTCUSDT",
+    "event_time": "2026-02-14T12:00:00Z",
+    "ingest_time": "2026-02-14T12:00:01+00:00",
+    "price": 100.0,
+    "volume": 3.0,
+    "source": "provider-sim",
+}
+
+
+@pytest.mark.parametrize(
+    ("model", "payload"),
+    [
+        (TickV1, TICK),
+        (CandleV1, CANDLE),
+        (OrderBookSnapshotV1, BOOK),
+        (MarketSnapshotV1, SNAPSHOT),
+        (ContextualCandleV1, {"schema_version": "1.0", "candle": CANDLE, "sentiment": 0.3, "regime": "trend"}),
+    ],
+)
+def test_trusted_payload_matches_validated_construction(model, payload) -> None:
+    assert model.from_trusted_payload(payload) == model.from_payload(payload)
+
+
+def test_lazy_record_parses_fields_on_first_access() -> None:
+    record = LazyRecord(TickV1, TICK)
+
+    assert repr(record) == "LazyRecord(TickV1, parsed=[])"
+    assert record.event_time == datetime(2026, 2, 14, 12, 0, 0, 250_000, tzinfo=timezone.utc)
+    assert record.price == 50000.5
+    assert repr(record) == "LazyRecord(TickV1, parsed=['event_time', 'price'])"
+    assert record.materialize() == TickV1.from_payload(TICK)
+    with pytest.raises(AttributeError):
+        record.price = 1.0
+    with pytest.raises(AttributeError):
+        record.not_a_field
+
+
+def test_lazy_record_nested_and_default_fields() -> None:
+    book = next(lazy_records(OrderBookSnapshotV1, [BOOK]))
+    assert book.asks == [OrderBookLevelV1(price=100.5, quantity=2.0)]
+
+    contextual = LazyRecord(ContextualCandleV1, {"schema_version": "1.0", "candle": CANDLE})
+    assert contextual.candle.close == 105.0
+    assert (contextual.sentiment, contextual.regime, contextual.news) == (0.0, None, [])
+    with pytest.raises(KeyError):
+        LazyRecord(TickV1, {}).price
+
+
+def test_lazy_record_copies_and_pickles() -> None:
+    record = LazyRecord(TickV1, TICK)
+    assert record.price == 50000.5
+
+    for clone in (copy.copy(record), copy.deepcopy(record), pickle.loads(pickle.dumps(record))):
+        assert clone.model is TickV1
+        assert repr(clone) == "LazyRecord(TickV1, parsed=[])"
+        assert clone.materialize() == record.materialize()
+    with pytest.raises(AttributeError):
+        LazyRecord.__new__(LazyRecord)._payload
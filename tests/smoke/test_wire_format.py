@@ -0,0 +1,87 @@
+"""Smoke tests for the compact binary wire format."""
+
+import json
+
+import pytest
+
+from trader_data.models import CandleV1, MarketSnapshotV1, OrderBookSnapshotV1, TickV1
+from trader_data.models.wire import WireStringTable, iter_frames
+
+TICK_PAYLOAD = {
+    "schema_version": "1.0",
+    "symbol": "btcusdt",
+    "exchange": "binance",
+    "event_time": "2026-02-14T12:00:00.125Z",
+    "price": 102000.1,
+    "quantity": 0.2,
+    "side": "sell",
+    "trade_id": "t-001",
+}
+
+
+def _records() -> list[object]:
+    return [
+        TickV1.from_payload(TICK_PAYLOAD),
+        CandleV1.from_payload(
+            {
+                "schema_version": "1.0",
+                "symbol": "ethusdt",
+                "exchange": "binance",
+                "interval": "1m",
+                "open": 2750.0,
+                "high": 2760.0,
+                "low": 2740.0,
+                "close": 2755.0,
+                "volume": 50.0,
+                "event_time": "2026-02-14T12:00:00Z",
+            }
+        ),
+        OrderBookSnapshotV1.from_payload(
+            {
+                "schema_version": "1.0",
+                "symbol": "BTCUSDT",
+                "exchange": "binance",
+                "event_time": "2026-02-14T12:00:00Z",
+                "bids": [{"price": 64000.0, "quantity": 1.5}, {"price": 63999.5, "quantity": 2.0}],
+                "asks": [{"price": 64000.5, "quantity": 0.25}],
+            }
+        ),
+        MarketSnapshotV1.from_payload(
+            {
+                "schema_version": "1.0",
+                "symbol": "btc-usd",
+                "event_time": "2026-02-13T10:00:00Z",
+                "ingest_time": "2026-02-13T10:00:01Z",
+                "price": 100_000.5,
+                "volume": 1.25,
+                "source": "provider-sim",
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize("table", [None, WireStringTable(["BTCUSDT", "ETHUSDT", "binance", "1m", "provider-sim"])])
+def test_round_trips_every_model(table: WireStringTable | None) -> None:
+    for record in _records():
+        encoded = record.to_bytes(table)
+        assert type(record).from_bytes(memoryview(encoded), table) == record
+
+
+def test_frames_are_smaller_than_json_and_stream_decodable() -> None:
+    table = WireStringTable(["BTCUSDT", "binance"])
+    tick = TickV1.from_payload(TICK_PAYLOAD)
+
+    assert len(tick.to_bytes(table)) * 4 < len(json.dumps(TICK_PAYLOAD))
+    buffer = b"".join(record.to_bytes(table) for record in _records())
+    assert list(iter_frames(buffer, table)) == _records()
+
+
+def test_rejects_mismatched_or_truncated_frames() -> None:
+    tick_frame = TickV1.from_payload(TICK_PAYLOAD).to_bytes()
+
+    with pytest.raises(ValueError):
+        CandleV1.from_bytes(tick_frame)
+    with pytest.raises(ValueError):
+        TickV1.from_bytes(tick_frame[:-3])
+    with pytest.raises(ValueError):
+        TickV1.from_bytes(TickV1.from_payload(TICK_PAYLOAD).to_bytes(WireStringTable(["BTCUSDT"])))